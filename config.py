@@ -136,6 +136,15 @@ OBJECTIVE_MARKER_COLOR = (255, 200, 0) # Gold
 # Grid visibility (default: hidden/disabled)
 SHOW_GRID = False
 
+# Enemy path compression: ground enemies cut straight across open ground between
+# corners (line of sight over walkable cells) instead of visiting every cell centre.
+# Collinear runs are always merged; this only toggles the corner-cutting.
+COMPRESS_ENEMY_PATHS = True
+
+# Deferred-impact homing shots: plain single-target projectiles work out their hit time
+# when fired and are resolved from a timing wheel instead of being steered every frame.
+DEFERRED_IMPACT_PROJECTILES = True
+
 # Path settings
 ASSETS_DIR = "assets"
 IMAGES_DIR = os.path.join(ASSETS_DIR, "images")
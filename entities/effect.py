@@ -622,6 +622,8 @@ class RisingFadeEffect:
 
 class GroundEffectZone:
     """A persistent circular area on the ground that applies effects to enemies within it."""
+    needs_enemies = True # EffectPipeline passes enemies (and the spatial index) to update()
+
     def __init__(self, x, y, radius_units, duration, dot_damage, dot_interval, damage_type, valid_targets):
         self.x = x # Center pixel X
         self.y = y # Center pixel Y
@@ -643,8 +645,10 @@ class GroundEffectZone:
         #print(f"  - damage: {dot_damage} {damage_type} every {dot_interval}s")
         #print(f"  - valid targets: {valid_targets}")
 
-    def update(self, time_delta, enemies):
-        """Update zone duration and apply DoT to enemies inside."""
+    def update(self, time_delta, enemies, enemy_index=None):
+        """Update zone duration and apply DoT to enemies inside.
+           If an enemy_index (EnemySpatialHash) is given, only enemies near the zone are checked.
+        """
         self.life_remaining -= time_delta
         if self.life_remaining <= 0:
             #print("[DEBUG] GroundEffectZone expired")
@@ -662,7 +666,8 @@ class GroundEffectZone:
 
         if apply_dot_this_frame and damage_to_apply > 0:
             enemies_hit = 0
-            for enemy in enemies:
+            nearby_enemies = enemy_index.query_circle(self.x, self.y, self.radius_pixels) if enemy_index is not None else enemies
+            for enemy in nearby_enemies:
                 # Check if enemy is a valid target type, alive, and within radius
                 if enemy.type in self.valid_targets and enemy.health > 0:
                     dist_sq = (enemy.x - self.x)**2 + (enemy.y - self.y)**2
@@ -0,0 +1,132 @@
+"""
+Enemy aura special-effect hooks: what a pulsed or continuous aura
+(aura_apply) or a walkover tower (on_walkover) does to one enemy it reaches.
+
+GameScene handles the timing, range and target checks and then calls the
+tower's handler per enemy. Parameters come from the compiled SpecialSpec
+(`special.params`), so nothing is looked up by string here.
+"""
+import math
+
+from utils.effect_registry import register
+from utils.tower_specs import SpecialEffect
+
+# --- Pulsed auras (fired on the tower's pulse timer) ---
+
+@register('aura_apply', SpecialEffect.SLOW_PULSE_AURA)
+def aura_slow_pulse(tower, special, enemy, dist_sq, context):
+    params = special.params
+    multiplier = 1.0 - (params.slow_percentage / 100.0)
+    enemy.apply_status_effect('slow', params.duration, multiplier, context.current_time)
+
+
+@register('aura_apply', SpecialEffect.DAMAGE_PULSE_AURA)
+def aura_damage_pulse(tower, special, enemy, dist_sq, context):
+    params = special.params
+    enemy.take_damage(params.pulse_damage, params.pulse_damage_type)
+
+
+@register('aura_apply', SpecialEffect.STUN_PULSE_AURA)
+def aura_stun_pulse(tower, special, enemy, dist_sq, context):
+    enemy.apply_status_effect('stun', special.params.duration, None, context.current_time)
+
+
+@register('aura_apply', SpecialEffect.BONECHILL_PULSE_AURA)
+def aura_bonechill_pulse(tower, special, enemy, dist_sq, context):
+    duration = special.params.bonechill_duration # From JSON, default 3s
+    enemy.apply_status_effect('bonechill', duration, None, context.current_time)
+    #print(f"$$$ BONECHILL APPLIED by {tower.tower_id} to {enemy.enemy_id} for {duration}s at {context.current_time:.2f}s")
+
+
+@register('aura_apply', SpecialEffect.DOT_PULSE_AURA)
+def aura_dot_pulse(tower, special, enemy, dist_sq, context):
+    params = special.params
+    current_time = context.current_time
+    # Get amplification from nearby Plague Reactors
+    amp_multiplier = tower.get_dot_amplification_multiplier(context.tower_buff_auras)
+    amplified_dot_damage = params.dot_damage * amp_multiplier
+
+    # Apply the DoT to the enemy
+    enemy.apply_dot_effect(params.dot_effect_name, amplified_dot_damage, params.dot_interval,
+                           params.dot_duration, params.dot_damage_type, current_time)
+
+    # --- CHECK FOR SLOW EFFECT IN DOT PULSE ---
+    if params.slow_percentage > 0:
+        slow_multiplier = 1.0 - (params.slow_percentage / 100.0)
+        enemy.apply_status_effect('slow', params.duration, slow_multiplier, current_time)
+    # --- END SLOW EFFECT CHECK ---
+
+
+# --- Continuous auras (every frame; slows are returned so only the strongest applies) ---
+
+@register('aura_apply', SpecialEffect.DAMAGE_AURA, SpecialEffect.RADIANCE_AURA)
+def aura_damage_over_time(tower, special, enemy, dist_sq, context):
+    # Sun King's Radiance deals fire by default, damage_aura the tower's damage type
+    params = special.params
+    if params.dot_interval > 0:
+        damage_per_sec = params.dot_damage / params.dot_interval
+        damage_this_frame = damage_per_sec * context.time_delta
+        enemy.take_damage(damage_this_frame, params.dot_damage_type)
+    return None
+
+
+@register('aura_apply', SpecialEffect.SLOW_AURA)
+def aura_slow(tower, special, enemy, dist_sq, context):
+    return 1.0 - (special.params.slow_percentage / 100.0)
+
+
+@register('aura_apply', SpecialEffect.STORM_AURA)
+def aura_storm(tower, special, enemy, dist_sq, context):
+    params = special.params
+    # Apply Damage Component (arcane by default)
+    if params.dot_interval > 0:
+        damage_per_sec = params.dot_damage / params.dot_interval
+        damage_this_frame = damage_per_sec * context.time_delta
+        enemy.take_damage(damage_this_frame, params.dot_damage_type)
+    # Apply Slow Component
+    if params.slow_percentage > 0:
+        return 1.0 - (params.slow_percentage / 100.0)
+    return None
+
+
+@register('aura_apply', SpecialEffect.VORTEX_DAMAGE_AURA)
+def aura_vortex_damage(tower, special, enemy, dist_sq, context):
+    params = special.params
+    current_time = context.current_time
+    # Check interval using the tower's last_aura_tick_time
+    if current_time >= tower.last_aura_tick_time + params.tick_interval:
+        # Update tick time ONCE per tower, after interval check
+        tower.last_aura_tick_time = current_time
+        # Radius in pixels was converted when the spec was compiled
+        aura_radius_pixels = special.aura_radius_pixels
+
+        if aura_radius_pixels > 0: # Avoid division by zero if radius is 0
+            # Calculate normalized distance (0 at center, 1 at edge)
+            normalized_distance = math.sqrt(dist_sq) / aura_radius_pixels
+            normalized_distance = max(0.0, min(1.0, normalized_distance)) # Clamp between 0 and 1
+
+            # Calculate damage scale factor (1 at center, 0 at edge)
+            damage_scale_factor = 1.0 - normalized_distance
+
+            # Calculate damage for this tick
+            min_dmg = params.min_damage_at_edge
+            damage_range = params.max_damage_at_center - min_dmg
+            damage_this_tick = min_dmg + (damage_range * damage_scale_factor)
+
+            if damage_this_tick > 0:
+                # print(f"DEBUG Vortex: Dist={math.sqrt(dist_sq):.1f}/{aura_radius_pixels:.1f}, NormDist={normalized_distance:.2f}, Scale={damage_scale_factor:.2f}, Dmg={damage_this_tick:.2f}") # Debug
+                enemy.take_damage(damage_this_tick, params.damage_type)
+    return None
+
+
+# --- Walkover towers (enemy standing on the tower's tile) ---
+
+@register('on_walkover', SpecialEffect.BURN, SpecialEffect.GROUND_SPIKE_DOT)
+def walkover_dot(tower, special, enemy, context):
+    params = special.params # dot_damage_type defaults to the tower's damage type
+    # Get amplification
+    amp_multiplier = tower.get_dot_amplification_multiplier(context.tower_buff_auras)
+    amplified_dot_damage = params.dot_damage * amp_multiplier
+    # Apply the burn / spike DoT, named after the effect
+    enemy.apply_dot_effect(special.effect_name, amplified_dot_damage, params.dot_interval, params.dot_duration, params.dot_damage_type, context.current_time)
+    #print(f"Enemy {enemy.enemy_id} walked over {tower.tower_id}, applied {special.effect_name}.")
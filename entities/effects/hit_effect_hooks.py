@@ -0,0 +1,89 @@
+"""
+Projectile special-effect hooks: what a tower's projectiles do to the
+enemies they hit (on_hit) and kill (on_kill).
+
+A projectile takes these handlers from its source tower, so a hit costs one
+call for the tower's effect and nothing for towers without one.
+Parameters come from the source tower's compiled `special_spec.hook_params`.
+"""
+import random
+
+from utils.effect_registry import register
+from utils.tower_specs import SpecialEffect
+
+# --- on_hit: enemy hit and still alive (primary target or pierced) ---
+
+@register('on_hit', SpecialEffect.SHATTER)
+def hit_shatter(tower, enemy, current_time):
+    params = tower.special_spec.hook_params
+    chance = params.chance_percent
+    if random.random() * 100 < chance:
+        # Apply a significant temporary armor reduction
+        reduction = params.armor_reduction
+        duration = params.duration
+        if hasattr(enemy, 'apply_timed_armor_reduction'):
+            enemy.apply_timed_armor_reduction(reduction, duration, current_time)
+            #print(f"!!! {tower.tower_id} Shattered {enemy.enemy_id}'s armor by {reduction} for {duration}s! (Chance: {chance}%)")
+            return "shatter" # Return effect name
+    return None
+
+
+@register('on_hit', SpecialEffect.MAX_HP_REDUCTION_ON_HIT)
+def hit_max_hp_reduction(tower, enemy, current_time):
+    params = tower.special_spec.hook_params
+    percentage = params.reduction_percentage
+    if percentage > 0 and hasattr(enemy, 'reduce_max_hp_percentage'):
+        enemy.reduce_max_hp_percentage(percentage)
+        #print(f"... applied max HP reduction ({percentage}%) to {enemy.enemy_id}")
+        return "max_hp_reduction" # Return effect name
+    return None
+
+
+@register('on_hit', SpecialEffect.SLOW)
+def hit_slow(tower, enemy, current_time):
+    params = tower.special_spec.hook_params
+    slow_percentage = params.slow_percentage
+    if slow_percentage > 0:
+        # Calculate slow multiplier (e.g., 50% slow means 0.5x speed)
+        slow_multiplier = 1.0 - (slow_percentage / 100.0)
+        # Use the duration from the tower's special effect
+        slow_duration = params.duration
+        enemy.apply_status_effect('slow', slow_duration, slow_multiplier, current_time)
+        #print(f"DEBUG: Projectile slow effect applied - {slow_percentage}% slow (multiplier: {slow_multiplier}) to {enemy.enemy_id}")
+    return None
+
+
+@register('on_hit', SpecialEffect.BASH_CHANCE)
+def hit_bash_chance(tower, enemy, current_time):
+    params = tower.special_spec.hook_params
+    chance = params.chance_percent
+    if random.random() * 100 < chance:
+        stun_duration = params.stun_duration
+        if stun_duration > 0:
+            enemy.apply_status_effect('stun', stun_duration, True, current_time)
+            #print(f"Projectile from {tower.tower_id} BASHED {enemy.enemy_id} for {stun_duration}s (Chance: {chance}%)")
+    return None
+
+
+@register('on_hit', SpecialEffect.ARMOR_REDUCTION_ON_HIT)
+def hit_armor_reduction(tower, enemy, current_time):
+    params = tower.special_spec.hook_params
+    amount = params.armor_reduction_amount
+    # Check if the enemy has the method before calling
+    if hasattr(enemy, 'reduce_armor'):
+        enemy.reduce_armor(amount)
+        #print(f"... applied armor reduction ({amount}) to {enemy.enemy_id}")
+    return None
+
+
+# --- on_kill: enemy killed by the projectile ---
+
+@register('on_kill', SpecialEffect.GOLD_ON_KILL)
+def kill_gold_on_kill(tower, enemy):
+    params = tower.special_spec.hook_params
+    chance = params.chance_percent
+    amount = params.gold_amount
+    if amount > 0 and random.random() * 100 < chance:
+        #print(f"$$$ Gold on Kill triggered for {tower.tower_id}! Adding {amount} gold.")
+        return amount
+    return 0
@@ -0,0 +1,676 @@
+"""
+Per-tower special-effect hooks: the effect logic Tower.update used to run
+through its chain of effect checks every frame (on_tick), and the bonus
+strikes that follow a standard attack (on_attack).
+
+Each handler reads its parameters from the compiled SpecialSpec
+(`special_spec.hook_params`), with the defaults the old inline code used.
+"""
+import math
+import random
+
+from entities.projectile import Projectile
+from entities.effect import Effect
+from entities.double_strike_effect import DoubleStrikeEffect
+from entities.every_nth_strike_effect import EveryNthStrikeEffect
+from utils.effect_registry import register
+from utils.tower_specs import SpecialEffect
+
+# --- on_tick: called once per frame from Tower.update ---
+
+# --- Frost Pulse Aura Effect ---
+@register('on_tick', SpecialEffect.SLOW_PULSE_AURA)
+def tick_slow_pulse_aura(tower, current_time, all_enemies, all_towers):
+    params = tower.special_spec.hook_params
+    # Check if it's time for a new pulse
+    if current_time - tower.last_pulse_time >= params.interval:
+        tower.last_pulse_time = current_time
+        pulse_duration = params.duration
+        slow_percentage = params.slow_percentage
+        slow_multiplier = 1.0 - (slow_percentage / 100.0)
+        targets = params.targets
+
+        # Find enemies in range
+        for enemy in all_enemies:
+            if enemy.health > 0 and enemy.type in targets:
+                # Calculate distance to enemy
+                dx = enemy.x - tower.x
+                dy = enemy.y - tower.y
+                dist_sq = dx*dx + dy*dy
+                if dist_sq <= tower.aura_radius_pixels * tower.aura_radius_pixels:
+                    # Apply slow effect
+                    enemy.apply_status_effect('slow', pulse_duration, slow_multiplier, current_time)
+                    #print(f"Frost Pulse from {tower.tower_id} slowed {enemy.enemy_id} by {slow_percentage}% for {pulse_duration}s")
+
+
+# --- Miasma Pillar DOT Pulse Effect ---
+@register('on_tick', SpecialEffect.DOT_PULSE_AURA)
+def tick_dot_pulse_aura(tower, current_time, all_enemies, all_towers):
+    params = tower.special_spec.hook_params
+    # Check if it's time for a new pulse
+    if current_time - tower.last_pulse_time >= params.pulse_interval:
+        tower.last_pulse_time = current_time
+        pulse_duration = params.pulse_duration
+        slow_percentage = params.slow_percentage
+        slow_multiplier = 1.0 - slow_percentage
+        damage = params.damage
+        damage_type = params.damage_type
+        targets = params.targets
+
+        # Find enemies in range
+        for enemy in all_enemies:
+            if enemy.health > 0 and enemy.type in targets:
+                # Calculate distance to enemy
+                dx = enemy.x - tower.x
+                dy = enemy.y - tower.y
+                dist_sq = dx*dx + dy*dy
+                if dist_sq <= tower.aura_radius_pixels * tower.aura_radius_pixels:
+                    # Apply DOT effect
+                    enemy.apply_dot_effect(
+                        "miasma_pillar",
+                        damage,
+                        params.pulse_interval,
+                        pulse_duration,
+                        damage_type,
+                        current_time
+                    )
+                    # Apply slow effect
+                    enemy.apply_status_effect('slow', pulse_duration, slow_multiplier, current_time)
+                    #print(f"Miasma Pillar from {tower.tower_id} applied DOT and slow to {enemy.enemy_id}")
+
+
+# --- Vortex Damage Aura Effect ---
+@register('on_tick', SpecialEffect.VORTEX_DAMAGE_AURA)
+def tick_vortex_damage_aura(tower, current_time, all_enemies, all_towers):
+    params = tower.special_spec.hook_params
+    # Check if it's time for a new tick
+    if current_time - tower.last_aura_tick_time >= params.tick_interval:
+        tower.last_aura_tick_time = current_time
+        min_damage = params.min_damage_at_edge
+        max_damage = params.max_damage_at_center
+        damage_type = params.damage_type
+        targets = params.targets
+
+        # Find enemies in range
+        for enemy in all_enemies:
+            if enemy.health > 0 and enemy.type in targets:
+                # Calculate distance to enemy
+                dx = enemy.x - tower.x
+                dy = enemy.y - tower.y
+                dist_sq = dx*dx + dy*dy
+                if dist_sq <= tower.aura_radius_pixels * tower.aura_radius_pixels:
+                    # Calculate damage based on distance (more damage closer to center)
+                    distance = math.sqrt(dist_sq)
+                    distance_ratio = 1.0 - (distance / tower.aura_radius_pixels)
+                    damage = min_damage + (max_damage - min_damage) * distance_ratio
+
+                    # Apply damage
+                    enemy.take_damage(damage, damage_type)
+                    #print(f"Vortex from {tower.tower_id} dealt {damage:.1f} {damage_type} damage to {enemy.enemy_id}")
+
+
+# --- Glacial Heart Bonechill Pulse Effect ---
+@register('on_tick', SpecialEffect.BONECHILL_PULSE_AURA)
+def tick_bonechill_pulse_aura(tower, current_time, all_enemies, all_towers):
+    params = tower.special_spec.hook_params
+    # Check if it's time for a new pulse
+    if current_time - tower.last_pulse_time >= params.interval:
+        tower.last_pulse_time = current_time
+        bonechill_duration = params.bonechill_duration
+        targets = params.targets
+
+        # Find enemies in range
+        for enemy in all_enemies:
+            if enemy.health > 0 and enemy.type in targets:
+                # Calculate distance to enemy
+                dx = enemy.x - tower.x
+                dy = enemy.y - tower.y
+                dist_sq = dx*dx + dy*dy
+                if dist_sq <= tower.aura_radius_pixels * tower.aura_radius_pixels:
+                    # Apply bonechill effect
+                    enemy.apply_status_effect('bonechill', bonechill_duration, 1.0, current_time)
+                    #print(f"Glacial Heart from {tower.tower_id} applied bonechill to {enemy.enemy_id} for {bonechill_duration}s")
+
+
+# --- Black Hole Generator Damage Pulse Effect ---
+@register('on_tick', SpecialEffect.DAMAGE_PULSE_AURA)
+def tick_damage_pulse_aura(tower, current_time, all_enemies, all_towers):
+    params = tower.special_spec.hook_params
+    # Check if it's time for a new pulse
+    if current_time - tower.last_pulse_time >= params.interval:
+        tower.last_pulse_time = current_time
+        pulse_damage = params.pulse_damage
+        pulse_damage_type = params.pulse_damage_type
+        targets = params.targets
+
+        # Find enemies in range
+        for enemy in all_enemies:
+            if enemy.health > 0 and enemy.type in targets:
+                # Calculate distance to enemy
+                dx = enemy.x - tower.x
+                dy = enemy.y - tower.y
+                dist_sq = dx*dx + dy*dy
+                if dist_sq <= tower.aura_radius_pixels * tower.aura_radius_pixels:
+                    # Apply damage
+                    enemy.take_damage(pulse_damage, pulse_damage_type)
+                    #print(f"Black Hole Generator from {tower.tower_id} dealt {pulse_damage} {pulse_damage_type} damage to {enemy.enemy_id}")
+
+
+# --- Crit Damage Pulse Aura Effect ---
+@register('on_tick', SpecialEffect.CRIT_DAMAGE_PULSE_AURA)
+def tick_crit_damage_pulse_aura(tower, current_time, all_enemies, all_towers):
+    params = tower.special_spec.hook_params
+    # Check if it's time for a new pulse
+    if current_time - tower.last_pulse_time >= params.interval:
+        tower.last_pulse_time = current_time
+        pulse_duration = params.duration
+        crit_multiplier_bonus = params.crit_multiplier_bonus
+
+        # Find towers in range
+        for other in all_towers:
+            if other != tower:  # Don't affect itself
+                # Calculate distance to the other tower
+                dx = other.x - tower.x
+                dy = other.y - tower.y
+                dist_sq = dx*dx + dy*dy
+                if dist_sq <= tower.aura_radius_pixels * tower.aura_radius_pixels:
+                    # Apply crit damage buff
+                    other.apply_status_effect('crit_damage_buff', pulse_duration, crit_multiplier_bonus, current_time)
+                    #print(f"War Drums from {tower.tower_id} buffed {other.tower_id} with +{crit_multiplier_bonus} crit damage for {pulse_duration}s")
+
+
+# --- Gattling Spin-Down Logic ---
+@register('on_tick', SpecialEffect.GATTLING_SPIN_UP)
+def tick_gattling_spin_up(tower, current_time, all_enemies, all_towers):
+    if tower.gattling_level <= 0:
+        return
+    decay_time = tower.special_spec.hook_params.decay_time_sec
+    if current_time - tower.gattling_last_attack_time > decay_time:
+        #print(f"Gattling {tower.tower_id} spun down from Level {tower.gattling_level}.")
+        tower.gattling_level = 0
+        tower.gattling_continuous_fire_start_time = 0.0
+
+
+# --- Execute Ability Logic ---
+@register('on_tick', SpecialEffect.EXECUTE)
+def tick_execute(tower, current_time, all_enemies, all_towers):
+    if tower.execute_cooldown <= 0:
+        return
+    # Check cooldown
+    if current_time - tower.execute_last_time >= tower.execute_cooldown:
+        valid_targets = []
+        # Scan enemies in range
+        for enemy in all_enemies:
+            # Check if enemy is alive, in range, and meets health threshold
+            if (enemy.health > 0 and
+                tower.is_in_range(enemy.x, enemy.y) and
+                enemy.max_health > 0 and
+                (enemy.health / enemy.max_health) <= tower.execute_health_threshold):
+                valid_targets.append(enemy)
+
+        if valid_targets:
+            # Choose a target (e.g., the first one found)
+            target_to_execute = valid_targets[0]
+            #print(f"!!! {tower.tower_id} EXECUTE triggered on {target_to_execute.enemy_id} (HP: {target_to_execute.health}/{target_to_execute.max_health}) !!!")
+
+            # Instantly kill the target
+            target_to_execute.take_damage(999999, "execute")
+
+            # Play the special sound if loaded
+            if tower.special_ability_sound:
+                tower.special_ability_sound.play()
+
+            # Reset cooldown
+            tower.execute_last_time = current_time
+
+
+# --- Attack Speed Aura Effect ---
+@register('on_tick', SpecialEffect.ATTACK_SPEED_AURA)
+def tick_attack_speed_aura(tower, current_time, all_enemies, all_towers):
+    params = tower.special_spec.hook_params
+    # Check if it's time for a new tick
+    if current_time - tower.last_aura_tick_time >= 0.1:  # Check every 0.1 seconds
+        tower.last_aura_tick_time = current_time
+        speed_multiplier = params.attack_speed_multiplier
+        required_race = params.required_race
+
+        #print(f"DEBUG: {tower.tower_id} checking attack speed aura (radius: {tower.aura_radius_pixels})")
+
+        # Find towers in range
+        for other in all_towers:
+            if other != tower:  # Don't affect itself
+                # Calculate distance to the other tower
+                dx = other.x - tower.x
+                dy = other.y - tower.y
+                dist_sq = dx*dx + dy*dy
+                dist = math.sqrt(dist_sq)
+
+                # Check if the other tower belongs to the required race
+                tower_race = other.tower_id.split('_')[0]  # Extract race from tower_id
+                #print(f"DEBUG: Checking tower {other.tower_id} (race: {tower_race}, distance: {dist:.1f})")
+
+                # <<< Check if the other tower is the required race >>>
+                if tower_race == required_race:
+                    if dist_sq <= tower.aura_radius_pixels * tower.aura_radius_pixels:
+                        # <<< APPLY BUFF >>>
+                        # Ensure the buff isn't already maximally applied or something similar if needed
+                        # Example: Tower applies buff directly
+                        # other.apply_attack_speed_buff(speed_multiplier)
+                        pass # Assume buff application logic is elsewhere or handled by buff system
+
+
+# --- Time Machine Rewind Logic ---
+@register('on_tick', SpecialEffect.REWIND_WAYPOINTS)
+def tick_rewind_waypoints(tower, current_time, all_enemies, all_towers):
+    params = tower.special_spec.hook_params
+    # Check cooldown based on attack_interval
+    if hasattr(tower, 'last_attack_time') and current_time - tower.last_attack_time >= tower.attack_interval:
+        #print(f"TIME MACHINE {tower.tower_id}: Cooldown ready. Scanning for target...")
+        # Find the valid target furthest along the path
+        best_target = None
+        max_path_index = -1
+
+        for enemy in all_enemies:
+            # Check if enemy is immune to time machine effects (lord_supermaul and lord_supermaul_reborn)
+            immune_enemies = ['lord_supermaul', 'lord_supermaul_reborn']
+            is_immune = hasattr(enemy, 'enemy_id') and enemy.enemy_id in immune_enemies
+
+            # Skip immune enemies
+            if is_immune:
+                continue
+
+            # Check if enemy is alive, of a valid target type, and in range
+            if (enemy.health > 0 and
+                enemy.type in tower.targets and
+                tower.is_in_range(enemy.x, enemy.y)):
+
+                # Check progress
+                if enemy.path_index > max_path_index:
+                    max_path_index = enemy.path_index
+                    best_target = enemy
+
+        # If a valid target was found
+        if best_target:
+            waypoints_to_rewind = params.waypoints_to_rewind
+            #print(f"TIME MACHINE {tower.tower_id}: Targeting {best_target.enemy_id} (at waypoint {best_target.path_index}). Rewinding {waypoints_to_rewind} waypoints.")
+
+            # Check if enemy is immune to time machine effects (lord_supermaul and lord_supermaul_reborn)
+            immune_enemies = ['lord_supermaul', 'lord_supermaul_reborn']
+            is_immune = hasattr(best_target, 'enemy_id') and best_target.enemy_id in immune_enemies
+
+            # Only rewind if not immune
+            if not is_immune:
+                # Call the enemy's rewind method
+                best_target.rewind_waypoints(waypoints_to_rewind)
+
+            # <<< PLAY REWIND SOUND >>>
+            if hasattr(tower, 'rewind_sound') and tower.rewind_sound:
+                tower.rewind_sound.play()
+            # <<< END PLAY SOUND >>>
+
+            # Reset cooldown timer
+            tower.last_attack_time = current_time
+
+            # --- Create Rewind Visual Effect ---
+            if hasattr(tower, 'rewind_visual_surface') and tower.rewind_visual_surface:
+                if hasattr(tower, 'game_scene_add_effect_callback') and callable(tower.game_scene_add_effect_callback):
+                    try:
+                        # Make the effect much bigger - 3x the tower size
+                        effect_size_multiplier = 3.0
+                        effect_width = int(tower.width_pixels * effect_size_multiplier)
+                        effect_height = int(tower.height_pixels * effect_size_multiplier)
+
+                        effect_instance = Effect(
+                            best_target.x, # Center effect on enemy's X
+                            best_target.y, # Center effect on enemy's Y
+                            tower.rewind_visual_surface, # Use pre-loaded image
+                            duration=0.5, # Quick fade-out duration
+                            target_size=(effect_width, effect_height), # Much larger size
+                            fade_type='fade_out' # Default fade out is fine
+                        )
+                        tower.game_scene_add_effect_callback(effect_instance)
+                    except Exception as e:
+                        print(f"Error creating rewind visual effect: {e}")
+
+
+# --- Splash Radius Buff Aura Effect ---
+@register('on_tick', SpecialEffect.SPLASH_RADIUS_BUFF_AURA)
+def tick_splash_radius_buff_aura(tower, current_time, all_enemies, all_towers):
+    params = tower.special_spec.hook_params
+    # Check if it's time for a new tick
+    if current_time - tower.last_aura_tick_time >= 1.0:  # Check every 1.0 seconds
+        tower.last_aura_tick_time = current_time
+        splash_radius_increase = params.splash_radius_increase
+
+        #print(f"DEBUG: {tower.tower_id} checking splash radius buff aura (radius: {tower.aura_radius_pixels})")
+
+        # Find towers in range
+        for other in all_towers:
+            if other != tower:  # Don't affect itself
+                # Calculate distance to the other tower
+                dx = other.x - tower.x
+                dy = other.y - tower.y
+                dist_sq = dx*dx + dy*dy
+                dist = math.sqrt(dist_sq)
+
+                if dist_sq <= tower.aura_radius_pixels * tower.aura_radius_pixels:
+                    # Apply splash radius buff with longer duration
+                    other.apply_pulsed_buff('splash_radius_buff', splash_radius_increase, 1.5, current_time)
+                    #print(f"DEBUG: Splash Radius Aura from {tower.tower_id} buffed {other.tower_id} with +{splash_radius_increase} splash radius")
+                else:
+                    #print(f"DEBUG: Tower {other.tower_id} is too far away ({dist:.1f} > {tower.aura_radius_pixels})")
+                    pass
+
+
+# --- Adjacency Attack Speed Buff Effect ---
+@register('on_tick', SpecialEffect.ADJACENCY_ATTACK_SPEED_BUFF)
+def tick_adjacency_attack_speed_buff(tower, current_time, all_enemies, all_towers):
+    params = tower.special_spec.hook_params
+    # Check if it's time for a new tick
+    if current_time - tower.last_aura_tick_time >= 0.1:  # Check every 0.1 seconds
+        tower.last_aura_tick_time = current_time
+        speed_bonus_percent = params.attack_speed_bonus_percentage
+        speed_multiplier = 1.0 + (speed_bonus_percent / 100.0)
+
+        #print(f"DEBUG: {tower.tower_id} checking adjacency attack speed buff")
+
+        # Find adjacent towers
+        for other in all_towers:
+            if other != tower:  # Don't affect itself
+                # Check if towers are adjacent (1 grid cell away)
+                dx = abs(other.center_grid_x - tower.center_grid_x)
+                dy = abs(other.center_grid_y - tower.center_grid_y)
+
+                if (dx <= 1 and dy <= 1) and (dx == 1 or dy == 1):  # Only adjacent, not diagonal
+                    # Apply attack speed buff
+                    other.apply_pulsed_buff('attack_speed_buff', speed_multiplier, 0.2, current_time)
+                    #print(f"DEBUG: Adjacency Attack Speed Buff from {tower.tower_id} buffed {other.tower_id} with +{speed_bonus_percent}% attack speed")
+
+
+# --- Adjacency Damage Buff Effect ---
+@register('on_tick', SpecialEffect.ADJACENCY_DAMAGE_BUFF)
+def tick_adjacency_damage_buff(tower, current_time, all_enemies, all_towers):
+    params = tower.special_spec.hook_params
+    # Check if it's time for a new tick
+    if current_time - tower.last_aura_tick_time >= 1.0:  # Check every 1.0 seconds
+        tower.last_aura_tick_time = current_time
+        damage_bonus_percent = params.damage_bonus_percentage
+        damage_multiplier = 1.0 + (damage_bonus_percent / 100.0)
+
+        #print(f"DEBUG: {tower.tower_id} checking adjacency damage buff")
+
+        # Find adjacent towers
+        for other in all_towers:
+            if other != tower:  # Don't affect itself
+                # Check if towers are adjacent (1 grid cell away)
+                dx = abs(other.center_grid_x - tower.center_grid_x)
+                dy = abs(other.center_grid_y - tower.center_grid_y)
+
+                if (dx <= 1 and dy <= 1) and (dx == 1 or dy == 1):  # Only adjacent, not diagonal
+                    # Apply damage buff
+                    other.apply_pulsed_buff('damage_buff', damage_multiplier, 1.5, current_time)
+                    #print(f"DEBUG: Adjacency Damage Buff from {tower.tower_id} buffed {other.tower_id} with +{damage_bonus_percent}% damage")
+
+
+# --- Air Damage Aura Effect ---
+@register('on_tick', SpecialEffect.AIR_DAMAGE_AURA)
+def tick_air_damage_aura(tower, current_time, all_enemies, all_towers):
+    params = tower.special_spec.hook_params
+    # Check if it's time for a new tick
+    if current_time - tower.last_aura_tick_time >= 1.0:  # Check every 1.0 seconds
+        tower.last_aura_tick_time = current_time
+        air_damage_multiplier = params.air_damage_multiplier
+
+        #print(f"DEBUG: {tower.tower_id} checking air damage aura (radius: {tower.aura_radius_pixels})")
+
+        # Find towers in range
+        for other in all_towers:
+            if other != tower:  # Don't affect itself
+                # Only affect projectile towers
+                if other.attack_type == 'projectile':
+                    # Calculate distance to the other tower
+                    dx = other.x - tower.x
+                    dy = other.y - tower.y
+                    dist_sq = dx*dx + dy*dy
+                    dist = math.sqrt(dist_sq)
+
+                    if dist_sq <= tower.aura_radius_pixels * tower.aura_radius_pixels:
+                        # Apply air damage buff
+                        other.apply_pulsed_buff('air_damage_buff', air_damage_multiplier, 1.5, current_time)
+                        #print(f"DEBUG: Air Damage Aura from {tower.tower_id} buffed {other.tower_id} with x{air_damage_multiplier} air damage")
+                    else:
+                        #print(f"DEBUG: Tower {other.tower_id} is too far away ({dist:.1f} > {tower.aura_radius_pixels})")
+                        pass
+                else:
+                    #print(f"DEBUG: Tower {other.tower_id} is not a projectile tower, skipping air damage buff")
+                    pass
+
+
+# --- Damage Aura Effect ---
+@register('on_tick', SpecialEffect.DAMAGE_AURA)
+def tick_damage_aura(tower, current_time, all_enemies, all_towers):
+    params = tower.special_spec.hook_params
+    # Check if it's time for a new tick
+    if current_time - tower.last_aura_tick_time >= 1.0:  # Check every 1.0 seconds
+        tower.last_aura_tick_time = current_time
+        damage_bonus_percent = params.damage_bonus_percentage
+        damage_multiplier = 1.0 + (damage_bonus_percent / 100.0)
+
+        #print(f"DEBUG: {tower.tower_id} checking damage aura (radius: {tower.aura_radius_pixels})")
+
+        # Find towers in range
+        for other in all_towers:
+            if other != tower:  # Don't affect itself
+                # Calculate distance to the other tower
+                dx = other.x - tower.x
+                dy = other.y - tower.y
+                dist_sq = dx*dx + dy*dy
+                dist = math.sqrt(dist_sq)
+
+                if dist_sq <= tower.aura_radius_pixels * tower.aura_radius_pixels:
+                    # Apply damage buff
+                    other.apply_pulsed_buff('damage_buff', damage_multiplier, 1.5, current_time)
+                    #print(f"DEBUG: Damage Aura from {tower.tower_id} buffed {other.tower_id} with +{damage_bonus_percent}% damage")
+                else:
+                    pass
+                    #print(f"DEBUG: Tower {other.tower_id} is too far away ({dist:.1f} > {tower.aura_radius_pixels})")
+
+
+# --- Crit Aura Effect ---
+@register('on_tick', SpecialEffect.CRIT_AURA)
+def tick_crit_aura(tower, current_time, all_enemies, all_towers):
+    params = tower.special_spec.hook_params
+    # Check if it's time for a new tick
+    if current_time - tower.last_aura_tick_time >= 1.0:  # Check every 1.0 seconds
+        tower.last_aura_tick_time = current_time
+        crit_chance_bonus = params.crit_chance_bonus
+        crit_multiplier_bonus = params.crit_multiplier_bonus
+
+        print(f"DEBUG: {tower.tower_id} checking crit aura (radius: {tower.aura_radius_pixels})")
+
+        # Find towers in range
+        for other in all_towers:
+            if other != tower:  # Don't affect itself
+                # Calculate distance to the other tower
+                dx = other.x - tower.x
+                dy = other.y - tower.y
+                dist_sq = dx*dx + dy*dy
+                dist = math.sqrt(dist_sq)
+
+                if dist_sq <= tower.aura_radius_pixels * tower.aura_radius_pixels:
+                    # Apply crit chance buff
+                    other.apply_pulsed_buff('crit_chance_buff', crit_chance_bonus, 1.5, current_time)
+                    # Apply crit multiplier buff
+                    other.apply_pulsed_buff('crit_multiplier_buff', crit_multiplier_bonus, 1.5, current_time)
+                    #print(f"DEBUG: Crit Aura from {tower.tower_id} buffed {other.tower_id} with +{crit_chance_bonus*100}% crit chance and +{crit_multiplier_bonus} crit multiplier")
+                else:
+                    pass
+                    #print(f"DEBUG: Tower {other.tower_id} is too far away ({dist:.1f} > {tower.aura_radius_pixels})")
+
+
+# --- DoT Amplification Aura Effect ---
+@register('on_tick', SpecialEffect.DOT_AMPLIFICATION_AURA)
+def tick_dot_amplification_aura(tower, current_time, all_enemies, all_towers):
+    params = tower.special_spec.hook_params
+    # Check if it's time for a new tick
+    if current_time - tower.last_aura_tick_time >= 1.0:  # Check every 1.0 seconds
+        tower.last_aura_tick_time = current_time
+        dot_damage_multiplier = params.dot_damage_multiplier
+        targets = params.targets
+
+        #print(f"DEBUG: {tower.tower_id} checking DoT amplification aura (radius: {tower.aura_radius_pixels})")
+
+        # Find enemies in range
+        for enemy in all_enemies:
+            if enemy.health > 0 and enemy.type in targets:
+                # Calculate distance to enemy
+                dx = enemy.x - tower.x
+                dy = enemy.y - tower.y
+                dist_sq = dx*dx + dy*dy
+                dist = math.sqrt(dist_sq)
+
+                if dist_sq <= tower.aura_radius_pixels * tower.aura_radius_pixels:
+                    # Apply DoT damage multiplier to the enemy with a longer duration that matches the check interval
+                    enemy.apply_status_effect('dot_amplification', 2.0, dot_damage_multiplier, current_time)
+                    #print(f"DEBUG: DoT Amplification Aura from {tower.tower_id} amplified DoTs on {enemy.enemy_id} by x{dot_damage_multiplier}")
+                else:
+                    pass
+                    #print(f"DEBUG: Enemy {enemy.enemy_id} is too far away ({dist:.1f} > {tower.aura_radius_pixels})")
+
+
+# --- Random Bombardment Effect ---
+@register('on_tick', SpecialEffect.RANDOM_BOMBARDMENT)
+def tick_random_bombardment(tower, current_time, all_enemies, all_towers):
+    params = tower.special_spec.hook_params
+    # Check if it's time for a new strike
+    if current_time - tower.last_attack_time >= tower.special_spec.interval:  # Use exact interval from tower data
+        tower.last_attack_time = current_time
+
+        # Get bombardment parameters
+        bombardment_radius = params.bombardment_radius
+        strike_aoe_radius = params.strike_aoe_radius
+        strike_damage_min = params.strike_damage_min
+        strike_damage_max = params.strike_damage_max
+        strike_damage_type = params.strike_damage_type
+
+        # Calculate random strike position within bombardment radius
+        angle = random.uniform(0, 2 * math.pi)
+        distance = random.uniform(0, bombardment_radius)
+        strike_x = tower.x + math.cos(angle) * distance
+        strike_y = tower.y + math.sin(angle) * distance
+
+        # Convert grid coordinates to pixel coordinates and ensure strike stays within bounds
+        # Grid coordinates: (26,1), (1,24), (1,1), (24,1)
+        # Convert to pixel coordinates (assuming 50 pixels per grid)
+        min_x = 1 * 50  # Left boundary
+        max_x = 26 * 50  # Right boundary
+        min_y = 1 * 50  # Top boundary
+        max_y = 24 * 50  # Bottom boundary
+
+        strike_x = max(min_x, min(strike_x, max_x))
+        strike_y = max(min_y, min(strike_y, max_y))
+
+        # Create explosion effect
+        explosion = Effect(
+            strike_x,
+            strike_y,
+            tower.asset_loader("assets/effects/fire_burst.png"),
+            duration=0.5,
+            target_size=(strike_aoe_radius, strike_aoe_radius)  # Make visual effect match actual radius
+        )
+
+        # Deal damage to enemies in radius
+        strike_radius_sq = strike_aoe_radius ** 2
+        for enemy in all_enemies:
+            if enemy.health > 0:
+                dx = enemy.x - strike_x
+                dy = enemy.y - strike_y
+                dist_sq = dx**2 + dy**2
+                if dist_sq <= strike_radius_sq:
+                    # Calculate damage falloff based on distance
+                    distance = math.sqrt(dist_sq)
+                    falloff = 1.0 - (distance / strike_aoe_radius)
+                    damage = random.uniform(strike_damage_min, strike_damage_max) * falloff
+                    enemy.take_damage(damage, strike_damage_type)
+
+        # Add explosion to game scene
+        if tower.game_scene_add_effect_callback:
+            tower.game_scene_add_effect_callback(explosion)
+
+        #print(f"Random bombardment strike at ({int(strike_x)}, {int(strike_y)})")
+
+
+# --- Salvo Attack Logic ---
+@register('on_tick', SpecialEffect.SALVO_ATTACK)
+def tick_salvo_attack(tower, current_time, all_enemies, all_towers):
+    if tower.salvo_shots_remaining <= 0:
+        return
+    if current_time >= tower.salvo_next_shot_time:
+        # Fire next salvo shot
+        salvo_interval = tower.special_spec.hook_params.salvo_interval
+        tower.salvo_next_shot_time = current_time + salvo_interval
+        tower.salvo_shots_remaining -= 1
+
+        # Calculate damage for this shot
+        buffed_stats = tower.get_buffed_stats(current_time, [], all_towers)
+        damage_multiplier = buffed_stats['damage_multiplier']
+        effective_splash_radius_pixels = buffed_stats['splash_radius_pixels']
+
+        initial_damage, is_crit = tower.calculate_damage(tower.salvo_target, buffed_stats, current_time, damage_multiplier=damage_multiplier)
+
+        # Create and fire the projectile
+        projectile = Projectile(
+            tower.x, tower.y, initial_damage, tower.projectile_speed,
+            tower.tower_data.get('projectile_asset_id', tower.tower_id),
+            target_enemy=tower.salvo_target,
+            splash_radius=effective_splash_radius_pixels,
+            source_tower=tower,
+            is_crit=is_crit,
+            special_effect=tower.special,
+            damage_type=tower.damage_type,
+            bounces_remaining=tower.bounce,
+            bounce_range_pixels=tower.bounce_range_pixels,
+            bounce_damage_falloff=tower.bounce_damage_falloff,
+            pierce_adjacent=tower.pierce_adjacent,
+            asset_loader=tower.asset_loader,
+            defer_impact=True
+        )
+
+        # Add projectile to game scene
+        if tower.game_scene_add_projectile_callback:
+            tower.game_scene_add_projectile_callback(projectile)
+
+        # Play sound for each shot
+        if tower.attack_sound:
+            tower.attack_sound.play()
+
+
+# --- on_attack: called at the end of a standard attack ---
+
+@register('on_attack', SpecialEffect.DOUBLE_STRIKE)
+def attack_double_strike(tower, target, initial_damage, current_time):
+    params = tower.special_spec.hook_params
+    chance = params.chance_percent
+    if random.random() * 100 < chance:
+        # Create double strike effect
+        double_strike = DoubleStrikeEffect(tower, target, initial_damage, current_time)
+        if tower.game_scene_add_effect_callback:
+            tower.game_scene_add_effect_callback(double_strike)
+        #print(f"Double Strike triggered on {target.enemy_id} with {chance}% chance")
+
+
+@register('on_attack', SpecialEffect.EVERY_NTH_STRIKE)
+def attack_every_nth_strike(tower, target, initial_damage, current_time):
+    params = tower.special_spec.hook_params
+    tower.strike_counter += 1
+    n = params.n
+    bonus_damage = params.bonus_damage
+
+    # Check if it's the nth strike
+    if tower.strike_counter >= n:
+        # Create every_nth_strike effect
+        nth_strike = EveryNthStrikeEffect(tower, target, bonus_damage, current_time)
+        if tower.game_scene_add_effect_callback:
+            tower.game_scene_add_effect_callback(nth_strike)
+        #print(f"Every Nth Strike triggered on {target.enemy_id} (strike {tower.strike_counter})")
+        tower.strike_counter = 0  # Reset counter
@@ -1,15 +1,20 @@
 import pygame
 import math
 import random
+import numpy as np
 from config import *
 import time
+from utils.path_polyline import PathPolyline
+from utils.pathfinding import compress_path
+from utils.enemy_store import EnemyStore
+from utils.tower_specs import target_bit
 
 # Pre-calculate the armor constant for efficiency
 ARMOR_CONSTANT = 0.06
 
 class Enemy:
     """Represents an enemy unit in the game."""
-    def __init__(self, x, y, grid_path, enemy_id, enemy_data, armor_type, damage_modifiers, wave_index=None):
+    def __init__(self, x, y, grid_path, enemy_id, enemy_data, armor_type, damage_modifiers, wave_index=None, store=None):
         """
         Initialize an enemy.
 
@@ -21,7 +26,12 @@ class Enemy:
         :param armor_type: String name of the armor type (e.g., 'Light').
         :param damage_modifiers: Dictionary of damage type -> multiplier for this armor.
         :param wave_index: Index of the wave this enemy belongs to (for tracking purposes).
+        :param store: EnemyStore shared by the scene's enemies (a private one is made if omitted).
         """
+        # --- NEW: Row in the structure-of-arrays enemy store (see utils/enemy_store.py) ---
+        self.store = store if store is not None else EnemyStore(capacity=1)
+        self.store_slot = self.store.add(self)
+        # ---------------------------------------
         self.x = x
         self.y = y
         self.grid_path = grid_path
@@ -31,9 +41,8 @@ class Enemy:
         self.wave_index = wave_index  # Track which wave this enemy belongs to
 
         # --- ADDED: Rect for Collision Detection ---
-        # Initialize rect with placeholder size, then center it
-        self.rect = pygame.Rect(0, 0, GRID_SIZE, GRID_SIZE) # Default size
-        self.rect.center = (self.x, self.y) # Center on initial position
+        # Placeholder size; the rect property centres it on the current position when read
+        self._rect = pygame.Rect(0, 0, GRID_SIZE, GRID_SIZE) # Default size
         # ------------------------------------------
 
         # Enemy properties from data
@@ -56,6 +65,7 @@ class Enemy:
         
         # Determine enemy type (e.g., ground, air) - needed for tower targeting/stats
         self.type = enemy_data.get("type", "ground") # Default to ground if not specified
+        self.target_bit = target_bit(self.type) # Matched against compiled tower target masks
         
         self.status_effects = {} # To track effects like { 'slow': { 'end_time': timestamp, 'multiplier': 0.8 } }
         self.active_dots = {} # Store active DoT effects
@@ -67,9 +77,28 @@ class Enemy:
         self.wander_radius = 10  # How far the enemy can wander from the direct path
         self.wander_angle = random.uniform(0, 2 * math.pi)  # Random starting angle
         self.wander_change = 0.5  # How quickly the wander angle changes
+        self.store.wander_limit[self.store_slot] = self.wander_radius / 2
+        self.store.wander_step[self.store_slot] = self.wander_change
+
+        # --- NEW: Arc-length path following ---
+        # The remaining path is converted once into a pixel polyline; the enemy then only
+        # advances a scalar distance along it. Rebuilt when the path changes or something
+        # else (harpoon pull, rewind) moves the enemy.
+        # Distance, segment, wander offsets and the last written position live in the store
+        self.path_polyline = None
+        self.path_polyline_base_index = 0 # grid_path index of the polyline's second point
+        self.path_polyline_source = None # grid_path object the polyline was built from
+        self.path_tile_size = GRID_SIZE
+        self.path_grid = None # Set by the scene to allow line-of-sight corner cutting (see COMPRESS_ENEMY_PATHS)
+        # Wander is a small bounded offset from the path line
+        max_wander_offset = self.wander_radius / 2
+        self.wander_offset_x = math.cos(self.wander_angle) * max_wander_offset
+        self.wander_offset_y = math.sin(self.wander_angle) * max_wander_offset
+        self.teleport_count = 0 # Bumped on instant moves (rewind) so deferred-impact shots re-simulate
+        # --- END Arc-length path following ---
         
     def update_status_effects(self, current_time):
-        """Remove expired effects and recalculate speed."""
+        """Remove expired effects and recalculate speed. (Slow and stun expire in EnemyStore.step.)"""
         effects_removed = False
         for effect_type, data in list(self.status_effects.items()): # Iterate over copy
             if current_time >= data['end_time']:
@@ -84,31 +113,44 @@ class Enemy:
         """Apply or refresh a status effect (e.g., slow, stun)."""
         end_time = current_time + duration
         
+        # Slow and stun are kept in the store so their expiry is vectorised
+        if effect_type == 'slow':
+            self.store.apply_slow(self.store_slot, value, end_time)
+        elif effect_type == 'stun':
+            self.store.apply_stun(self.store_slot, end_time)
         # Store effect data - value is used for slow multiplier, ignored for stun
-        if effect_type == 'dot_amplification':
+        elif effect_type == 'dot_amplification':
             self.status_effects[effect_type] = { 'end_time': end_time, 'multiplier': value }
+            self.store.ticking[self.store_slot] = True # Expired in EnemyStore.step
         else:
             self.status_effects[effect_type] = { 'end_time': end_time, 'value': value }
+            self.store.ticking[self.store_slot] = True
         
         #print(f"Enemy {self.enemy_id}: Applied {effect_type} until {end_time:.2f}")
         # Recalculate speed immediately after applying any status effect
         self.recalculate_speed()
 
+    def has_status_effect(self, effect_type):
+        """True if the effect is currently applied (slow/stun included)."""
+        if effect_type == 'slow':
+            return self.store.slow_until.item(self.store_slot) != float('-inf')
+        if effect_type == 'stun':
+            return self.store.stun_until.item(self.store_slot) != float('-inf')
+        return effect_type in self.status_effects
+
+    def clear_status_effect(self, effect_type):
+        """Remove an effect early (slow/stun included) and recalculate speed."""
+        if effect_type == 'slow':
+            self.store.apply_slow(self.store_slot, 1.0, float('-inf'))
+        elif effect_type == 'stun':
+            self.store.apply_stun(self.store_slot, float('-inf'))
+        else:
+            self.status_effects.pop(effect_type, None)
+        self.recalculate_speed()
+
     def recalculate_speed(self):
-        """Recalculate current speed based on active status effects."""
-        # Check for stun first
-        if 'stun' in self.status_effects:
-            self.speed = 0
-            # print(f"Enemy {self.enemy_id} is STUNNED. Speed set to 0.")
-            return # Stun overrides slow
-        
-        # If not stunned, calculate slow
-        slow_multiplier = 1.0
-        if 'slow' in self.status_effects:
-            slow_multiplier = min(slow_multiplier, self.status_effects['slow']['value'])
-        
-        self.speed = self.base_speed * slow_multiplier
-        # print(f"Enemy {self.enemy_id} speed recalculated to {self.speed}")
+        """Recalculate current speed based on active status effects (stun overrides slow)."""
+        self.store.recalculate_speed(self.store_slot)
         
     def apply_dot_effect(self, effect_name, damage, interval, duration, damage_type, current_time):
         """Applies or refreshes a Damage Over Time effect."""
@@ -131,6 +173,7 @@ class Enemy:
             'end_time': end_time,
             'damage_type': damage_type
         }
+        self.store.ticking[self.store_slot] = True # Ticked in EnemyStore.step
         #print(f"Enemy {self.enemy_id}: Applied DoT '{effect_name}' (Base: {damage}/{interval}s for {duration}s, type: {damage_type}). Ends at {end_time:.2f}.")
 
     def update_dots(self, current_time):
@@ -167,64 +210,43 @@ class Enemy:
                     dot_data['next_tick'] = current_time + dot_data['interval']
 
     def move(self, current_time, tile_size=None):
-        """Move the enemy towards the next waypoint with wandering behavior."""
-        self.update_status_effects(current_time) # Update effects first (slows)
-        self.update_dots(current_time) # Process DoT effects
-        
-        # Use provided tile_size or fall back to GRID_SIZE for compatibility
+        """Move this enemy along its path polyline with a small wander offset."""
+        # The scene steps every enemy at once through EnemyStore.step; this is the same pass for one
         use_tile_size = tile_size if tile_size is not None else GRID_SIZE
-        
-        if self.path_index < len(self.grid_path):
-            # Get the target grid cell coordinates
-            target_grid_x, target_grid_y = self.grid_path[self.path_index]
-            
-            # Convert target grid cell to target pixel coordinates (center of cell)
-            target_x_pixel = (target_grid_x * use_tile_size) + (use_tile_size // 2)
-            target_y_pixel = (target_grid_y * use_tile_size) + (use_tile_size // 2)
-
-            # Calculate direction to target
-            dx = target_x_pixel - self.x
-            dy = target_y_pixel - self.y
-            distance = math.sqrt(dx**2 + dy**2)
-            
-            if distance > 0:
-                # Calculate base movement direction (towards target)
-                base_dir_x = dx / distance
-                base_dir_y = dy / distance
-                
-                # Update wander angle
-                self.wander_angle += random.uniform(-self.wander_change, self.wander_change)
-                
-                # Calculate wander offset
-                wander_x = math.cos(self.wander_angle) * self.wander_radius
-                wander_y = math.sin(self.wander_angle) * self.wander_radius
-                
-                # Combine base direction with wander
-                move_x = base_dir_x + (wander_x / distance)
-                move_y = base_dir_y + (wander_y / distance)
-                
-                # Normalize the combined direction
-                move_length = math.sqrt(move_x**2 + move_y**2)
-                if move_length > 0:
-                    move_x /= move_length
-                    move_y /= move_length
-                
-                # Apply movement
-                self.x += move_x * self.speed
-                self.y += move_y * self.speed
-                
-                # Check if we've reached the target area
-                if distance <= self.wander_radius * 2:
-                    self.path_index += 1
-                    #print(f"Enemy reached waypoint {self.path_index-1}, moving to next waypoint")
-            else:
-                # If we're already at the target, move to next waypoint
-                self.path_index += 1
-                # print(f"Enemy {self.enemy_id} already at waypoint {self.path_index-1}, moving to next waypoint") # Less noisy
-        
-        # --- ADDED: Update Rect Position ---
-        self.rect.center = (int(self.x), int(self.y)) # Keep rect centered on enemy
-        # ------------------------------------
+        self.store.step(current_time, use_tile_size, slots=np.array([self.store_slot]))
+
+    def build_path_polyline(self, tile_size):
+        """Converts the remaining waypoints (from path_index) into a polyline starting at the current position."""
+        # Start from the un-wandered position so the wander offset carries over smoothly
+        start_x = self.x - self.wander_offset_x
+        start_y = self.y - self.wander_offset_y
+        remaining_path = self.grid_path[self.path_index:]
+        # Only corners need to be visited; with a grid, open stretches are cut straight across
+        keep_indices = compress_path(remaining_path, self.path_grid, is_air_unit=(self.type == 'air'))
+        self.path_polyline = PathPolyline.from_grid_path(start_x, start_y, remaining_path,
+                                                         tile_size, keep_indices)
+        self.path_polyline_base_index = self.path_index
+        self.path_polyline_source = self.grid_path
+        self.path_tile_size = tile_size
+        self.store.set_polyline(self.store_slot, self.path_polyline, self.path_index, tile_size)
+
+    def predict_position(self, frames_ahead):
+        """Where the enemy will be after `frames_ahead` more frames at its current speed (ignores wander drift)."""
+        polyline = self.path_polyline
+        if (polyline is None or self.path_polyline_source is not self.grid_path or
+                self.x != self.last_path_x or self.y != self.last_path_y or frames_ahead <= 0):
+            return self.x, self.y
+        distance = self.path_distance + self.speed * frames_ahead
+        segment = polyline.advance_segment(distance, self.path_segment)
+        base_x, base_y = polyline.position_at(distance, segment)
+        return base_x + self.wander_offset_x, base_y + self.wander_offset_y
+
+    def get_remaining_path_distance(self):
+        """Pixels left to the end of the path. Lower means further along (for first/last targeting)."""
+        if self.path_polyline is None or self.path_polyline_source is not self.grid_path:
+            # Not moved yet along this path: estimate from waypoints left
+            return max(0, len(self.grid_path) - self.path_index) * self.path_tile_size
+        return max(0.0, self.path_polyline.total_length - self.path_distance)
         
     def take_damage(self, base_damage, damage_type="normal", bonus_multiplier=1.0, ignore_armor_amount=0, source_special=None):
         """Apply damage to the enemy, taking into account resistances, status effects, and armor."""
@@ -446,30 +468,141 @@ class Enemy:
         target_grid_x, target_grid_y = self.grid_path[self.path_index]
         
         # Convert target grid cell to target pixel coordinates (center of cell)
-        target_x_pixel = (target_grid_x * GRID_SIZE) + (GRID_SIZE // 2)
-        target_y_pixel = (target_grid_y * GRID_SIZE) + (GRID_SIZE // 2)
+        # Use the same tile size as movement so the enemy lands exactly on the path
+        tile_size = self.path_tile_size
+        target_x_pixel = (target_grid_x * tile_size) + (tile_size // 2)
+        target_y_pixel = (target_grid_y * tile_size) + (tile_size // 2)
         
         # Instantly update position to the center of the new target waypoint
         self.x = target_x_pixel
         self.y = target_y_pixel
-        self.rect.center = (int(self.x), int(self.y)) # Update rect position too
-
-        # --- Optional: Recalculate direction immediately (to prevent weird initial movement) ---
-        # Get the NEXT waypoint after the rewind
-        next_waypoint_index = self.path_index + 1
-        if next_waypoint_index < len(self.grid_path):
-            next_grid_x, next_grid_y = self.grid_path[next_waypoint_index]
-            next_x_pixel = (next_grid_x * GRID_SIZE) + (GRID_SIZE // 2)
-            next_y_pixel = (next_grid_y * GRID_SIZE) + (GRID_SIZE // 2)
-            
-            dx = next_x_pixel - self.x
-            dy = next_y_pixel - self.y
-            distance = math.sqrt(dx**2 + dy**2)
-            
-            if distance > 0:
-                # Update internal direction if your movement logic uses it
-                # Assuming self.direction is used, otherwise adapt to your specific move logic
-                # If move() calculates direction on the fly, this might not be needed
-                # self.direction = pygame.Vector2(dx / distance, dy / distance) 
-                pass # If move() recalculates direction each time, no need to set it here
-        # --- End Optional Direction Recalculation ---
+
+        # Rebuild the path polyline from the new position (no wander offset after a teleport)
+        self.wander_offset_x = 0.0
+        self.wander_offset_y = 0.0
+        self.build_path_polyline(tile_size)
+        self.last_path_x = self.x
+        self.last_path_y = self.y
+        self.teleport_count += 1
+
+    # --- Store-backed state (see utils/enemy_store.py) ---
+    @property
+    def x(self):
+        return self.store.x.item(self.store_slot)
+
+    @x.setter
+    def x(self, value):
+        self.store.x[self.store_slot] = value
+
+    @property
+    def y(self):
+        return self.store.y.item(self.store_slot)
+
+    @y.setter
+    def y(self, value):
+        self.store.y[self.store_slot] = value
+
+    @property
+    def rect(self):
+        # Centred on read, so moving the enemy never has to touch the rect
+        self._rect.center = (int(self.x), int(self.y))
+        return self._rect
+
+    @property
+    def health(self):
+        return self.store.health.item(self.store_slot)
+
+    @health.setter
+    def health(self, value):
+        self.store.health[self.store_slot] = value
+
+    @property
+    def path_index(self):
+        return self.store.path_index.item(self.store_slot)
+
+    @path_index.setter
+    def path_index(self, value):
+        self.store.path_index[self.store_slot] = value
+
+    @property
+    def grid_path(self):
+        return self._grid_path
+
+    @grid_path.setter
+    def grid_path(self, value):
+        # A new path (e.g. a repath) rebuilds the polyline on the next step
+        self._grid_path = value
+        self.store.path_len[self.store_slot] = len(value)
+        self.store.path_dirty[self.store_slot] = True
+
+    @property
+    def speed(self):
+        return self.store.speed.item(self.store_slot)
+
+    @speed.setter
+    def speed(self, value):
+        self.store.speed[self.store_slot] = value
+
+    @property
+    def base_speed(self):
+        return self.store.base_speed.item(self.store_slot)
+
+    @base_speed.setter
+    def base_speed(self, value):
+        self.store.base_speed[self.store_slot] = value
+
+    @property
+    def current_armor_value(self):
+        return self.store.armor.item(self.store_slot)
+
+    @current_armor_value.setter
+    def current_armor_value(self, value):
+        self.store.armor[self.store_slot] = value
+
+    @property
+    def path_distance(self):
+        return self.store.path_distance.item(self.store_slot)
+
+    @path_distance.setter
+    def path_distance(self, value):
+        self.store.path_distance[self.store_slot] = value
+
+    @property
+    def path_segment(self):
+        return self.store.segment.item(self.store_slot)
+
+    @path_segment.setter
+    def path_segment(self, value):
+        self.store.segment[self.store_slot] = value
+
+    @property
+    def wander_offset_x(self):
+        return self.store.wander_x.item(self.store_slot)
+
+    @wander_offset_x.setter
+    def wander_offset_x(self, value):
+        self.store.wander_x[self.store_slot] = value
+
+    @property
+    def wander_offset_y(self):
+        return self.store.wander_y.item(self.store_slot)
+
+    @wander_offset_y.setter
+    def wander_offset_y(self, value):
+        self.store.wander_y[self.store_slot] = value
+
+    @property
+    def last_path_x(self):
+        return self.store.last_x.item(self.store_slot)
+
+    @last_path_x.setter
+    def last_path_x(self, value):
+        self.store.last_x[self.store_slot] = value
+
+    @property
+    def last_path_y(self):
+        return self.store.last_y.item(self.store_slot)
+
+    @last_path_y.setter
+    def last_path_y(self, value):
+        self.store.last_y[self.store_slot] = value
@@ -42,8 +42,10 @@ class GrenadeProjectile(Projectile):
         self.vx = math.cos(direction_angle) * initial_speed
         self.vy = math.sin(direction_angle) * initial_speed - 100  # Add slight upward component
 
-    def move(self, time_delta, enemies, towers):
-        """Move the grenade using simple physics."""
+    def move(self, time_delta, enemies, towers, enemy_index=None):
+        """Move the grenade using simple physics.
+           If an enemy_index (EnemySpatialHash) is given, only nearby enemies are checked.
+        """
         if self.collided or self.has_detonated:
             return
 
@@ -61,18 +63,19 @@ class GrenadeProjectile(Projectile):
         # Check for detonation timer
         current_time = pygame.time.get_ticks() / 1000.0
         if current_time - self.spawn_time >= self.detonation_time:
-            self.detonate(enemies)
+            self.detonate(enemies, enemy_index)
             return
 
         # Check for enemy collisions
         collision_radius_sq = (GRID_SIZE * 0.4)**2
-        for enemy in enemies:
+        nearby_enemies = enemy_index.query_circle(self.x, self.y, GRID_SIZE * 0.4) if enemy_index is not None else enemies
+        for enemy in nearby_enemies:
             if enemy.health > 0:
                 dx = enemy.x - self.x
                 dy = enemy.y - self.y
                 dist_sq = dx**2 + dy**2
                 if dist_sq <= collision_radius_sq:
-                    self.detonate(enemies)
+                    self.detonate(enemies, enemy_index)
                     return
 
         # Check for tower collisions
@@ -84,7 +87,7 @@ class GrenadeProjectile(Projectile):
                 if dist_sq <= (GRID_SIZE * 0.8)**2:  # Tower collision radius
                     self.bounces_remaining -= 1
                     if self.bounces_remaining <= 0:
-                        self.detonate(enemies)
+                        self.detonate(enemies, enemy_index)
                         return
                     
                     # Calculate bounce direction
@@ -101,8 +104,10 @@ class GrenadeProjectile(Projectile):
                     self.vx = new_velocity.x
                     self.vy = new_velocity.y
 
-    def detonate(self, enemies):
-        """Create explosion effect and deal damage in radius."""
+    def detonate(self, enemies, enemy_index=None):
+        """Create explosion effect and deal damage in radius.
+           If an enemy_index (EnemySpatialHash) is given, only enemies near the blast are checked.
+        """
         self.has_detonated = True
         self.collided = True
         
@@ -125,7 +130,8 @@ class GrenadeProjectile(Projectile):
         
         # Deal damage to enemies in radius
         explosion_radius_sq = self.explosion_radius ** 2
-        for enemy in enemies:
+        nearby_enemies = enemy_index.query_circle(self.x, self.y, self.explosion_radius) if enemy_index is not None else enemies
+        for enemy in nearby_enemies:
             if enemy.health > 0:
                 dx = enemy.x - self.x
                 dy = enemy.y - self.y
@@ -3,6 +3,8 @@ import math
 import random
 # Assuming config might have constants like GRID_SIZE if needed, but keeping minimal for now
 # from config import * 
+from config import GRID_SIZE
+from utils.swept_collision import sweep_all_hits
 
 class OffsetBoomerangProjectile:
     """
@@ -108,12 +110,15 @@ class OffsetBoomerangProjectile:
             # Reached target point, stop velocity for this frame
             self.velocity = pygame.Vector2(0, 0)
 
-    def update(self, time_delta, all_enemies):
-        """Moves the boomerang, handles state changes, and checks for collisions."""
+    def update(self, time_delta, all_enemies, enemy_index=None):
+        """Moves the boomerang, handles state changes, and checks for collisions.
+           If an enemy_index (EnemySpatialHash) is given, only enemies near the boomerang rect are checked.
+        """
         if self.finished:
             return
 
         # 1. Move based on current velocity
+        prev_x, prev_y = self.current_pos.x, self.current_pos.y
         distance_this_frame = self.velocity.length() * time_delta
         self.current_pos += self.velocity * time_delta
         if self.state == self.STATE_OUTGOING:
@@ -155,15 +160,29 @@ class OffsetBoomerangProjectile:
         # 4. Check for collisions with enemies (pass-through damage)
         current_time = pygame.time.get_ticks() / 1000.0 # Get current time for cooldown
         if self.rect:
-            for enemy in all_enemies:
-                if enemy.health > 0 and self.rect.colliderect(enemy.rect):
-                    last_hit = self.recently_hit.get(enemy.enemy_id, 0)
-                    if current_time - last_hit >= self.hit_cooldown:
-                        damage = random.uniform(self.damage_min, self.damage_max)
-                        enemy.take_damage(damage, self.damage_type)
-                        self.recently_hit[enemy.enemy_id] = current_time
-                        #print(f"Boomerang hit {enemy.enemy_id} for {damage:.2f} damage.")
-                        # Note: Boomerang continues, doesn't stop on hit
+            # Enemies swept over during the move (circle inscribed in the boomerang + a half-tile enemy),
+            # in path order, then anything the rect overlaps at its new position
+            sweep_radius = (min(self.rect.width, self.rect.height) + GRID_SIZE) / 2
+            hit_enemies = [enemy for enemy, _ in sweep_all_hits(prev_x, prev_y, self.current_pos.x, self.current_pos.y,
+                                                                sweep_radius, all_enemies, enemy_index,
+                                                                predicate=lambda e: e.health > 0)]
+            nearby_enemies = all_enemies
+            if enemy_index is not None:
+                # Enemy rects are one tile wide, so pad the box by a tile to catch overlapping edges
+                pad = enemy_index.cell_size
+                nearby_enemies = enemy_index.query_aabb(self.rect.left - pad, self.rect.top - pad,
+                                                        self.rect.right + pad, self.rect.bottom + pad)
+            for enemy in nearby_enemies:
+                if enemy.health > 0 and enemy not in hit_enemies and self.rect.colliderect(enemy.rect):
+                    hit_enemies.append(enemy)
+            for enemy in hit_enemies:
+                last_hit = self.recently_hit.get(enemy.enemy_id, 0)
+                if current_time - last_hit >= self.hit_cooldown:
+                    damage = random.uniform(self.damage_min, self.damage_max)
+                    enemy.take_damage(damage, self.damage_type)
+                    self.recently_hit[enemy.enemy_id] = current_time
+                    #print(f"Boomerang hit {enemy.enemy_id} for {damage:.2f} damage.")
+                    # Note: Boomerang continues, doesn't stop on hit
 
         # 5. Rotate visual asset (if image loaded)
         if self.image:
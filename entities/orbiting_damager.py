@@ -47,7 +47,7 @@ class OrbitingDamager:
         self.x = self.parent_tower.x + self.orbit_radius * math.cos(angle_rad)
         self.y = self.parent_tower.y + self.orbit_radius * math.sin(angle_rad)
 
-    def update(self, time_delta, all_enemies, current_time):
+    def update(self, time_delta, all_enemies, current_time, enemy_index=None):
         """
         Update the orbiter's position and check for collisions.
 
@@ -55,6 +55,7 @@ class OrbitingDamager:
             time_delta: Time elapsed since the last frame.
             all_enemies: List of all active Enemy objects.
             current_time: The current game time in seconds.
+            enemy_index: Optional EnemySpatialHash; when given only nearby enemies are checked.
             
         Returns:
             False (unless lifetime logic is added later).
@@ -67,6 +68,9 @@ class OrbitingDamager:
         self._update_position()
 
         # 3. Collision Check
+        if enemy_index is not None:
+            # 16 matches the enemy_radius_approx estimate used below
+            all_enemies = enemy_index.query_circle(self.x, self.y, self.collision_radius + 16)
         for enemy in all_enemies:
             if enemy.health <= 0:
                 continue
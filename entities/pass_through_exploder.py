@@ -3,6 +3,7 @@ import math
 from config import GRID_SIZE # Assuming GRID_SIZE is in config
 # from .effect import Effect # Import if needed for explosion visual
 from .effect import Effect 
+from utils.swept_collision import sweep_all_hits
 
 # Need os for path joining
 import os 
@@ -81,7 +82,7 @@ class PassThroughExploder:
 
         print(f"Launched {self.asset_id} towards ({self.dir_x:.2f}, {self.dir_y:.2f}), max dist: {self.fixed_travel_distance_pixels:.1f}px")
 
-    def update(self, time_delta, all_enemies, current_time):
+    def update(self, time_delta, all_enemies, current_time, enemy_index=None):
         """
         Move the entity, check for pass-through collisions, and check max distance.
 
@@ -89,6 +90,7 @@ class PassThroughExploder:
             time_delta: Time elapsed since the last frame.
             all_enemies: List of all active Enemy objects.
             current_time: The current game time in seconds.
+            enemy_index: Optional EnemySpatialHash; when given only enemies near the segment are checked.
 
         Returns:
             True if the entity should be removed (e.g., max distance reached), False otherwise.
@@ -109,52 +111,23 @@ class PassThroughExploder:
         self.y += delta_y
         self.distance_traveled += move_dist
 
-        # 2. Pass-Through Collision Check
-        segment_vec_x = self.x - prev_x
-        segment_vec_y = self.y - prev_y
-        segment_len_sq = segment_vec_x**2 + segment_vec_y**2
-
-        if segment_len_sq > 1e-6: # Avoid division by zero if no movement
-            for enemy in all_enemies:
-                if enemy.health <= 0:
-                    continue
-
-                # Estimate enemy radius (consistent with OrbitingDamager, maybe centralize later)
-                enemy_radius_approx = 16
-                enemy_radius_sq = enemy_radius_approx**2
-
-                # Vector from segment start to enemy center
-                w_x = enemy.x - prev_x
-                w_y = enemy.y - prev_y
-
-                # Project W onto segment vector V
-                dot_w_v = w_x * segment_vec_x + w_y * segment_vec_y
-                t = dot_w_v / segment_len_sq
-
-                # Clamp t to the segment [0, 1]
-                t_clamped = max(0, min(1, t))
-
-                # Find the closest point on the segment to the enemy center
-                closest_x = prev_x + t_clamped * segment_vec_x
-                closest_y = prev_y + t_clamped * segment_vec_y
-
-                # Check distance squared from closest point to enemy center
-                dist_sq_to_enemy = (closest_x - enemy.x)**2 + (closest_y - enemy.y)**2
-
-                # Collision if distance squared is less than enemy radius squared
-                if dist_sq_to_enemy < enemy_radius_sq:
-                    # Collision detected!
-                    last_hit = self.pass_through_hit_times.get(enemy.enemy_id, -1.0)
-                    if current_time - last_hit > self.pass_through_hit_cooldown:
-                        #print(f"PassThroughExploder ({self.asset_id}) hit {enemy.enemy_id}")
-                        enemy.take_damage(self.pass_through_damage, self.pass_through_damage_type)
-                        self.pass_through_hit_times[enemy.enemy_id] = current_time
+        # 2. Pass-Through Collision Check (swept along this frame's move, hits applied in path order)
+        # Estimate enemy radius (consistent with OrbitingDamager, maybe centralize later)
+        enemy_radius_approx = 16
+        hits = sweep_all_hits(prev_x, prev_y, self.x, self.y, enemy_radius_approx, all_enemies, enemy_index,
+                              predicate=lambda e: e.health > 0)
+        for enemy, _ in hits:
+            last_hit = self.pass_through_hit_times.get(enemy.enemy_id, -1.0)
+            if current_time - last_hit > self.pass_through_hit_cooldown:
+                #print(f"PassThroughExploder ({self.asset_id}) hit {enemy.enemy_id}")
+                enemy.take_damage(self.pass_through_damage, self.pass_through_damage_type)
+                self.pass_through_hit_times[enemy.enemy_id] = current_time
 
         # 3. Check Max Distance Reached
         if self.distance_traveled >= self.fixed_travel_distance_pixels:
             #print(f"{self.asset_id} reached max distance.")
             self.is_active = False # Stop moving/damaging
-            explosion_effect = self.trigger_explosion(all_enemies) # Handle explosion effect
+            explosion_effect = self.trigger_explosion(all_enemies, enemy_index) # Handle explosion effect
             if explosion_effect:
                 # Add the effect to the scene via the parent tower's callback
                 self.game_scene_add_effect_callback(explosion_effect)
@@ -168,7 +141,7 @@ class PassThroughExploder:
     #     # TODO: Implement geometry check here
     #     return False
 
-    def trigger_explosion(self, all_enemies):
+    def trigger_explosion(self, all_enemies, enemy_index=None):
         """ Handle the explosion effect at the end location. 
             Returns the created visual Effect instance, or None.
         """
@@ -176,7 +149,8 @@ class PassThroughExploder:
         explosion_radius_sq = self.explosion_radius_pixels ** 2
         enemies_hit = 0
 
-        for enemy in all_enemies:
+        nearby_enemies = enemy_index.query_circle(self.x, self.y, self.explosion_radius_pixels) if enemy_index is not None else all_enemies
+        for enemy in nearby_enemies:
             if enemy.health <= 0:
                 continue
 
@@ -3,11 +3,15 @@
 import pygame
 import math
 import random # Import random module
+import heapq
 from config import *
 # Import GroundEffectZone
 from entities.effect import GroundEffectZone
 # Import base Effect class as well
 from .effect import Effect
+from utils.targeting import select_closest
+from utils.swept_collision import sweep_first_hit, sweep_hit_t
+from utils.tower_specs import SpecialEffect
 # Need os for path joining
 import os 
 
@@ -20,7 +24,8 @@ class Projectile:
                  source_tower=None, is_crit=False, special_effect=None,
                  damage_type="normal", pierce_adjacent=0,
                  bounces_remaining=0, bounce_range_pixels=0, bounce_damage_falloff=0.7,
-                 hit_enemies_in_sequence=None, asset_loader=None, is_visual_only=False):
+                 hit_enemies_in_sequence=None, asset_loader=None, is_visual_only=False,
+                 defer_impact=False):
         """
         Initialize a projectile. Can be homing (target_enemy) or straight-flying (direction_angle).
         
@@ -44,6 +49,7 @@ class Projectile:
         :param hit_enemies_in_sequence: Set of Enemy objects hit in sequence
         :param asset_loader: Function to load images (optional)
         :param is_visual_only: Boolean indicating if the projectile is visual only
+        :param defer_impact: Opt in to deferred impact (hit time computed at launch, see begin_deferred_impact)
         """
         self.x = start_x
         self.y = start_y
@@ -89,6 +95,16 @@ class Projectile:
         self.destination_y = self.y
         # <<< END ADDED >>>
 
+        # --- NEW: Deferred impact state (homing shots resolved from the scene's timing wheel) ---
+        self.defer_impact = defer_impact and DEFERRED_IMPACT_PROJECTILES
+        self.impact_time = None # Scheduled hit time while deferred, None while simulated
+        self.launch_x = self.x
+        self.launch_y = self.y
+        self.launch_time = 0.0
+        self.impact_x = self.x # Predicted hit point
+        self.impact_y = self.y
+        self.target_teleport_count = 0
+
         # Determine movement type and initial angle
         if target_enemy is not None:
             # Homing projectile: Calculate initial world angle towards target
@@ -119,27 +135,20 @@ class Projectile:
             self.collided = True # Mark as collided immediately
 
         # --- Store Special Data if Relevant --- 
-        self.special_on_kill_data = None
-        self.shatter_data = None # NEW: For Shatter effect
-        self.max_hp_reduction_data = None # For Max HP Reduction
+        self.shatter_data = None # Shatter damage bonus (checked in apply_damage)
         self.ignore_armor_data = None # For Chance Ignore Armor
+        # On-hit / on-kill handlers bound to the source tower's effect (see utils/effect_registry.py)
+        self.hit_handler = None
+        self.kill_handler = None
 
         if source_tower and source_tower.special:
-            effect = source_tower.special.get("effect")
-            # print(f"DEBUG Projectile Init: Tower '{source_tower.tower_id}' has effect: '{effect}'") # Optional finer debug
-            if effect == "gold_on_kill":
-                 self.special_on_kill_data = source_tower.special
-                 #print(f"DEBUG: Projectile {self.projectile_id} initialized with gold_on_kill data.") # Optional Debug
-            elif effect == "shatter": # NEW CHECK
+            effect = source_tower.spec.effect
+            self.hit_handler = source_tower.effect_hooks.on_hit
+            self.kill_handler = source_tower.effect_hooks.on_kill
+            if effect == SpecialEffect.SHATTER:
                 self.shatter_data = source_tower.special
-                #print(f"DEBUG: Projectile {self.projectile_id} initialized with shatter data.") # Optional Debug
-            elif effect == "max_hp_reduction_on_hit": # NEW CHECK
-                 self.max_hp_reduction_data = source_tower.special
-                 #print(f"DEBUG: Projectile {self.projectile_id} initialized with max_hp_reduction data.")
-            elif effect == "chance_ignore_armor_on_hit": # NEW CHECK
-                 self.ignore_armor_data = source_tower.special
-                 #print(f"DEBUG: Projectile {self.projectile_id} initialized with chance_ignore_armor data.")
-            # else: print(f"DEBUG Projectile Init: Effect '{effect}' not handled for special data.") # Optional else debug
+            elif effect == SpecialEffect.CHANCE_IGNORE_ARMOR_ON_HIT:
+                self.ignore_armor_data = source_tower.special
         # --- End Store Special Data ---
 
         # --- Load Impact Effect Image (General) --- 
@@ -171,14 +180,79 @@ class Projectile:
             return True  # Still lingering
         return False  # Not lingering
 
-    def move(self, time_delta, enemies):
-        """Move the projectile towards its target (if homing) or in a straight line."""
+    # --- NEW: Deferred impact ---
+    def begin_deferred_impact(self, current_time):
+        """
+        Work out when this homing shot reaches its target and stop simulating it.
+        The scene schedules the hit at self.impact_time. Returns False if not eligible.
+        """
+        target = self.target
+        if (not self.defer_impact or self.collided or self.impact_time is not None or
+                target is None or target.health <= 0 or type(self) is not Projectile):
+            return False
+        hit_radius = GRID_SIZE * 0.4
+        aim_x, aim_y = target.x, target.y
+        flight_time = 0.0
+        for _ in range(3): # Lead the target along its path (enemy speed is per frame)
+            distance = math.sqrt((aim_x - self.x)**2 + (aim_y - self.y)**2)
+            flight_time = max(0.0, distance - hit_radius) / self.speed
+            aim_x, aim_y = target.predict_position(flight_time * FPS)
+        self.launch_x = self.x
+        self.launch_y = self.y
+        self.launch_time = current_time
+        self.impact_time = current_time + flight_time
+        self.impact_x = aim_x
+        self.impact_y = aim_y
+        self.target_teleport_count = target.teleport_count
+        return True
+
+    def sync_deferred_position(self, current_time):
+        """Place a deferred shot on the line from its launch point to the target (drawing only)."""
+        if self.impact_time is None:
+            return
+        flight_time = self.impact_time - self.launch_time
+        progress = 1.0 if flight_time <= 0 else max(0.0, min(1.0, (current_time - self.launch_time) / flight_time))
+        target_x, target_y = self.target.x, self.target.y
+        self.x = self.launch_x + (target_x - self.launch_x) * progress
+        self.y = self.launch_y + (target_y - self.launch_y) * progress
+        if abs(target_x - self.x) > 0.001 or abs(target_y - self.y) > 0.001:
+            self.world_angle_degrees = math.degrees(math.atan2(-(target_y - self.y), target_x - self.x))
+
+    def resolve_deferred_impact(self):
+        """
+        Called when impact_time is reached. Returns True if the shot hit (collided is set,
+        call on_collision next); False if the target was teleported meanwhile, in which
+        case the shot carries on as a normal simulated projectile from its predicted hit point.
+        """
+        target = self.target
+        self.impact_time = None
+        if target.teleport_count != self.target_teleport_count:
+            self.x = self.impact_x
+            self.y = self.impact_y
+            self.destination_x = target.x
+            self.destination_y = target.y
+            return False
+        self.x = target.x
+        self.y = target.y
+        self.destination_x = target.x
+        self.destination_y = target.y
+        self.collided = True
+        if target.health > 0:
+            self.hit_enemy = target # Same as a live-target hit in move(); a dead target just lands at its last spot
+        return True
+    # --- END Deferred impact ---
+
+    def move(self, time_delta, enemies, enemy_index=None):
+        """Move the projectile towards its target (if homing) or in a straight line.
+           If an enemy_index (EnemySpatialHash) is given, only nearby enemies are checked.
+        """
         if self.collided:
             return # Already collided or expired
 
         # --- Non-Homing Logic ---
         if self.target is None:
             # Update position based on velocity
+            prev_x, prev_y = self.x, self.y
             delta_x = self.vx * time_delta
             delta_y = self.vy * time_delta
             self.x += delta_x
@@ -188,28 +262,24 @@ class Projectile:
             dist_moved_sq = delta_x**2 + delta_y**2
             self.distance_traveled_sq += dist_moved_sq
 
+            # Check for collision along the whole move (swept, so fast shots can't skip over enemies)
+            enemy, _ = sweep_first_hit(prev_x, prev_y, self.x, self.y, GRID_SIZE * 0.4, enemies, enemy_index,
+                                       predicate=lambda e: e.health > 0)
+            if enemy is not None:
+                #print(f"Non-homing projectile {self.projectile_id} collided with {enemy.enemy_id}.")
+                self.collided = True
+                self.hit_enemy = enemy # Store the enemy that was actually hit
+                # Optional: Snap position to enemy center on collision
+                self.x = enemy.x
+                self.y = enemy.y
+                return # <<< RETURN HERE (after collision)
+
             # Check for max range expiry
             if self.distance_traveled_sq >= self.max_distance_sq:
                 #print(f"Non-homing projectile {self.projectile_id} expired (max range).")
                 self.collided = True
                 return # <<< RETURN HERE
 
-            # Check for collision with any enemy
-            collision_radius_sq = (GRID_SIZE * 0.4)**2 # Adjust as needed
-            for enemy in enemies:
-                if enemy.health > 0:
-                    dx = enemy.x - self.x
-                    dy = enemy.y - self.y
-                    dist_sq = dx**2 + dy**2
-                    if dist_sq <= collision_radius_sq:
-                        #print(f"Non-homing projectile {self.projectile_id} collided with {enemy.enemy_id}.")
-                        self.collided = True
-                        self.hit_enemy = enemy # Store the enemy that was actually hit
-                        # Optional: Snap position to enemy center on collision
-                        self.x = enemy.x
-                        self.y = enemy.y
-                        return # <<< RETURN HERE (after collision)
-
             # If non-homing logic finished without collision or expiry, we're done for this frame.
             return # <<< RETURN HERE (end of non-homing block)
 
@@ -255,26 +325,21 @@ class Projectile:
             self.collided = True
             #print(f"Homing projectile {self.projectile_id} collided upon reaching destination ({self.x:.1f}, {self.y:.1f}).")
         else:
+            prev_x, prev_y = self.x, self.y
             self.x += self.vx * time_delta
             self.y += self.vy * time_delta
-            # Check for collision with LIVE enemies near current position (Standard Collision Logic)
-            collision_radius_sq = (GRID_SIZE * 0.4)**2 
-            for enemy in enemies:
-                # Only check collision with the original target if it's still valid
-                if target_is_valid and enemy == self.target:
-                    if distance_to_destination <= move_dist: # Already handled by reaching destination check
-                        continue
-                    # Check proximity to actual target for collision
-                    dist_sq_to_target = (enemy.x - self.x)**2 + (enemy.y - self.y)**2
-                    if dist_sq_to_target <= collision_radius_sq:
-                        #print(f"Homing projectile {self.projectile_id} collided with LIVE target {enemy.enemy_id}.")
-                        self.collided = True
-                        self.hit_enemy = enemy # Store the live target hit
-                        self.x = enemy.x # Snap to target
-                        self.y = enemy.y
-                        return # Stop processing after hitting live target
-                # Consider if homing projectiles should collide with OTHER live enemies they pass over
-                # If so, add a similar check here for `enemy != self.target`
+            # Check for collision with the LIVE target anywhere along this frame's move
+            if target_is_valid:
+                enemy = self.target
+                if sweep_hit_t(prev_x, prev_y, self.x - prev_x, self.y - prev_y, enemy.x, enemy.y, GRID_SIZE * 0.4) is not None:
+                    #print(f"Homing projectile {self.projectile_id} collided with LIVE target {enemy.enemy_id}.")
+                    self.collided = True
+                    self.hit_enemy = enemy # Store the live target hit
+                    self.x = enemy.x # Snap to target
+                    self.y = enemy.y
+                    return # Stop processing after hitting live target
+            # Consider if homing projectiles should collide with OTHER live enemies they pass over
+            # If so, use sweep_first_hit with a predicate excluding `self.target`
 
     def draw(self, screen, projectile_assets, grid_offset_x=0, grid_offset_y=0):
         """Draw the projectile using its asset image, rotated to face its direction."""
@@ -301,9 +366,10 @@ class Projectile:
             rotated_rect = rotated_image.get_rect(center=(draw_center_x, draw_center_y))
             screen.blit(rotated_image, rotated_rect.topleft)
 
-    def on_collision(self, enemies, current_time, tower_buff_auras=None):
+    def on_collision(self, enemies, current_time, tower_buff_auras=None, enemy_index=None):
         """Handles what happens when the projectile collides with an enemy or reaches its target location.
            Returns a dictionary containing results like damage dealt, new effects, etc.
+           If an enemy_index (EnemySpatialHash) is given, area searches only visit nearby enemies.
         """
         #print(f">>> Entering Projectile.on_collision for {self.projectile_id}") # <<< ADDED DEBUG
         # --- Visual Only Check --- 
@@ -405,7 +471,8 @@ class Projectile:
         else: 
              # If no specific target or target far away, check for any enemy at impact point
              collision_radius_sq = (GRID_SIZE * 0.4)**2 # Small radius to detect collision
-             for enemy in enemies:
+             nearby_enemies = enemy_index.query_circle(self.x, self.y, GRID_SIZE * 0.4) if enemy_index is not None else enemies
+             for enemy in nearby_enemies:
                  if enemy.health > 0 and enemy.type in self.source_tower.targets:
                      dist_sq = (self.x - enemy.x)**2 + (self.y - enemy.y)**2
                      if dist_sq < collision_radius_sq:
@@ -451,34 +518,13 @@ class Projectile:
             
             self.hit_enemies_in_sequence.add(collided_enemy) # Track hit for bounce/pierce
 
-            # --- Apply On-Hit Special Effects from Tower (BEFORE processing projectile effects) ---
-            if self.source_tower and self.source_tower.special: 
-                special_effect = self.source_tower.special.get("effect")
-                if special_effect == "armor_reduction_on_hit":
-                    amount = self.source_tower.special.get("armor_reduction_amount", 1)
-                    # Check if the enemy has the method before calling
-                    if hasattr(collided_enemy, 'reduce_armor'):
-                        collided_enemy.reduce_armor(amount)
-                        #print(f"... applied armor reduction ({amount}) to {collided_enemy.enemy_id}")
-                elif special_effect == "slow":
-                    slow_percentage = self.source_tower.special.get("slow_percentage", 0)
-                    if slow_percentage > 0:
-                        # Calculate slow multiplier (e.g., 50% slow means 0.5x speed)
-                        slow_multiplier = 1.0 - (slow_percentage / 100.0)
-                        # Use the duration from the tower's special effect
-                        slow_duration = self.source_tower.special.get("duration", 1.0)
-                        collided_enemy.apply_status_effect('slow', slow_duration, slow_multiplier, current_time)
-                        #print(f"DEBUG: Projectile slow effect applied - {slow_percentage}% slow (multiplier: {slow_multiplier}) to {collided_enemy.enemy_id}")
-                # Add other on-hit tower specials here (e.g., stun on hit)
-                # elif special_effect == "stun_on_hit": ... 
-            # --- End On-Hit Tower Special Effects ---
+            # On-hit tower specials (slow, bash, shatter, ...) run through the tower's on_hit
+            # handler below, once the target is known to have survived
 
             # --- Trigger Gold On Kill (After damage applied) ---
-            if was_killed and self.special_on_kill_data:
-                chance = self.special_on_kill_data.get("chance_percent", 0)
-                amount = self.special_on_kill_data.get("gold_amount", 0)
-                if amount > 0 and random.random() * 100 < chance:
-                    #print(f"$$$ Gold on Kill triggered for {self.source_tower.tower_id}! Adding {amount} gold.")
+            if was_killed and self.kill_handler:
+                amount = self.kill_handler(self.source_tower, collided_enemy)
+                if amount:
                     results['gold_added'] = amount # Add gold amount to results dictionary
             # --- End Gold On Kill ---
 
@@ -528,10 +574,9 @@ class Projectile:
                     #print(f"+++ Kill registered for Tower {self.source_tower.tower_id} (via projectile). Total kills: {self.source_tower.kill_count}")
                 # --- End Increment --- 
                 # Check for gold on kill (only primary target for projectile)
-                if self.special_on_kill_data:
-                    chance = self.special_on_kill_data.get("chance_percent", 0)
-                    amount = self.special_on_kill_data.get("gold_amount", 0)
-                    if amount > 0 and random.random() * 100 < chance:
+                if self.kill_handler:
+                    amount = self.kill_handler(self.source_tower, collided_enemy)
+                    if amount:
                         results['gold_added'] = results.get('gold_added', 0) + amount
                 # Check for bounty penalty
                 if bounty_triggered:
@@ -543,25 +588,6 @@ class Projectile:
                 effect_result = self.apply_special_effects(collided_enemy, current_time)
                 if effect_result:
                     results['special_effects_applied'].append((collided_enemy, effect_result))
-                
-                # --- NEW: Apply Bash Chance from Source Tower --- 
-                if self.source_tower and self.source_tower.special:
-                    effect_type = self.source_tower.special.get("effect")
-                    if effect_type == "bash_chance":
-                        chance = self.source_tower.special.get("chance_percent", 0)
-                        if random.random() * 100 < chance:
-                            stun_duration = self.source_tower.special.get("stun_duration", 0.1)
-                            if stun_duration > 0:
-                                collided_enemy.apply_status_effect('stun', stun_duration, True, current_time)
-                                #print(f"Projectile from {self.source_tower.tower_id} BASHED {collided_enemy.enemy_id} for {stun_duration}s (Chance: {chance}%)")
-                # --- END Bash Chance --- 
-                
-                # --- Apply Armor Reduction on Hit (from source tower's special) ---
-                if self.source_tower and self.source_tower.special and self.source_tower.special.get("effect") == "armor_reduction_on_hit":
-                    amount = self.source_tower.special.get("armor_reduction_amount", 1)
-                    if hasattr(collided_enemy, 'reduce_armor'):
-                        collided_enemy.reduce_armor(amount)
-                        #print(f"... applied armor reduction ({amount}) to {collided_enemy.enemy_id}")
 
         else:
             #print(f"Projectile reached max distance or target location ({int(impact_pos[0])}, {int(impact_pos[1])}) without hitting valid enemy.")
@@ -581,7 +607,8 @@ class Projectile:
                 
                 #print(f"... applying blast zone (Radius: {blast_radius_pixels:.1f}px, Full Damage: {primary_damage_dealt:.2f})")
                 enemies_blasted = 0
-                for enemy in enemies:
+                nearby_enemies = enemy_index.query_circle(impact_pos[0], impact_pos[1], blast_radius_pixels) if enemy_index is not None else enemies
+                for enemy in nearby_enemies:
                     if (enemy.type in blast_targets and enemy.health > 0 and 
                         enemy != collided_enemy and 
                         (enemy.x - impact_pos[0])**2 + (enemy.y - impact_pos[1])**2 <= blast_radius_sq):
@@ -616,7 +643,8 @@ class Projectile:
             #print(f"... applying splash damage (Radius: {math.sqrt(effective_splash_radius_sq):.1f}, Base Damage: {splash_damage_amount:.2f})")
             
             enemies_splashed = 0
-            for enemy in enemies:
+            nearby_enemies = enemy_index.query_circle(impact_pos[0], impact_pos[1], math.sqrt(effective_splash_radius_sq)) if enemy_index is not None else enemies
+            for enemy in nearby_enemies:
                 if enemy != collided_enemy and enemy.health > 0: 
                     dist_sq = (enemy.x - impact_pos[0])**2 + (enemy.y - impact_pos[1])**2
                     # Use the EFFECTIVE splash radius squared for check
@@ -634,22 +662,18 @@ class Projectile:
             # Find potential bounce targets
             potential_targets = []
             bounce_range_sq = self.bounce_range_pixels ** 2
-            for enemy in enemies:
+            nearby_enemies = enemy_index.query_circle(impact_pos[0], impact_pos[1], self.bounce_range_pixels) if enemy_index is not None else enemies
+            for enemy in nearby_enemies:
                 # Check if enemy is valid target, alive, within range, and not already hit in this sequence
                 if (enemy.health > 0 and
                     enemy.type in self.source_tower.targets and
                     enemy not in self.hit_enemies_in_sequence and
                     (enemy.x - impact_pos[0])**2 + (enemy.y - impact_pos[1])**2 <= bounce_range_sq):
-                    # Calculate distance squared for sorting
-                    dist_sq = (enemy.x - impact_pos[0])**2 + (enemy.y - impact_pos[1])**2
-                    potential_targets.append((dist_sq, enemy))
+                    potential_targets.append(enemy)
 
             if potential_targets:
-                # Sort by distance (closest first)
-                potential_targets.sort(key=lambda item: item[0])
-                
-                # Select the closest valid target
-                bounce_target = potential_targets[0][1]
+                # Select the closest valid target (single pass, no sort)
+                bounce_target = select_closest(impact_pos[0], impact_pos[1], potential_targets)
                 #print(f"... bouncing from {collided_enemy.enemy_id} to {bounce_target.enemy_id} ({self.bounces_remaining} bounces left)")
 
                 # Calculate bounced projectile damage
@@ -688,7 +712,8 @@ class Projectile:
             # Set pierce search radius to 175 pixels (squared for efficiency)
             pierce_range_sq = 175**2 
             # print(f"[Pierce Check] Search Radius Squared: {pierce_range_sq:.1f}") # DEBUG
-            for enemy in enemies:
+            nearby_enemies = enemy_index.query_circle(impact_pos[0], impact_pos[1], 175) if enemy_index is not None else enemies
+            for enemy in nearby_enemies:
                  if (enemy.health > 0 and 
                      enemy != collided_enemy and 
                      enemy not in self.hit_enemies_in_sequence and
@@ -698,8 +723,9 @@ class Projectile:
                         potential_pierce_targets.append((dist_sq, enemy))
                         # print(f"[Pierce Check]   -> Potential Target: {enemy.enemy_id} (DistSq: {dist_sq:.1f})") # DEBUG
             if potential_pierce_targets:
-                potential_pierce_targets.sort()
-                for dist_sq, enemy_to_pierce in potential_pierce_targets:
+                # Only the closest pierce_adjacent targets can be hit, so take those instead of sorting them all
+                closest_pierce_targets = heapq.nsmallest(self.pierce_adjacent, potential_pierce_targets, key=lambda item: item[0])
+                for dist_sq, enemy_to_pierce in closest_pierce_targets:
                     if pierced_count >= self.pierce_adjacent:
                         break
                     if enemy_to_pierce.health > 0:
@@ -726,10 +752,9 @@ class Projectile:
                                 #print(f"+++ Kill registered for Tower {self.source_tower.tower_id} (via pierce). Total kills: {self.source_tower.kill_count}")
                             # --- End Increment --- 
                             # Gold on kill for pierced?
-                            if self.special_on_kill_data:
-                                chance = self.special_on_kill_data.get("chance_percent", 0)
-                                amount = self.special_on_kill_data.get("gold_amount", 0)
-                                if amount > 0 and random.random() * 100 < chance:
+                            if self.kill_handler:
+                                amount = self.kill_handler(self.source_tower, enemy_to_pierce)
+                                if amount:
                                     results['gold_added'] = results.get('gold_added', 0) + amount
                         pierced_count += 1
         # --- End Pierce Adjacent --- 
@@ -883,32 +908,11 @@ class Projectile:
         return damage_result_dict
 
     def apply_special_effects(self, enemy, current_time):
-        """Applies special effects associated with THIS projectile to the enemy."""
-        # --- Shatter Effect ---
-        if self.shatter_data:
-            chance = self.shatter_data.get("chance_percent", 0)
-            if random.random() * 100 < chance:
-                # Apply a significant temporary armor reduction
-                reduction = self.shatter_data.get("armor_reduction", 9999)
-                duration = self.shatter_data.get("duration", 1.0)
-                if hasattr(enemy, 'apply_timed_armor_reduction'):
-                    enemy.apply_timed_armor_reduction(reduction, duration, current_time)
-                    #print(f"!!! Projectile {self.projectile_id} Shattered {enemy.enemy_id}'s armor by {reduction} for {duration}s! (Chance: {chance}%)")
-                    return "shatter" # Return effect name
-
-        # --- Max HP Reduction --- # NEW
-        if self.max_hp_reduction_data:
-            percentage = self.max_hp_reduction_data.get("reduction_percentage", 0)
-            if percentage > 0 and hasattr(enemy, 'reduce_max_hp_percentage'):
-                original_max_hp = enemy.max_hp
-                enemy.reduce_max_hp_percentage(percentage)
-                #print(f"... applied max HP reduction ({percentage}%) to {enemy.enemy_id}. HP: {original_max_hp:.1f} -> {enemy.max_hp:.1f}")
-                return "max_hp_reduction" # Return effect name
-
-        # --- Chance Ignore Armor ---
-        # Note: This is handled directly in apply_damage as it modifies the damage calculation itself
-        
-        # Add other projectile-specific effects here
-        # elif self.some_other_projectile_effect_data: ...
-        
-        return None # Return None if no relevant effect applied
\ No newline at end of file
+        """Applies the source tower's on-hit effect to an enemy that survived the hit.
+        Returns the effect name when one was recorded (e.g. "shatter"), else None.
+        """
+        # Chance Ignore Armor and the shatter damage bonus are handled in apply_damage,
+        # as they modify the damage calculation itself
+        if self.hit_handler is None:
+            return None
+        return self.hit_handler(self.source_tower, enemy, current_time)
@@ -11,15 +11,20 @@ import json # Import json for loading armor data
 from .pass_through_exploder import PassThroughExploder # ADD THIS IMPORT
 from entities.offset_boomerang_projectile import OffsetBoomerangProjectile # <<< ADDED IMPORT
 from entities.orbiting_damager import OrbitingDamager
+from utils.targeting import TargetSelector, CLOSEST
 # from entities.orbiting_orbs_effect import OrbitingOrbsEffect # Removed import
 from entities.effect import Effect, FloatingTextEffect, ChainLightningVisual, RisingFadeEffect, GroundEffectZone # Added GroundEffectZone
 from entities.harpoon_projectile import HarpoonProjectile
 from entities.grenade_projectile import GrenadeProjectile
 from entities.cluster_projectile import ClusterProjectile
-from .double_strike_effect import DoubleStrikeEffect
-from .every_nth_strike_effect import EveryNthStrikeEffect
 from .strategic_strike_effect import StrategicStrikeEffect
 from entities.effects.rampage_effect import RampageEffect # <<< ADD IMPORT
+from utils.tower_specs import get_tower_spec, SpecialEffect
+from utils.effect_registry import hooks_for
+# Importing the hook modules registers their special-effect handlers
+import entities.effects.tower_effect_hooks
+import entities.effects.hit_effect_hooks
+import entities.effects.enemy_aura_hooks
 
 class Tower:
     def __init__(self, x, y, tower_id, tower_data):
@@ -44,36 +49,38 @@ class Tower:
         #print(f"DEBUG Tower INIT: Assigned self.tower_id = {self.tower_id}")
         # -------------------
         self.tower_data = tower_data
+        # Compiled once per tower type and shared; frame-loop code reads this instead of tower_data
+        self.spec = get_tower_spec(tower_id, tower_data)
+        spec = self.spec
         
         # Size properties (Grid units)
-        self.grid_width = tower_data.get('grid_width', 1)
-        self.grid_height = tower_data.get('grid_height', 1)
+        self.grid_width = spec.grid_width
+        self.grid_height = spec.grid_height
         
         # New mechanics from JSON
-        self.critical_chance = tower_data.get('critical_chance', 0.0)
-        self.critical_multiplier = tower_data.get('critical_multiplier', 1.0)
-        self.bounce = tower_data.get('bounce', 0)
-        # self.splash = tower_data.get('splash', None) # Requires splash_radius
-        # Read splash radius in abstract units and convert to pixels
-        json_splash_radius = tower_data.get('splash_radius', 0)
-        # Handle case where splash_radius might be explicitly null/None in JSON
-        if json_splash_radius is None:
-            json_splash_radius = 0
-        # Store the original abstract unit value    
-        self.splash_radius = json_splash_radius
-        # Calculate and store pixel value (or move this calc to calculate_derived_stats)
-        self.splash_radius_pixels = json_splash_radius * (GRID_SIZE / 200.0)
-        self.targets = tower_data.get('targets', ["ground"]) # Default to ground
-        self.target_armor_type = tower_data.get('target_armor_type', []) # Load specific armor types this tower can target, default to empty (no restriction)
-        self.special = tower_data.get('special', None)
-        self.attack_type = tower_data.get('attack_type', 'projectile')
-        self.projectile_speed = tower_data.get('projectile_speed', None) # Default to None
+        self.critical_chance = spec.critical_chance
+        self.critical_multiplier = spec.critical_multiplier
+        self.bounce = spec.bounce
+        # Splash radius: abstract units (null in the JSON reads as 0) and pixels
+        self.splash_radius = spec.splash_radius
+        self.splash_radius_pixels = spec.splash_radius_pixels
+        self.targets = spec.targets # Default to ground
+        self.target_mask = spec.target_mask # Same targets as bits (see utils.tower_specs)
+        self.target_armor_type = spec.target_armor_type # Load specific armor types this tower can target, default to empty (no restriction)
+        self.special = tower_data.get('special', None) # Raw dict, for code outside the frame loop
+        self.special_spec = spec.special # Compiled special block (None if the tower has none)
+        self.effect_hooks = hooks_for(spec.effect) # Handlers registered for this tower's effect (shared per effect)
+        self.attack_type = spec.attack_type
+        self.projectile_speed = spec.projectile_speed # Default to None
         #print(f"INIT Tower {self.tower_id}: Attack Type = {self.attack_type}, ProjSpeed = {self.projectile_speed}")
         
         # Beam specific state
-        self.beam_color = tower_data.get('beam_color', None) # Load optional beam color
-        self.beam_max_targets = tower_data.get('beam_max_targets', 1) # Max simultaneous beam targets
+        self.beam_color = spec.beam_color # Load optional beam color
+        self.beam_max_targets = spec.beam_max_targets # Max simultaneous beam targets
         self.beam_targets = [] # List of current Enemy objects being targeted
+        # Target priority resolved once by name ("closest", "furthest", "highest_health", "lowest_health", "first", "last", "random")
+        self.target_priority = spec.target_priority
+        self.target_selector = TargetSelector(self.target_priority)
         self.next_damage_time = 0 
         self.active_drain_effect = None # NEW: Store active drain particle effect instance
         # Laser Painter State
@@ -102,14 +109,14 @@ class Tower:
         self.y = self.center_grid_y * GRID_SIZE + GRID_SIZE // 2
         
         # Base stats (used if type-specific stats aren't present)
-        self.base_damage_min = tower_data.get('damage_min', 0)
-        self.base_damage_max = tower_data.get('damage_max', 0)
-        self.base_attack_speed = tower_data.get('attack_speed', 1.0)
+        self.base_damage_min = spec.damage_min
+        self.base_damage_max = spec.damage_max
+        self.base_attack_speed = spec.attack_speed
         # Load type-specific stats if they exist
-        self.stats_ground = tower_data.get('stats_ground', None)
-        self.stats_air = tower_data.get('stats_air', None)
+        self.stats_ground = spec.stats_ground
+        self.stats_air = spec.stats_air
         # Store damage type
-        self.damage_type = tower_data.get('damage_type', 'normal')
+        self.damage_type = spec.damage_type
         
         # Initialize salvo attack state
         self.salvo_shots_remaining = 0
@@ -128,25 +135,21 @@ class Tower:
         
         # Convert abstract range units (from JSON) to pixel radius
         # User defined scale: 200 range units = 1 tile = GRID_SIZE pixels
-        json_range = tower_data.get('range', 200) # Default to 1 tile range (200 units)
-        json_range_min = tower_data.get('range_min', 0) # Default minimum range to 0
-        self.range = json_range * (GRID_SIZE / 200.0) # Calculate max pixel radius
-        self.range_min_pixels = json_range_min * (GRID_SIZE / 200.0) # Calculate min pixel radius
+        self.range = spec.range_pixels # Max pixel radius (default 1 tile)
+        self.range_min_pixels = spec.range_min_pixels # Min pixel radius
         
         # --- Bounce Parameters (New) ---
-        self.bounce = tower_data.get('bounce', 0)
-        json_bounce_range = tower_data.get('bounce_range', 300) # Default 300 abstract units
-        self.bounce_range_pixels = json_bounce_range * (GRID_SIZE / 200.0)
-        self.bounce_damage_falloff = tower_data.get('bounce_damage_falloff', 0.5) # Changed default from 0.7 to 0.5
+        self.bounce_range_pixels = spec.bounce_range_pixels # Default 300 abstract units
+        self.bounce_damage_falloff = spec.bounce_damage_falloff # Changed default from 0.7 to 0.5
         # --- End Bounce Parameters ---
         
         # --- Pierce Parameter --- 
-        self.pierce_adjacent = tower_data.get('pierce_adjacent', 0) # Load pierce amount
+        self.pierce_adjacent = spec.pierce_adjacent # Load pierce amount
         # --- End Pierce Parameter ---
         
         # self.range = tower_data.get('range', 3) * GRID_SIZE # Old category logic removed
         self.cost = tower_data['cost']
-        self.description = tower_data.get('description', '')
+        self.description = spec.description
         self.last_pulse_time = 0 # For aura pulse effects
         
         # Basic properties
@@ -154,14 +157,10 @@ class Tower:
         # Directly read attack_interval from data, default if necessary
         # self.attack_interval = tower_data.get('attack_interval', 1.0) 
         # Use attack_speed to calculate interval if interval isn't specified
-        self.attack_interval = tower_data.get('attack_interval', 1.0 / self.base_attack_speed)
-        
-        # Calculate and store aura radius in pixels if applicable
-        self.aura_radius_pixels = 0
-        aura_units = 0
-        if self.special and 'aura_radius' in self.special:
-            aura_units = self.special.get('aura_radius', 0)
-        self.aura_radius_pixels = aura_units * (GRID_SIZE / 200.0)
+        self.attack_interval = spec.attack_interval
+        
+        # Aura radius in pixels if applicable
+        self.aura_radius_pixels = spec.special.aura_radius_pixels if spec.special else 0
         #print(f"DEBUG: {self.tower_id} aura radius set to {self.aura_radius_pixels} pixels")
         
         # Initialize unique ability if tower has one
@@ -192,7 +191,7 @@ class Tower:
         # --- End Orbiter List ---
 
         # --- NEW: Initialize Orbiting Damagers if applicable ---
-        if self.special and self.special.get('effect') == 'orbiting_damager':
+        if spec.effect == SpecialEffect.ORBITING_DAMAGER:
             orb_count = self.special.get('orb_count', 3) # Default to 3 orbs
             base_angle_offset = 360.0 / orb_count
             for i in range(orb_count):
@@ -215,6 +214,9 @@ class Tower:
 
         # --- NEW: Pulsed Buff State ---
         self.pulsed_buffs = {} # Stores temporary buffs like { 'crit_damage': {'value': 0.5, 'end_time': 123.4} }
+        self.pulsed_buff_version = 0 # Bumped whenever a pulsed buff is applied
+        self.buff_resolver = None # Set by the scene's BuffResolver; caches get_buffed_stats
+        self.adjacency_graph = None # Set by the scene's TowerAdjacencyGraph while this tower is placed
         # --- END Pulsed Buff State ---
 
         # --- NEW: Pulse Animation State ---
@@ -230,13 +232,13 @@ class Tower:
         # Added for projectile asset loading
         self.asset_loader = None
         
-        self.broadside_angle_offset = tower_data.get('broadside_angle_offset', 0)
+        self.broadside_angle_offset = spec.broadside_angle_offset
 
         # --- Load Attack Sound ---
         self.attack_sound = None
         sound_dir = os.path.join("assets", "sounds") # <<< CORRECT
         # Use 'attack_sound' from JSON if available, otherwise use tower_id
-        sound_basename = self.tower_data.get("attack_sound", self.tower_id) # <<< CHANGE THIS LINE
+        sound_basename = spec.attack_sound
         # Try MP3 first, then WAV
         possible_paths = [
             os.path.join(sound_dir, f"{sound_basename}.mp3"),
@@ -313,7 +315,7 @@ class Tower:
                 
         # --- Pass Through Launch Sound (Conditional Loading) ---
         self.pass_through_launch_sound = None
-        if self.special and self.special.get("effect") == "fixed_distance_pass_through_explode":
+        if spec.effect == SpecialEffect.FIXED_DISTANCE_PASS_THROUGH_EXPLODE:
             sound_filename = self.special.get("pass_through_launch_sound_file")
             if sound_filename:
                 launch_sound_path = os.path.join(sound_dir, sound_filename)
@@ -555,8 +557,7 @@ class Tower:
         self.range_pixels = self.range * range_scale_factor if self.range is not None else 0
         
         # Calculate min range in pixels (if min_range is defined in tower_data)
-        json_min_range = self.tower_data.get("min_range")
-        self.range_min_pixels = json_min_range * range_scale_factor if json_min_range is not None else 0
+        self.range_min_pixels = self.spec.min_range_pixels # Legacy "min_range" key
         
         # Convert splash radius (usually in design units) to pixels
         self.splash_radius_pixels = self.splash_radius * range_scale_factor if self.splash_radius is not None else 0
@@ -632,6 +633,18 @@ class Tower:
 
     def get_buffed_stats(self, current_time, tower_buff_auras, all_towers):
         """Calculates effective stats based on active tower buff auras and pulsed buffs."""
+        # --- NEW: Scene aura list goes through the cached resolver ---
+        resolver = self.buff_resolver
+        if resolver is not None and tower_buff_auras is resolver.auras:
+            return resolver.get(self, current_time)
+        return self.apply_dynamic_buffs(self.compute_static_buffs(tower_buff_auras, all_towers), current_time)
+
+    def compute_static_buffs(self, tower_buff_auras, all_towers):
+        """
+        Sum the buffs that only depend on tower placement (auras, adjacency, swarm power).
+
+        :return: Dict of buff totals, turned into effective stats by apply_dynamic_buffs
+        """
         total_speed_bonus_percent = 0.0
         total_damage_bonus_percent = 0.0
         total_crit_chance_bonus = 0.0
@@ -659,27 +672,30 @@ class Tower:
             
             # For adjacency buffs, check if towers share an edge
             if is_adjacent_buff:
-                # Get grid coordinates
-                hq_start_x = aura_tower.top_left_grid_x
-                hq_end_x = hq_start_x + aura_tower.grid_width - 1
-                hq_start_y = aura_tower.top_left_grid_y
-                hq_end_y = hq_start_y + aura_tower.grid_height - 1
-                
-                other_start_x = self.top_left_grid_x
-                other_end_x = other_start_x + self.grid_width - 1
-                other_start_y = self.top_left_grid_y
-                other_end_y = other_start_y + self.grid_height - 1
-                
-                # Check if towers share an edge
-                shares_edge = (
-                    # Tower is directly to the left or right of HQ
-                    (other_end_x == hq_start_x - 1 or other_start_x == hq_end_x + 1) and
-                    (other_end_y >= hq_start_y and other_start_y <= hq_end_y)
-                ) or (
-                    # Tower is directly above or below HQ
-                    (other_end_y == hq_start_y - 1 or other_start_y == hq_end_y + 1) and
-                    (other_end_x >= hq_start_x and other_start_x <= hq_end_x)
-                )
+                if self.adjacency_graph is not None:
+                    shares_edge = self.adjacency_graph.shares_edge(self, aura_tower)
+                else:
+                    # Get grid coordinates
+                    hq_start_x = aura_tower.top_left_grid_x
+                    hq_end_x = hq_start_x + aura_tower.grid_width - 1
+                    hq_start_y = aura_tower.top_left_grid_y
+                    hq_end_y = hq_start_y + aura_tower.grid_height - 1
+                
+                    other_start_x = self.top_left_grid_x
+                    other_end_x = other_start_x + self.grid_width - 1
+                    other_start_y = self.top_left_grid_y
+                    other_end_y = other_start_y + self.grid_height - 1
+                
+                    # Check if towers share an edge
+                    shares_edge = (
+                        # Tower is directly to the left or right of HQ
+                        (other_end_x == hq_start_x - 1 or other_start_x == hq_end_x + 1) and
+                        (other_end_y >= hq_start_y and other_start_y <= hq_end_y)
+                    ) or (
+                        # Tower is directly above or below HQ
+                        (other_end_y == hq_start_y - 1 or other_start_y == hq_end_y + 1) and
+                        (other_end_x >= hq_start_x and other_start_x <= hq_end_x)
+                    )
                 
                 if not shares_edge:
                     continue  # Skip this buff if towers don't share an edge
@@ -746,6 +762,28 @@ class Tower:
                     active_aura_names.add("Swarm Power") # <<< ADD NAME
         # --- End Swarm Power Check ---
 
+        return {
+            'speed_bonus_percent': total_speed_bonus_percent,
+            'attack_speed_multiplier': total_attack_speed_multiplier,
+            'damage_bonus_percent': total_damage_bonus_percent,
+            'crit_chance_bonus': total_crit_chance_bonus,
+            'crit_multiplier_bonus': total_crit_multiplier_bonus,
+            'air_damage_multiplier': effective_air_damage_multiplier,
+            'splash_radius_increase': total_splash_radius_increase,
+            'active_aura_names': active_aura_names
+        }
+
+    def apply_dynamic_buffs(self, static_buffs, current_time):
+        """Layer pulsed buffs and gattling spin-up over the static buff totals and return effective stats."""
+        total_speed_bonus_percent = static_buffs['speed_bonus_percent']
+        total_attack_speed_multiplier = static_buffs['attack_speed_multiplier']
+        total_damage_bonus_percent = static_buffs['damage_bonus_percent']
+        total_crit_chance_bonus = static_buffs['crit_chance_bonus']
+        total_crit_multiplier_bonus = static_buffs['crit_multiplier_bonus']
+        effective_air_damage_multiplier = static_buffs['air_damage_multiplier']
+        total_splash_radius_increase = static_buffs['splash_radius_increase']
+        active_aura_names = static_buffs['active_aura_names']
+
         # Check for expired pulsed buffs and remove them
         expired_pulsed_keys = [k for k, v in self.pulsed_buffs.items() if current_time >= v['end_time']]
         for key in expired_pulsed_keys:
@@ -915,8 +953,10 @@ class Tower:
             print(f"Error calculating DPS for {self.tower_id}: {e}")
             return 0.0 # Return 0 on error
 
-    def attack(self, target, current_time, all_enemies, tower_buff_auras, grid_offset_x, grid_offset_y, visual_assets=None, all_towers=None):
-        """Perform an attack. Return a list of projectiles, effects, or None."""
+    def attack(self, target, current_time, all_enemies, tower_buff_auras, grid_offset_x, grid_offset_y, visual_assets=None, all_towers=None, enemy_index=None):
+        """Perform an attack. Return a list of projectiles, effects, or None.
+           If an enemy_index (EnemySpatialHash) is given, whip, splash and chain searches only visit nearby enemies.
+        """
         # --- BEGIN ADDED CODE: Self-Destruct Check ---
         if self.special and self.special.get("effect") == "self_destruct":
             print(f"Tower {self.tower_id} has self-destruct effect.")
@@ -1232,10 +1272,17 @@ class Tower:
             elif self.attack_type == 'whip':
                 #print(f"DEBUG: Entered whip attack block for {self.tower_id} at time {current_time:.2f}")
                 # Whip logic needs to find its own targets within range
-                whip_targets_in_range = []
-                for enemy in all_enemies:
-                    if enemy.health > 0 and enemy.type in self.targets and self.is_in_range(enemy.x, enemy.y):
-                        whip_targets_in_range.append(enemy)
+                max_whip_targets = self.special.get("whip_targets", 1)
+                if enemy_index is not None:
+                    # Closest targets straight from the index (same order as the k-best selection below)
+                    whip_targets_in_range = enemy_index.k_nearest(
+                        self.x, self.y, max_whip_targets, max_radius=self.range,
+                        predicate=lambda enemy: enemy.health > 0 and enemy.type in self.targets and self.is_in_range(enemy.x, enemy.y))
+                else:
+                    whip_targets_in_range = []
+                    for enemy in all_enemies:
+                        if enemy.health > 0 and enemy.type in self.targets and self.is_in_range(enemy.x, enemy.y):
+                            whip_targets_in_range.append(enemy)
 
                 if not whip_targets_in_range:
                     #print(f"  DEBUG: Whip attack - No targets found in range.")
@@ -1249,16 +1296,12 @@ class Tower:
 
                 self.last_attack_time = current_time # Update attack time
 
-                # Sort targets by distance (closest first)
-                whip_targets_in_range.sort(key=lambda e: (e.x - self.x)**2 + (e.y - self.y)**2)
-
                 # Get whip parameters from special
-                max_whip_targets = self.special.get("whip_targets", 1)
                 damage_multiplier_first = self.special.get("whip_damage_multiplier", 0.5)
                 visual_duration = self.special.get("whip_visual_duration", 0.2)
 
-                # Select actual targets up to the max count
-                actual_whip_targets = whip_targets_in_range[:max_whip_targets]
+                # Select the closest targets up to the max count (k-best, no full sort)
+                actual_whip_targets = CLOSEST.best_k(self.x, self.y, whip_targets_in_range, max_whip_targets)
                 target_ids = [t.enemy_id for t in actual_whip_targets]
                 #print(f"  DEBUG: Whip attacking targets: {target_ids}")
 
@@ -1361,7 +1404,8 @@ class Tower:
                                                    bounce_damage_falloff=self.bounce_damage_falloff,
                                                    pierce_adjacent=self.pierce_adjacent,
                                                    asset_loader=self.asset_loader, 
-                                                   is_visual_only=False)
+                                                   is_visual_only=False,
+                                                   defer_impact=True)
                     results['projectiles'].append(real_projectile)
                     
                     # Visual Projectile (Right)
@@ -1376,7 +1420,8 @@ class Tower:
                                                      bounce_damage_falloff=self.bounce_damage_falloff,
                                                      pierce_adjacent=self.pierce_adjacent,
                                                      asset_loader=self.asset_loader, 
-                                                     is_visual_only=True) # Mark as visual only
+                                                     is_visual_only=True, # Mark as visual only
+                                                     defer_impact=True)
                     results['projectiles'].append(visual_projectile)
                     # Skip the standard projectile creation below for gattling
             # --- END Gattling Logic --- 
@@ -1519,7 +1564,8 @@ class Tower:
                                               bounce_damage_falloff=self.bounce_damage_falloff,
                                               pierce_adjacent=self.pierce_adjacent,
                                               asset_loader=self.asset_loader,
-                                              is_visual_only=False) 
+                                              is_visual_only=False,
+                                              defer_impact=True) 
                         results['projectiles'].append(projectile)
                 elif self.attack_type == 'instant':
                     #print(f"DEBUG: Executing INSTANT attack for {self.tower_id}") # <<< ADDED DEBUG PRINT
@@ -1721,7 +1767,8 @@ class Tower:
                         #print(f"... Applying INSTANT splash (Radius: {effective_splash_radius_pixels:.1f}, Dmg: {splash_damage:.2f})")
                         
                         enemies_splashed = 0
-                        for enemy in all_enemies:
+                        nearby_enemies = enemy_index.query_circle(target.x, target.y, effective_splash_radius_pixels) if enemy_index is not None else all_enemies
+                        for enemy in nearby_enemies:
                             # Skip primary target and dead enemies
                             if enemy == target or enemy.health <= 0:
                                 continue
@@ -1764,7 +1811,11 @@ class Tower:
                             min_dist_sq = float('inf')
 
                             # Find the closest valid enemy within range of the *current chain target*
-                            for enemy in all_enemies:
+                            if enemy_index is not None:
+                                chain_candidates = enemy_index.query_circle(current_chain_target.x, current_chain_target.y, math.sqrt(radius_pixels_sq))
+                            else:
+                                chain_candidates = all_enemies
+                            for enemy in chain_candidates:
                                 if enemy not in targets_hit and enemy.health > 0:
                                     # Check if enemy type is valid for this tower
                                     if enemy.type not in self.targets:
@@ -1833,33 +1884,10 @@ class Tower:
         # Apply primary damage for instant attacks here -- THIS LINE SHOULD BE REMOVED
         # target.take_damage(initial_damage, self.damage_type) # REMOVED
         
-        # Check for double strike special effect
-        if self.special and self.special.get("effect") == "double_strike":
-            chance = self.special.get("chance_percent", 20)
-            if random.random() * 100 < chance:
-                # Create double strike effect
-                double_strike = DoubleStrikeEffect(self, target, initial_damage, current_time)
-                if self.game_scene_add_effect_callback:
-                    self.game_scene_add_effect_callback(double_strike)
-                #print(f"Double Strike triggered on {target.enemy_id} with {chance}% chance")
-        # REMOVED else block that contained take_damage
-
-        # Check for every_nth_strike special effect
-        if self.special and self.special.get("effect") == "every_nth_strike":
-            self.strike_counter += 1
-            n = self.special.get("n", 5)
-            bonus_damage = self.special.get("bonus_damage", 50)
-            
-            # REMOVED Apply normal damage call from here
-            
-            # Check if it's the nth strike
-            if self.strike_counter >= n:
-                # Create every_nth_strike effect
-                nth_strike = EveryNthStrikeEffect(self, target, bonus_damage, current_time)
-                if self.game_scene_add_effect_callback:
-                    self.game_scene_add_effect_callback(nth_strike)
-                #print(f"Every Nth Strike triggered on {target.enemy_id} (strike {self.strike_counter})")
-                self.strike_counter = 0  # Reset counter
+        # Post-attack effects (double strike, every nth strike) come from the effect registry
+        on_attack = self.effect_hooks.on_attack
+        if on_attack:
+            on_attack(self, target, initial_damage, current_time)
 
         return results
 
@@ -2273,6 +2301,9 @@ class Tower:
     # --- NEW: Adjacency Check Helper --- 
     def count_adjacent_race_towers(self, all_towers, required_race_id):
         """Counts how many towers of a specific race are adjacent to this tower."""
+        # --- NEW: O(1) lookup while placed in the scene's adjacency graph ---
+        if self.adjacency_graph is not None:
+            return self.adjacency_graph.count_race(self, required_race_id)
         count = 0
         
         # Define this tower's bounding box in grid coordinates
@@ -2354,597 +2385,13 @@ class Tower:
         # if self.reaper_handler: self.reaper_handler.update(current_time)
         # --- End Effect Handler Update ---
 
-        # --- Frost Pulse Aura Effect ---
-        if self.special and self.special.get("effect") == "slow_pulse_aura":
-            # Check if it's time for a new pulse
-            if current_time - self.last_pulse_time >= self.special.get("interval", 2.5):
-                self.last_pulse_time = current_time
-                pulse_duration = self.special.get("duration", 1.0)
-                slow_percentage = self.special.get("slow_percentage", 80)
-                slow_multiplier = 1.0 - (slow_percentage / 100.0)
-                targets = self.special.get("targets", ["ground", "air"])
-                
-                # Find enemies in range
-                for enemy in all_enemies:
-                    if enemy.health > 0 and enemy.type in targets:
-                        # Calculate distance to enemy
-                        dx = enemy.x - self.x
-                        dy = enemy.y - self.y
-                        dist_sq = dx*dx + dy*dy
-                        if dist_sq <= self.aura_radius_pixels * self.aura_radius_pixels:
-                            # Apply slow effect
-                            enemy.apply_status_effect('slow', pulse_duration, slow_multiplier, current_time)
-                            #print(f"Frost Pulse from {self.tower_id} slowed {enemy.enemy_id} by {slow_percentage}% for {pulse_duration}s")
-        # --- End Frost Pulse Aura Effect ---
-
-        # --- Miasma Pillar DOT Pulse Effect ---
-        if self.special and self.special.get("effect") == "dot_pulse_aura":
-            # Check if it's time for a new pulse
-            if current_time - self.last_pulse_time >= self.special.get("pulse_interval", 0.5):
-                self.last_pulse_time = current_time
-                pulse_duration = self.special.get("pulse_duration", 5.0)
-                slow_percentage = self.special.get("slow_percentage", 0.3)
-                slow_multiplier = 1.0 - slow_percentage
-                damage = self.special.get("damage", 18.0)
-                damage_type = self.special.get("damage_type", "arcane")
-                targets = self.special.get("targets", ["ground", "air"])
-                
-                # Find enemies in range
-                for enemy in all_enemies:
-                    if enemy.health > 0 and enemy.type in targets:
-                        # Calculate distance to enemy
-                        dx = enemy.x - self.x
-                        dy = enemy.y - self.y
-                        dist_sq = dx*dx + dy*dy
-                        if dist_sq <= self.aura_radius_pixels * self.aura_radius_pixels:
-                            # Apply DOT effect
-                            enemy.apply_dot_effect(
-                                "miasma_pillar",
-                                damage,
-                                self.special.get("pulse_interval", 0.5),
-                                pulse_duration,
-                                damage_type,
-                                current_time
-                            )
-                            # Apply slow effect
-                            enemy.apply_status_effect('slow', pulse_duration, slow_multiplier, current_time)
-                            #print(f"Miasma Pillar from {self.tower_id} applied DOT and slow to {enemy.enemy_id}")
-        # --- End Miasma Pillar DOT Pulse Effect ---
-
-        # --- Vortex Damage Aura Effect ---
-        if self.special and self.special.get("effect") == "vortex_damage_aura":
-            # Check if it's time for a new tick
-            if current_time - self.last_aura_tick_time >= self.special.get("tick_interval", 0.1):
-                self.last_aura_tick_time = current_time
-                min_damage = self.special.get("min_damage_at_edge", 1.0)
-                max_damage = self.special.get("max_damage_at_center", 25.0)
-                damage_type = self.special.get("damage_type", "arcane")
-                targets = self.special.get("targets", ["ground", "air"])
-                
-                # Find enemies in range
-                for enemy in all_enemies:
-                    if enemy.health > 0 and enemy.type in targets:
-                        # Calculate distance to enemy
-                        dx = enemy.x - self.x
-                        dy = enemy.y - self.y
-                        dist_sq = dx*dx + dy*dy
-                        if dist_sq <= self.aura_radius_pixels * self.aura_radius_pixels:
-                            # Calculate damage based on distance (more damage closer to center)
-                            distance = math.sqrt(dist_sq)
-                            distance_ratio = 1.0 - (distance / self.aura_radius_pixels)
-                            damage = min_damage + (max_damage - min_damage) * distance_ratio
-                            
-                            # Apply damage
-                            enemy.take_damage(damage, damage_type)
-                            #print(f"Vortex from {self.tower_id} dealt {damage:.1f} {damage_type} damage to {enemy.enemy_id}")
-        # --- End Vortex Damage Aura Effect ---
-
-        # --- Glacial Heart Bonechill Pulse Effect ---
-        if self.special and self.special.get("effect") == "bonechill_pulse_aura":
-            # Check if it's time for a new pulse
-            if current_time - self.last_pulse_time >= self.special.get("interval", 0.5):
-                self.last_pulse_time = current_time
-                bonechill_duration = self.special.get("bonechill_duration", 4.0)
-                targets = self.special.get("targets", ["ground", "air"])
-                
-                # Find enemies in range
-                for enemy in all_enemies:
-                    if enemy.health > 0 and enemy.type in targets:
-                        # Calculate distance to enemy
-                        dx = enemy.x - self.x
-                        dy = enemy.y - self.y
-                        dist_sq = dx*dx + dy*dy
-                        if dist_sq <= self.aura_radius_pixels * self.aura_radius_pixels:
-                            # Apply bonechill effect
-                            enemy.apply_status_effect('bonechill', bonechill_duration, 1.0, current_time)
-                            #print(f"Glacial Heart from {self.tower_id} applied bonechill to {enemy.enemy_id} for {bonechill_duration}s")
-        # --- End Glacial Heart Bonechill Pulse Effect ---
-
-        # --- Black Hole Generator Damage Pulse Effect ---
-        if self.special and self.special.get("effect") == "damage_pulse_aura":
-            # Check if it's time for a new pulse
-            if current_time - self.last_pulse_time >= self.special.get("interval", 7.0):
-                self.last_pulse_time = current_time
-                pulse_damage = self.special.get("pulse_damage", 4000)
-                pulse_damage_type = self.special.get("pulse_damage_type", "chaos")
-                targets = self.special.get("targets", ["ground", "air"])
-                
-                # Find enemies in range
-                for enemy in all_enemies:
-                    if enemy.health > 0 and enemy.type in targets:
-                        # Calculate distance to enemy
-                        dx = enemy.x - self.x
-                        dy = enemy.y - self.y
-                        dist_sq = dx*dx + dy*dy
-                        if dist_sq <= self.aura_radius_pixels * self.aura_radius_pixels:
-                            # Apply damage
-                            enemy.take_damage(pulse_damage, pulse_damage_type)
-                            #print(f"Black Hole Generator from {self.tower_id} dealt {pulse_damage} {pulse_damage_type} damage to {enemy.enemy_id}")
-        # --- End Black Hole Generator Damage Pulse Effect ---
-
-        # --- Crit Damage Pulse Aura Effect ---
-        if self.special and self.special.get("effect") == "crit_damage_pulse_aura":
-            # Check if it's time for a new pulse
-            if current_time - self.last_pulse_time >= self.special.get("interval", 5.0):
-                self.last_pulse_time = current_time 
-                pulse_duration = self.special.get("duration", 5.0)
-                crit_multiplier_bonus = self.special.get("crit_multiplier_bonus", 0.5)
-                targets = self.special.get("targets", ["towers"])
-                
-                # Find towers in range
-                for tower in all_towers:
-                    if tower != self:  # Don't affect self
-                        # Calculate distance to tower
-                        dx = tower.x - self.x
-                        dy = tower.y - self.y
-                        dist_sq = dx*dx + dy*dy
-                        if dist_sq <= self.aura_radius_pixels * self.aura_radius_pixels:
-                            # Apply crit damage buff
-                            tower.apply_status_effect('crit_damage_buff', pulse_duration, crit_multiplier_bonus, current_time)
-                            #print(f"War Drums from {self.tower_id} buffed {tower.tower_id} with +{crit_multiplier_bonus} crit damage for {pulse_duration}s")
-        # --- End Crit Damage Pulse Aura Effect ---
-
-        # Old rampage decay logic removed, handled by RampageEffect class now.
-
-        # --- Gattling Spin-Down Logic --- 
-        if self.gattling_level > 0 and self.special and self.special.get("effect") == "gattling_spin_up":
-            decay_time = self.special.get("decay_time_sec", 2.0)
-            if current_time - self.gattling_last_attack_time > decay_time:
-                #print(f"Gattling {self.tower_id} spun down from Level {self.gattling_level}.")
-                self.gattling_level = 0
-                self.gattling_continuous_fire_start_time = 0.0
-        # --- END Gattling Spin-Down ---
-                                    
-        # --- Execute Ability Logic --- 
-        if self.special and self.special.get("effect") == "execute" and self.execute_cooldown > 0:
-            # Check cooldown
-            if current_time - self.execute_last_time >= self.execute_cooldown:
-                valid_targets = []
-                # Scan enemies in range
-                for enemy in all_enemies:
-                    # Check if enemy is alive, in range, and meets health threshold
-                    if (enemy.health > 0 and 
-                        self.is_in_range(enemy.x, enemy.y) and
-                        enemy.max_health > 0 and 
-                        (enemy.health / enemy.max_health) <= self.execute_health_threshold):
-                        valid_targets.append(enemy)
-                
-                if valid_targets:
-                    # Choose a target (e.g., the first one found)
-                    target_to_execute = valid_targets[0]
-                    #print(f"!!! {self.tower_id} EXECUTE triggered on {target_to_execute.enemy_id} (HP: {target_to_execute.health}/{target_to_execute.max_health}) !!!")
-                    
-                    # Instantly kill the target
-                    target_to_execute.take_damage(999999, "execute") 
-                    
-                    # Play the special sound if loaded
-                    if self.special_ability_sound:
-                        self.special_ability_sound.play()
-                    
-                    # Reset cooldown
-                    self.execute_last_time = current_time
-
-        # --- Attack Speed Aura Effect ---
-        if self.special and self.special.get("effect") == "attack_speed_aura":
-            # Check if it's time for a new tick
-            if current_time - self.last_aura_tick_time >= 0.1:  # Check every 0.1 seconds
-                self.last_aura_tick_time = current_time
-                speed_multiplier = self.special.get("attack_speed_multiplier", 1.3)
-                required_race = self.special.get("required_race", "zork")
-                
-                #print(f"DEBUG: {self.tower_id} checking attack speed aura (radius: {self.aura_radius_pixels})")
-                
-                # Find towers in range
-                for tower in all_towers:
-                    if tower != self:  # Don't affect self
-                        # Calculate distance to tower
-                        dx = tower.x - self.x
-                        dy = tower.y - self.y
-                        dist_sq = dx*dx + dy*dy
-                        dist = math.sqrt(dist_sq)
-                        
-                        # Check if tower belongs to the required race
-                        tower_race = tower.tower_id.split('_')[0]  # Extract race from tower_id
-                        #print(f"DEBUG: Checking tower {tower.tower_id} (race: {tower_race}, distance: {dist:.1f})")
-                        
-                        # <<< Check if the tower is the required race >>>
-                        if tower_race == required_race:
-                            if dist_sq <= self.aura_radius_pixels * self.aura_radius_pixels:
-                                # <<< APPLY BUFF >>>
-                                # Ensure the buff isn't already maximally applied or something similar if needed
-                                # Example: Tower applies buff directly
-                                # tower.apply_attack_speed_buff(speed_multiplier) 
-                                pass # Assume buff application logic is elsewhere or handled by buff system
-                        # --- End Attack Speed Aura Effect ---
-
-        # --- Time Machine Rewind Logic --- 
-        if self.special and self.special.get("effect") == "rewind_waypoints":
-            # Check cooldown based on attack_interval
-            if hasattr(self, 'last_attack_time') and current_time - self.last_attack_time >= self.attack_interval:
-                #print(f"TIME MACHINE {self.tower_id}: Cooldown ready. Scanning for target...")
-                # Find the valid target furthest along the path
-                best_target = None
-                max_path_index = -1
-
-                for enemy in all_enemies:
-                    # Check if enemy is immune to time machine effects (lord_supermaul and lord_supermaul_reborn)
-                    immune_enemies = ['lord_supermaul', 'lord_supermaul_reborn']
-                    is_immune = hasattr(enemy, 'enemy_id') and enemy.enemy_id in immune_enemies
-                    
-                    # Skip immune enemies
-                    if is_immune:
-                        continue
-                    
-                    # Check if enemy is alive, of a valid target type, and in range
-                    if (enemy.health > 0 and 
-                        enemy.type in self.targets and 
-                        self.is_in_range(enemy.x, enemy.y)):
-                        
-                        # Check progress
-                        if enemy.path_index > max_path_index:
-                            max_path_index = enemy.path_index
-                            best_target = enemy
-                
-                # If a valid target was found
-                if best_target:
-                    waypoints_to_rewind = self.special.get("waypoints_to_rewind", 3)
-                    #print(f"TIME MACHINE {self.tower_id}: Targeting {best_target.enemy_id} (at waypoint {best_target.path_index}). Rewinding {waypoints_to_rewind} waypoints.")
-                    
-                    # Check if enemy is immune to time machine effects (lord_supermaul and lord_supermaul_reborn)
-                    immune_enemies = ['lord_supermaul', 'lord_supermaul_reborn']
-                    is_immune = hasattr(best_target, 'enemy_id') and best_target.enemy_id in immune_enemies
-                    
-                    # Only rewind if not immune
-                    if not is_immune:
-                        # Call the enemy's rewind method
-                        best_target.rewind_waypoints(waypoints_to_rewind)
-                    
-                    # <<< PLAY REWIND SOUND >>>
-                    if hasattr(self, 'rewind_sound') and self.rewind_sound:
-                        self.rewind_sound.play()
-                    # <<< END PLAY SOUND >>>
-
-                    # Reset cooldown timer
-                    self.last_attack_time = current_time
-                    
-                    # --- Create Rewind Visual Effect --- 
-                    if hasattr(self, 'rewind_visual_surface') and self.rewind_visual_surface:
-                        if hasattr(self, 'game_scene_add_effect_callback') and callable(self.game_scene_add_effect_callback):
-                            try:
-                                # Make the effect much bigger - 3x the tower size
-                                effect_size_multiplier = 3.0
-                                effect_width = int(self.width_pixels * effect_size_multiplier)
-                                effect_height = int(self.height_pixels * effect_size_multiplier)
-                                
-                                effect_instance = Effect(
-                                    best_target.x, # Center effect on enemy's X
-                                    best_target.y, # Center effect on enemy's Y
-                                    self.rewind_visual_surface, # Use pre-loaded image
-                                    duration=0.5, # Quick fade-out duration
-                                    target_size=(effect_width, effect_height), # Much larger size
-                                    fade_type='fade_out' # Default fade out is fine
-                                )
-                                self.game_scene_add_effect_callback(effect_instance)
-                            except Exception as e:
-                                print(f"Error creating rewind visual effect: {e}")
- 
-        # --- Splash Radius Buff Aura Effect ---
-        if self.special and self.special.get("effect") == "splash_radius_buff_aura":
-            # Check if it's time for a new tick
-            if current_time - self.last_aura_tick_time >= 1.0:  # Check every 1.0 seconds
-                self.last_aura_tick_time = current_time
-                splash_radius_increase = self.special.get("splash_radius_increase", 175)
-                targets = self.special.get("targets", ["towers"])
-                
-                #print(f"DEBUG: {self.tower_id} checking splash radius buff aura (radius: {self.aura_radius_pixels})")
-                
-                # Find towers in range
-                for tower in all_towers:
-                    if tower != self:  # Don't affect self
-                        # Calculate distance to tower
-                        dx = tower.x - self.x
-                        dy = tower.y - self.y
-                        dist_sq = dx*dx + dy*dy
-                        dist = math.sqrt(dist_sq)
-                        
-                        if dist_sq <= self.aura_radius_pixels * self.aura_radius_pixels:
-                            # Apply splash radius buff with longer duration
-                            tower.apply_pulsed_buff('splash_radius_buff', splash_radius_increase, 1.5, current_time)
-                            #print(f"DEBUG: Splash Radius Aura from {self.tower_id} buffed {tower.tower_id} with +{splash_radius_increase} splash radius")
-                        else:
-                            #print(f"DEBUG: Tower {tower.tower_id} is too far away ({dist:.1f} > {self.aura_radius_pixels})")
-                            pass
-        # --- End Splash Radius Buff Aura Effect ---
-
-        # --- Adjacency Attack Speed Buff Effect ---
-        if self.special and self.special.get("effect") == "adjacency_attack_speed_buff":
-            # Check if it's time for a new tick
-            if current_time - self.last_aura_tick_time >= 0.1:  # Check every 0.1 seconds
-                self.last_aura_tick_time = current_time
-                speed_bonus_percent = self.special.get("attack_speed_bonus_percentage", 20)
-                speed_multiplier = 1.0 + (speed_bonus_percent / 100.0)
-                targets = self.special.get("targets", ["towers"])
-                
-                #print(f"DEBUG: {self.tower_id} checking adjacency attack speed buff")
-                
-                # Find adjacent towers
-                for tower in all_towers:
-                    if tower != self:  # Don't affect self
-                        # Check if towers are adjacent (1 grid cell away)
-                        dx = abs(tower.center_grid_x - self.center_grid_x)
-                        dy = abs(tower.center_grid_y - self.center_grid_y)
-                        
-                        if (dx <= 1 and dy <= 1) and (dx == 1 or dy == 1):  # Only adjacent, not diagonal
-                            # Apply attack speed buff
-                            tower.apply_pulsed_buff('attack_speed_buff', speed_multiplier, 0.2, current_time)
-                            #print(f"DEBUG: Adjacency Attack Speed Buff from {self.tower_id} buffed {tower.tower_id} with +{speed_bonus_percent}% attack speed")
-        # --- End Adjacency Attack Speed Buff Effect ---
-
-        # --- Adjacency Damage Buff Effect ---
-        if self.special and self.special.get("effect") == "adjacency_damage_buff":
-            # Check if it's time for a new tick
-            if current_time - self.last_aura_tick_time >= 1.0:  # Check every 1.0 seconds
-                self.last_aura_tick_time = current_time
-                damage_bonus_percent = self.special.get("damage_bonus_percentage", 15)
-                damage_multiplier = 1.0 + (damage_bonus_percent / 100.0)
-                targets = self.special.get("targets", ["towers"])
-                
-                #print(f"DEBUG: {self.tower_id} checking adjacency damage buff")
-                
-                # Find adjacent towers
-                for tower in all_towers:
-                    if tower != self:  # Don't affect self
-                        # Check if towers are adjacent (1 grid cell away)
-                        dx = abs(tower.center_grid_x - self.center_grid_x)
-                        dy = abs(tower.center_grid_y - self.center_grid_y)
-                        
-                        if (dx <= 1 and dy <= 1) and (dx == 1 or dy == 1):  # Only adjacent, not diagonal
-                            # Apply damage buff
-                            tower.apply_pulsed_buff('damage_buff', damage_multiplier, 1.5, current_time)
-                            #print(f"DEBUG: Adjacency Damage Buff from {self.tower_id} buffed {tower.tower_id} with +{damage_bonus_percent}% damage")
-        # --- End Adjacency Damage Buff Effect ---
-
-        # --- Air Damage Aura Effect ---
-        if self.special and self.special.get("effect") == "air_damage_aura":
-            # Check if it's time for a new tick
-            if current_time - self.last_aura_tick_time >= 1.0:  # Check every 1.0 seconds
-                self.last_aura_tick_time = current_time
-                air_damage_multiplier = self.special.get("air_damage_multiplier", 1.1)
-                targets = self.special.get("targets", ["towers"])
-                
-                #print(f"DEBUG: {self.tower_id} checking air damage aura (radius: {self.aura_radius_pixels})")
-                
-                # Find towers in range
-                for tower in all_towers:
-                    if tower != self:  # Don't affect self
-                        # Only affect projectile towers
-                        if tower.attack_type == 'projectile':
-                            # Calculate distance to tower
-                            dx = tower.x - self.x
-                            dy = tower.y - self.y
-                            dist_sq = dx*dx + dy*dy
-                            dist = math.sqrt(dist_sq)
-                            
-                            if dist_sq <= self.aura_radius_pixels * self.aura_radius_pixels:
-                                # Apply air damage buff
-                                tower.apply_pulsed_buff('air_damage_buff', air_damage_multiplier, 1.5, current_time)
-                                #print(f"DEBUG: Air Damage Aura from {self.tower_id} buffed {tower.tower_id} with x{air_damage_multiplier} air damage")
-                            else:
-                                #print(f"DEBUG: Tower {tower.tower_id} is too far away ({dist:.1f} > {self.aura_radius_pixels})")
-                                pass
-                        else:
-                            #print(f"DEBUG: Tower {tower.tower_id} is not a projectile tower, skipping air damage buff")
-                            pass
-        # --- End Air Damage Aura Effect ---
-
-        # --- Damage Aura Effect ---
-        if self.special and self.special.get("effect") == "damage_aura":
-            # Check if it's time for a new tick
-            if current_time - self.last_aura_tick_time >= 1.0:  # Check every 1.0 seconds
-                self.last_aura_tick_time = current_time
-                damage_bonus_percent = self.special.get("damage_bonus_percentage", 10)
-                damage_multiplier = 1.0 + (damage_bonus_percent / 100.0)
-                targets = self.special.get("targets", ["towers"])
-                
-                #print(f"DEBUG: {self.tower_id} checking damage aura (radius: {self.aura_radius_pixels})")
-                
-                # Find towers in range
-                for tower in all_towers:
-                    if tower != self:  # Don't affect self
-                        # Calculate distance to tower
-                        dx = tower.x - self.x
-                        dy = tower.y - self.y
-                        dist_sq = dx*dx + dy*dy
-                        dist = math.sqrt(dist_sq)
-                        
-                        if dist_sq <= self.aura_radius_pixels * self.aura_radius_pixels:
-                            # Apply damage buff
-                            tower.apply_pulsed_buff('damage_buff', damage_multiplier, 1.5, current_time)
-                            #print(f"DEBUG: Damage Aura from {self.tower_id} buffed {tower.tower_id} with +{damage_bonus_percent}% damage")
-                        else:
-                            pass
-                            #print(f"DEBUG: Tower {tower.tower_id} is too far away ({dist:.1f} > {self.aura_radius_pixels})")
-        # --- End Damage Aura Effect ---
-
-        # --- Crit Aura Effect ---
-        if self.special and self.special.get("effect") == "crit_aura":
-            # Check if it's time for a new tick
-            if current_time - self.last_aura_tick_time >= 1.0:  # Check every 1.0 seconds
-                self.last_aura_tick_time = current_time
-                crit_chance_bonus = self.special.get("crit_chance_bonus", 0.50)
-                crit_multiplier_bonus = self.special.get("crit_multiplier_bonus", 0.5)
-                targets = self.special.get("targets", ["towers"])
-                
-                print(f"DEBUG: {self.tower_id} checking crit aura (radius: {self.aura_radius_pixels})")
-                
-                # Find towers in range
-                for tower in all_towers:
-                    if tower != self:  # Don't affect self
-                        # Calculate distance to tower
-                        dx = tower.x - self.x
-                        dy = tower.y - self.y
-                        dist_sq = dx*dx + dy*dy
-                        dist = math.sqrt(dist_sq)
-                        
-                        if dist_sq <= self.aura_radius_pixels * self.aura_radius_pixels:
-                            # Apply crit chance buff
-                            tower.apply_pulsed_buff('crit_chance_buff', crit_chance_bonus, 1.5, current_time)
-                            # Apply crit multiplier buff
-                            tower.apply_pulsed_buff('crit_multiplier_buff', crit_multiplier_bonus, 1.5, current_time)
-                            #print(f"DEBUG: Crit Aura from {self.tower_id} buffed {tower.tower_id} with +{crit_chance_bonus*100}% crit chance and +{crit_multiplier_bonus} crit multiplier")
-                        else:
-                            pass
-                            #print(f"DEBUG: Tower {tower.tower_id} is too far away ({dist:.1f} > {self.aura_radius_pixels})")
-        # --- End Crit Aura Effect ---
-
-        # --- DoT Amplification Aura Effect ---
-        if self.special and self.special.get("effect") == "dot_amplification_aura":
-            # Check if it's time for a new tick
-            if current_time - self.last_aura_tick_time >= 1.0:  # Check every 1.0 seconds
-                self.last_aura_tick_time = current_time
-                dot_damage_multiplier = self.special.get("dot_damage_multiplier", 2.5)
-                targets = self.special.get("targets", ["ground", "air"])
-                
-                #print(f"DEBUG: {self.tower_id} checking DoT amplification aura (radius: {self.aura_radius_pixels})")
-                
-                # Find enemies in range
-                for enemy in all_enemies:
-                    if enemy.health > 0 and enemy.type in targets:
-                        # Calculate distance to enemy
-                        dx = enemy.x - self.x
-                        dy = enemy.y - self.y
-                        dist_sq = dx*dx + dy*dy
-                        dist = math.sqrt(dist_sq)
-                        
-                        if dist_sq <= self.aura_radius_pixels * self.aura_radius_pixels:
-                            # Apply DoT damage multiplier to the enemy with a longer duration that matches the check interval
-                            enemy.apply_status_effect('dot_amplification', 2.0, dot_damage_multiplier, current_time)
-                            #print(f"DEBUG: DoT Amplification Aura from {self.tower_id} amplified DoTs on {enemy.enemy_id} by x{dot_damage_multiplier}")
-                        else:
-                            pass
-                            #print(f"DEBUG: Enemy {enemy.enemy_id} is too far away ({dist:.1f} > {self.aura_radius_pixels})")
-        # --- End DoT Amplification Aura Effect ---
-
-        # --- Random Bombardment Effect ---
-        if self.special and self.special.get("effect") == "random_bombardment":
-            # Check if it's time for a new strike
-            if current_time - self.last_attack_time >= self.special["interval"]:  # Use exact interval from tower data
-                self.last_attack_time = current_time
-                
-                # Get bombardment parameters
-                bombardment_radius = self.special.get("bombardment_radius", 2750)
-                strike_aoe_radius = self.special.get("strike_aoe_radius", 250)
-                strike_damage_min = self.special.get("strike_damage_min", 800)
-                strike_damage_max = self.special.get("strike_damage_max", 900)
-                strike_damage_type = self.special.get("strike_damage_type", "normal")
-                
-                # Calculate random strike position within bombardment radius
-                angle = random.uniform(0, 2 * math.pi)
-                distance = random.uniform(0, bombardment_radius)
-                strike_x = self.x + math.cos(angle) * distance
-                strike_y = self.y + math.sin(angle) * distance
-                
-                # Convert grid coordinates to pixel coordinates and ensure strike stays within bounds
-                # Grid coordinates: (26,1), (1,24), (1,1), (24,1)
-                # Convert to pixel coordinates (assuming 50 pixels per grid)
-                min_x = 1 * 50  # Left boundary
-                max_x = 26 * 50  # Right boundary
-                min_y = 1 * 50  # Top boundary
-                max_y = 24 * 50  # Bottom boundary
-                
-                strike_x = max(min_x, min(strike_x, max_x))
-                strike_y = max(min_y, min(strike_y, max_y))
-                
-                # Create explosion effect
-                explosion = Effect(
-                    strike_x,
-                    strike_y,
-                    self.asset_loader("assets/effects/fire_burst.png"),
-                    duration=0.5,
-                    target_size=(strike_aoe_radius, strike_aoe_radius)  # Make visual effect match actual radius
-                )
-                
-                # Deal damage to enemies in radius
-                strike_radius_sq = strike_aoe_radius ** 2
-                for enemy in all_enemies:
-                    if enemy.health > 0:
-                        dx = enemy.x - strike_x
-                        dy = enemy.y - strike_y
-                        dist_sq = dx**2 + dy**2
-                        if dist_sq <= strike_radius_sq:
-                            # Calculate damage falloff based on distance
-                            distance = math.sqrt(dist_sq)
-                            falloff = 1.0 - (distance / strike_aoe_radius)
-                            damage = random.uniform(strike_damage_min, strike_damage_max) * falloff
-                            enemy.take_damage(damage, strike_damage_type)
-                
-                # Add explosion to game scene
-                if self.game_scene_add_effect_callback:
-                    self.game_scene_add_effect_callback(explosion)
-                
-                #print(f"Random bombardment strike at ({int(strike_x)}, {int(strike_y)})")
-        # --- End Random Bombardment Effect ---
-
-        # --- Salvo Attack Logic ---
-        if self.special and self.special.get("effect") == "salvo_attack" and self.salvo_shots_remaining > 0:
-            if current_time >= self.salvo_next_shot_time:
-                # Fire next salvo shot
-                salvo_interval = self.special.get("salvo_interval", 0.1)
-                self.salvo_next_shot_time = current_time + salvo_interval
-                self.salvo_shots_remaining -= 1
-                
-                # Calculate damage for this shot
-                buffed_stats = self.get_buffed_stats(current_time, [], all_towers)
-                damage_multiplier = buffed_stats['damage_multiplier']
-                effective_splash_radius_pixels = buffed_stats['splash_radius_pixels']
-                
-                initial_damage, is_crit = self.calculate_damage(self.salvo_target, buffed_stats, current_time, damage_multiplier=damage_multiplier)
-                
-                # Create and fire the projectile
-                projectile = Projectile(
-                    self.x, self.y, initial_damage, self.projectile_speed,
-                    self.tower_data.get('projectile_asset_id', self.tower_id),
-                    target_enemy=self.salvo_target,
-                    splash_radius=effective_splash_radius_pixels,
-                    source_tower=self,
-                    is_crit=is_crit,
-                    special_effect=self.special,
-                    damage_type=self.damage_type,
-                    bounces_remaining=self.bounce,
-                    bounce_range_pixels=self.bounce_range_pixels,
-                    bounce_damage_falloff=self.bounce_damage_falloff,
-                    pierce_adjacent=self.pierce_adjacent,
-                    asset_loader=self.asset_loader
-                )
-                
-                # Add projectile to game scene
-                if self.game_scene_add_projectile_callback:
-                    self.game_scene_add_projectile_callback(projectile)
-                
-                # Play sound for each shot
-                if self.attack_sound:
-                    self.attack_sound.play()
-        # --- END Salvo Attack Logic ---
+        # --- Special Effect Tick ---
+        # Only towers whose effect registered an on_tick handler do any work here
+        # (see entities/effects/tower_effect_hooks.py)
+        on_tick = self.effect_hooks.on_tick
+        if on_tick:
+            on_tick(self, current_time, all_enemies, all_towers)
+        # --- End Special Effect Tick ---
 
     # --- NEW: Method to apply temporary pulsed buffs ---
     def apply_pulsed_buff(self, buff_type, value, duration, current_time):
@@ -2953,6 +2400,7 @@ class Tower:
             return
         end_time = current_time + duration
         self.pulsed_buffs[buff_type] = {'value': value, 'end_time': end_time}
+        self.pulsed_buff_version += 1 # Invalidates this frame's cached buffed stats
     # --- END apply_pulsed_buff ---
 
     def sell(self):
@@ -3,6 +3,7 @@ import json
 import os
 # Keep the Game import from the original structure
 from game import Game 
+from utils.tower_specs import compile_race_specs
 
 def load_game_data(file_path):
     """
@@ -76,6 +77,9 @@ def main():
             print(f" - Loaded {len(game_data['races'])} race(s)")
         if "damagetypes" in game_data:
              print(f" - Loaded {len(game_data['damagetypes'])} damage type(s)")
+        # Compile every tower entry once; placed towers share these read-only specs
+        tower_specs = compile_race_specs(game_data)
+        print(f" - Compiled {len(tower_specs)} tower spec(s)")
         # ... add prints for ranges, tower_sizes if needed
 
     except FileNotFoundError:
@@ -4,21 +4,36 @@ import os # Need os for listing directory contents
 import random # Import random module
 import glob # <<< ADD IMPORT
 import math
-from copy import deepcopy  # Import deepcopy
+import time
+from collections import deque
 import config # Import config module directly
 # print(f"Imported config from: {config.__file__}") # DEBUG: Print path of imported config
 from ui.tower_selector import TowerSelector
 from ui.tower_assets import TowerAssets
 from ui.enemy_assets import EnemyAssets # Import EnemyAssets
 from ui.projectile_assets import ProjectileAssets # Import ProjectileAssets
-from utils.pathfinding import find_path # Import pathfinding function
+from utils.pathfinding import find_path, FlowField, PathCache # Import pathfinding helpers
+from utils.placement import PlacementValidator
+from utils.occupancy_grid import OccupancyGrid, CELL_RESTRICTED, CELL_TOWER
+from utils.spatial_hash import EnemySpatialHash
+from utils.tower_coverage import TowerCoverageMap
+from utils.aura_map import EnemyAuraMap, EnemyAura
+from utils.effect_registry import AuraContext
+from utils.buff_resolver import BuffResolver
+from utils.tower_adjacency import TowerAdjacencyGraph
+from utils.chain_topology import ChainTopology
+from utils.timing_wheel import TimingWheel
+from utils.enemy_store import EnemyStore, EnemyList
+from utils.entity_list import EntityList
+from utils.effect_pipeline import EffectPipeline
+from utils.tower_specs import SpecialEffect, TARGET_ENEMIES
 from entities.enemy import Enemy # Import Enemy class
 from entities.projectile import Projectile # Import Projectile class
 from entities.offset_boomerang_projectile import OffsetBoomerangProjectile # <<< ADDED IMPORT
 from entities.grenade_projectile import GrenadeProjectile # <<< ADDED IMPORT
 from entities.cluster_projectile import ClusterProjectile # <<< ADDED IMPORT
 # Import all necessary effect classes at the top level
-from entities.effect import Effect, FloatingTextEffect, ChainLightningVisual, RisingFadeEffect, GroundEffectZone, FlamethrowerParticleEffect, SuperchargedZapEffect, AcidSpewParticleEffect, PulseImageEffect, ExpandingCircleEffect, DrainParticleEffect, WhipVisual # Added AcidSpewParticleEffect, PulseImageEffect, ExpandingCircleEffect, DrainParticleEffect, WhipVisual
+from entities.effect import Effect, FloatingTextEffect, ChainLightningVisual, FlamethrowerParticleEffect, SuperchargedZapEffect, AcidSpewParticleEffect, ExpandingCircleEffect, DrainParticleEffect, WhipVisual # Added AcidSpewParticleEffect, ExpandingCircleEffect, DrainParticleEffect, WhipVisual
 from entities.orbiting_damager import OrbitingDamager # NEW IMPORT
 from entities.pass_through_exploder import PassThroughExploder # NEW IMPORT
 from entities.status_effect_visualizer import StatusEffectVisualizer # <<< ADD IMPORT
@@ -33,6 +48,14 @@ WAVE_STATE_COMPLETE = "WAVE_COMPLETE" # Optional: Wait for enemies to clear
 WAVE_STATE_ALL_DONE = "ALL_WAVES_COMPLETE"
 WAVE_STATE_INTERMISSION = "INTERMISSION" # Added new state
 
+# Placement map flags (per footprint centre cell)
+PLACEMENT_CLEAR = 1      # Footprint in bounds, not restricted, no tower overlap
+PLACEMENT_KEEPS_PATH = 2 # Blocking the footprint still leaves a spawn -> objective path
+
+# Batched enemy re-routing after the grid changes (spread across frames)
+REPATH_TIME_BUDGET = 0.002 # Seconds of re-path work allowed per frame
+REPATH_MIN_PER_FRAME = 16 # Always re-route at least this many enemies per frame
+
 # --- Game State ---
 GAME_STATE_RUNNING = "RUNNING"
 GAME_STATE_GAME_OVER = "GAME_OVER"
@@ -325,7 +348,8 @@ class GameScene:
         
         # Game state
         self.towers = []
-        self.enemies = []
+        self.enemy_store = EnemyStore() # Structure-of-arrays movement/status state for self.enemies
+        self.enemies = EnemyList() # Marks each enemy's store row active while it is listed
         # --- Load Money/Lives Based on Difficulty (Inferred from wave file path) ---
         if "advanced" in self.wave_file_path.lower(): # Check if it's advanced waves (now used by classic mode)
             #print(f"[GameScene Init] Loading ADVANCED settings (money/lives) due to wave file: {self.wave_file_path}")
@@ -338,11 +362,13 @@ class GameScene:
         # --- End Money/Lives Loading ---
         # self.money = config.STARTING_MONEY # <<< REMOVED OLD ASSIGNMENT
         # self.lives = config.STARTING_LIVES # <<< REMOVED OLD ASSIGNMENT
-        self.projectiles = [] # List to hold active projectiles
+        self.projectiles = EntityList() # Active projectiles (O(1) removal, compacted once per frame)
+        self.deferred_projectiles = {} # Deferred-impact homing shots in flight (ordered set), not stepped per frame
+        self.impact_wheel = TimingWheel() # Hit times of deferred_projectiles
         self.active_beams = [] # List to hold active beam effects { 'tower': tower, 'target': enemy, 'end_time': timestamp }
-        self.effects = [] # List to hold active visual effects
+        self.effects = EffectPipeline() # Active visual effects, each updated once per tick
         self.orbiting_damagers = [] # List for orbiting damagers (We added this earlier, maybe manually?)
-        self.pass_through_exploders = [] # NEW: List for pass-through exploders
+        self.pass_through_exploders = EntityList() # NEW: Pass-through exploders
         self.status_visualizers = [] # <<< ADDED: List for tower status visuals
         
         # --- Wave System State --- 
@@ -488,7 +514,8 @@ class GameScene:
 
         # Align grid area with left padding and leave remaining space to the right for panel
         # Ensure panel position remains where it was computed above
-        self.grid = [[0 for _ in range(self.grid_width)] for _ in range(self.grid_height)]
+        # Compact occupancy grid: grid[y][x] reads, set_cell/fill_footprint writes (bumps grid.version)
+        self.grid = OccupancyGrid(self.grid_width, self.grid_height)
 
         # Mark ALL restricted areas with value 2
         for y in range(self.grid_height):
@@ -505,7 +532,31 @@ class GameScene:
                     is_restricted = True
                 
                 if is_restricted:
-                    self.grid[y][x] = 2 # Mark restricted
+                    self.grid.set_cell(x, y, CELL_RESTRICTED) # Mark restricted
+
+        # --- NEW: Shared flow field for ground enemies (rebuilt when grid.version changes) ---
+        self.flow_field = None
+        self.flow_field_version = -1
+        self.placement_validator = None # Cut-cell index for placement checks (rebuilt with the flow field)
+        self.placement_validator_version = -1
+        self.path_cache = PathCache() # Spawn paths shared between enemies (keyed on grid.version)
+        self.pending_repaths = deque() # Ground enemies waiting for a new route after a grid change
+        self.repath_cell_cache = {} # (grid_x, grid_y) -> path tuple, for the current flow field
+        self.repath_cache_version = -1
+        self.placement_map = None # PLACEMENT_* flags per centre cell for the selected footprint size
+        self.placement_map_key = None
+        self.show_placement_overlay = False # Toggled with the 'blockmap' console command
+        self.enemy_index = EnemySpatialHash(config.GRID_SIZE) # Tile-bucketed enemy lookup, rebuilt once per tick
+        self.tower_coverage = TowerCoverageMap(config.GRID_SIZE, self.grid_width, self.grid_height) # Cell -> towers whose range reaches it
+        self.tower_coverage_dirty = True # Set whenever towers are added or removed
+        self.enemy_aura_map = EnemyAuraMap(config.GRID_SIZE) # Cell -> continuous enemy auras reaching it
+        self.enemy_aura_map_dirty = True # Set whenever towers are added or removed
+        self.tower_buff_auras = [] # Buffs towers give other towers, see build_tower_buff_auras
+        self.aura_context = AuraContext() # Frame values passed to the enemy aura / walkover effect handlers
+        self.buff_resolver = BuffResolver() # Caches per-tower buffed stats between layout changes
+        self.tower_buffs_dirty = True # Set whenever towers are added or removed
+        self.tower_adjacency = TowerAdjacencyGraph(self.grid) # Which towers touch, updated on place/sell/destroy
+        self.chain_topology = ChainTopology() # Arc Tower link components + cached longest chains
 
         # Calculate spawn area position (centered at top)
         self.spawn_area_x = (self.grid_width - config.SPAWN_AREA_WIDTH) // 2
@@ -939,12 +990,7 @@ class GameScene:
                     grid_x = start_x + offset_x
                     grid_y = start_y + offset_y
                     
-                    tower_at_location = None
-                    for tower in self.towers:
-                        if (tower.top_left_grid_x <= grid_x < tower.top_left_grid_x + tower.grid_width and
-                            tower.top_left_grid_y <= grid_y < tower.top_left_grid_y + tower.grid_height):
-                            tower_at_location = tower
-                            break
+                    tower_at_location = self.grid.tower_at(int(grid_x), int(grid_y))
 
                     is_previewing = self.tower_selector.get_selected_tower() is not None
                     
@@ -1028,14 +1074,8 @@ class GameScene:
                             
                             max_towers = self.money // cost
                             
-                            valid_positions = []
-                            for pos in positions:
-                                if len(valid_positions) >= max_towers:
-                                    break
-                                if self.is_valid_tower_placement(pos[0], pos[1], grid_width, grid_height):
-                                    valid_positions.append(pos)
-                            
-                            self.drag_preview_positions = valid_positions
+                            # Validate the whole line at once so the finished wall can't block the path
+                            self.drag_preview_positions = self.get_valid_drag_positions(positions, tower_data, max_towers)
                 
         elif event.type == pygame.MOUSEBUTTONUP:
             if event.button == 1:  # Left mouse button release
@@ -1187,11 +1227,7 @@ class GameScene:
             hover_grid_x = (relative_mouse_x + (avg_tile_size // 2)) // avg_tile_size
             hover_grid_y = (relative_mouse_y + (avg_tile_size // 2)) // avg_tile_size
             
-            for tower in self.towers:
-                if (tower.top_left_grid_x <= hover_grid_x < tower.top_left_grid_x + tower.grid_width and
-                    tower.top_left_grid_y <= hover_grid_y < tower.top_left_grid_y + tower.grid_height):
-                    found_hover = tower
-                    break
+            found_hover = self.grid.tower_at(int(hover_grid_x), int(hover_grid_y))
                     
         self.hovered_tower = found_hover
 
@@ -1309,42 +1345,24 @@ class GameScene:
             return
 
         # --- Placement ---
-        # Calculate footprint again (needed for marking the grid)
-        offset_x = (grid_width - 1) // 2
-        offset_y = (grid_height - 1) // 2
-        new_start_x = grid_x - offset_x
-        new_end_x = new_start_x + grid_width - 1
-        new_start_y = grid_y - offset_y
-        new_end_y = new_start_y + grid_height - 1
+        # Ensure grid coordinates are integers for grid indexing
+        grid_x = int(grid_x)
+        grid_y = int(grid_y)
 
         # Check if tower is traversable
         is_traversable = tower_data.get('traversable', False)
 
-        # Mark occupied grid cells ONLY if not traversable
-        if not is_traversable:
-            # Ensure grid coordinates are integers for grid indexing
-            grid_x = int(grid_x)
-            grid_y = int(grid_y)
-            grid_width = int(grid_width)
-            grid_height = int(grid_height)
-            
-            # Calculate the true top-left corner based on center and dimensions
-            actual_top_left_x = grid_x - (grid_width - 1) // 2
-            actual_top_left_y = grid_y - (grid_height - 1) // 2
-            
-            # Loop from the calculated top-left for the full width/height
-            for y_offset in range(grid_height):
-                for x_offset in range(grid_width):
-                    mark_x = int(actual_top_left_x + x_offset)
-                    mark_y = int(actual_top_left_y + y_offset)
-                    # Check bounds within loop for safety
-                    if 0 <= mark_y < self.grid_height and 0 <= mark_x < self.grid_width:
-                        self.grid[mark_y][mark_x] = 1 # Mark as obstacle
-
         # Create and place the tower (using center grid coordinates)
         from entities.tower import Tower
         tower = Tower(grid_x, grid_y, selected_tower_id, tower_data)
         self.towers.append(tower)
+        self.tower_coverage_dirty = True
+        self.enemy_aura_map_dirty = True
+        self.tower_buffs_dirty = True
+
+        # Register footprint; cells are marked as obstacles ONLY if not traversable
+        self.grid.fill_footprint(tower, blocks_path=not is_traversable)
+        self.tower_adjacency.add_tower(tower)
         
         # Update tower count
         self.tower_counts[selected_tower_id] = self.tower_counts.get(selected_tower_id, 0) + 1
@@ -1355,29 +1373,9 @@ class GameScene:
         # Deduct money
         self.deduct_money(tower_data['cost'])
 
-        # Recalculate paths for all existing enemies ONLY if the placed tower is NOT traversable
+        # Re-route existing enemies ONLY if the placed tower is NOT traversable
         if not is_traversable:
-            for enemy in self.enemies[:]:  # Use slice copy
-                # Get enemy's current grid position (use avg_tile_size for consistency)
-                current_grid_x = int(enemy.x // self.avg_tile_size)
-                current_grid_y = int(enemy.y // self.avg_tile_size)
-                
-                # Skip path recalculation for air units
-                if enemy.type == 'air':
-                    continue
-                
-                # Find new path from current position to objective
-                new_path = find_path(current_grid_x, current_grid_y, 
-                                   self.path_end_x, self.path_end_y, 
-                                   self.grid)
-                
-                if new_path:
-                    # Update enemy's path
-                    enemy.grid_path = new_path
-                    enemy.path_index = 0  # Reset path index
-                else:
-                    # If no path found, remove the enemy (it's trapped)
-                    self.enemies.remove(enemy)
+            self.schedule_enemy_repath()
 
         # Only clear selection if this is not part of a drag placement
         if not is_drag_placement:
@@ -1451,6 +1449,10 @@ class GameScene:
             pass
         # --- End Edge Scroll ---
 
+        # --- Batched Enemy Re-routing (after placement/sell) ---
+        self.process_enemy_repaths()
+        # --- End Re-routing ---
+
         # --- Helper function to trigger game end state ---
         def trigger_game_end(is_victory):
             if self.game_state != GAME_STATE_RUNNING: return # Already ended
@@ -1504,212 +1506,35 @@ class GameScene:
         # Update UI
         self.tower_selector.update(time_delta)
         
-        # --- Pre-calculate Tower Buff Auras (Affecting Towers) --- 
-        # Store as instance variable for use in draw method
-        self.tower_buff_auras = []
-        # processed_tower_ids = set() # Track which tower IDs we've already processed # REMOVE THIS LINE
-
-        for tower in self.towers:
-            # Skip if we've already processed this tower # REMOVE THIS BLOCK
-            # if tower.tower_id in processed_tower_ids:
-            #     continue
-            # processed_tower_ids.add(tower.tower_id)
-            
-            # Check if the tower has a special block
-            if tower.special:
-                effect_type = tower.special.get('effect')
-                is_standard_aura = (tower.attack_type == 'aura' or tower.attack_type == 'hybrid')
-                is_dot_amp_aura = effect_type == 'dot_amplification_aura'
-                is_attack_speed_aura = effect_type == 'adjacency_attack_speed_buff' # <<< ADDED CHECK FOR ADJACENCY BUFF
-                
-                # Process if it's a standard buff aura OR the DoT amp aura OR the attack speed aura
-                # MODIFIED CONDITION: Include 'adjacency_attack_speed_buff' here
-                if is_standard_aura or is_dot_amp_aura or is_attack_speed_aura:
-                # --- END MODIFICATION ---
-                    aura_radius_units = tower.special.get('aura_radius', 0)
-                    if aura_radius_units > 0:
-                        aura_radius_pixels = aura_radius_units * (config.GRID_SIZE / 200.0)
-                        aura_radius_sq = aura_radius_pixels ** 2
-                        self.tower_buff_auras.append({
-                            'tower': tower,
-                            'radius_sq': aura_radius_sq,
-                            'special': tower.special
-                        })
-                        if is_dot_amp_aura:
-                            #print(f"DEBUG: Added {tower.tower_id} (dot_amp_aura) to tower_buff_auras with radius {aura_radius_pixels:.1f}px")
-                            pass
-
-        # --- BEGIN Adjacency Buff Calculation ---
-        # This section already correctly processes individual towers (Police HQ)
-        # No change needed here, it adds entries for each HQ affecting neighbors
-        hq_towers = [t for t in self.towers if t.tower_id == 'police_hq']
-        if hq_towers: # Only do checks if there's at least one HQ
-            # towers_already_buffed_by_hq = set() # Prevent double-buffing from multiple HQs # REMOVE THIS LINE
-            
-            for hq in hq_towers:
-                # Define the HQ's bounding box in grid coordinates
-                hq_start_x = hq.top_left_grid_x
-                hq_end_x = hq_start_x + hq.grid_width - 1
-                hq_start_y = hq.top_left_grid_y
-                hq_end_y = hq_start_y + hq.grid_height - 1
-                
-                # Define the adjacency check area (HQ box expanded by 1 cell)
-                adj_min_x = hq_start_x - 1
-                adj_max_x = hq_end_x + 1
-                adj_min_y = hq_start_y - 1
-                adj_max_y = hq_end_y + 1
-                
-                # Check every other tower
-                for other_tower in self.towers:
-                    # if other_tower == hq or other_tower in towers_already_buffed_by_hq: # REMOVE THIS CHECK
-                    if other_tower == hq:
-                        continue # Skip self
-                        
-                    # Define the other tower's bounding box
-                    other_start_x = other_tower.top_left_grid_x
-                    other_end_x = other_start_x + other_tower.grid_width - 1
-                    other_start_y = other_tower.top_left_grid_y
-                    other_end_y = other_start_y + other_tower.grid_height - 1
-                    
-                    # Check for AABB overlap between other tower and HQ's adjacency area
-                    # Overlap exists if they are NOT separated
-                    is_adjacent = not (other_end_x < adj_min_x or 
-                                       other_start_x > adj_max_x or 
-                                       other_end_y < adj_min_y or 
-                                       other_start_y > adj_max_y)
-                                       
-                    if is_adjacent:
-                        # Additional check to ensure towers only share an edge, not just a corner
-                        shares_edge = (
-                            # Tower is directly to the left or right of HQ
-                            (other_end_x == adj_min_x or other_start_x == adj_max_x) and
-                            (other_end_y >= hq_start_y and other_start_y <= hq_end_y)
-                        ) or (
-                            # Tower is directly above or below HQ
-                            (other_end_y == adj_min_y or other_start_y == adj_max_y) and
-                            (other_end_x >= hq_start_x and other_start_x <= hq_end_x)
-                        )
-                        
-                        print(f"DEBUG: Checking tower {other_tower.tower_id} at ({other_tower.center_grid_x},{other_tower.center_grid_y})")
-                        print(f"  HQ bounds: ({hq_start_x},{hq_start_y}) to ({hq_end_x},{hq_end_y})")
-                        print(f"  Tower bounds: ({other_start_x},{other_start_y}) to ({other_end_x},{other_end_y})")
-                        print(f"  Adjacency area: ({adj_min_x},{adj_min_y}) to ({adj_max_x},{adj_max_y})")
-                        print(f"  Is adjacent: {is_adjacent}")
-                        print(f"  Shares edge: {shares_edge}")
-                        
-                        if shares_edge:
-                            # Ensure the HQ special targets towers
-                            if hq.special and hq.special.get('effect') == 'adjacency_damage_buff' and "towers" in hq.special.get('targets', []):
-                                print(f"  Applying buff to {other_tower.tower_id}")
-                                # Add the HQ's buff data to the list
-                                self.tower_buff_auras.append({
-                                    'tower': hq, # The tower providing the buff
-                                    'radius_sq': 0, # Radius doesn't apply here
-                                    'special': hq.special
-                                })
-        # --- END Adjacency Buff Calculation --- 
-
-        # --- BEGIN Spark Power Plant Adjacency Buff Calculation ---
-        # This section also processes individual towers correctly
-        # No change needed here.
-        plant_towers = [t for t in self.towers if t.tower_id == 'spark_power_plant']
-        if plant_towers:
-            # towers_already_buffed_by_plant = set() # Prevent double-buffing from multiple plants # REMOVE THIS LINE
-
-            for plant in plant_towers:
-                # Define the plant's bounding box
-                plant_start_x = plant.top_left_grid_x
-                plant_end_x = plant_start_x + plant.grid_width - 1
-                plant_start_y = plant.top_left_grid_y
-                plant_end_y = plant_start_y + plant.grid_height - 1
-
-                # Define the adjacency check area
-                adj_min_x = plant_start_x - 1
-                adj_max_x = plant_end_x + 1
-                adj_min_y = plant_start_y - 1
-                adj_max_y = plant_end_y + 1
-
-                # Check every other tower
-                for other_tower in self.towers:
-                    # if other_tower == plant or other_tower in towers_already_buffed_by_plant: # REMOVE THIS CHECK
-                    if other_tower == plant:
-                        continue
-
-                    # Define the other tower's bounding box
-                    other_start_x = other_tower.top_left_grid_x
-                    other_end_x = other_start_x + other_tower.grid_width - 1
-                    other_start_y = other_tower.top_left_grid_y
-                    other_end_y = other_start_y + other_tower.grid_height - 1
-
-                    # AABB overlap check for adjacency
-                    is_adjacent = not (other_end_x < adj_min_x or
-                                       other_start_x > adj_max_x or
-                                       other_end_y < adj_min_y or
-                                       other_start_y > adj_max_y)
-
-                    if is_adjacent:
-                        # Check if the plant's special is the correct buff and targets towers
-                        if plant.special and plant.special.get('effect') == 'adjacency_attack_speed_buff' and "towers" in plant.special.get('targets', []):
-                            #print(f"DEBUG: Power Plant at ({plant.center_grid_x},{plant.center_grid_y}) applying adjacency buff to {other_tower.tower_id} at ({other_tower.center_grid_x},{other_tower.center_grid_y})")
-                            pass
-                            # Add the plant's buff data to the list
-                            self.tower_buff_auras.append({
-                                'tower': plant,
-                                'radius_sq': 0,
-                                'special': plant.special
-                            })
-                            # towers_already_buffed_by_plant.add(other_tower) # REMOVE THIS LINE
-        # --- END Spark Power Plant Adjacency Buff Calculation ---
+        # --- Tower Buff Auras (Affecting Towers) ---
+        # Only depend on tower layout; rebuilt on place/sell/destroy/unlock
+        if self.tower_buffs_dirty:
+            self.build_tower_buff_auras()
+            self.buff_resolver.rebuild(self.towers, self.tower_buff_auras)
+            self.tower_buffs_dirty = False
 
         # --- Pre-calculate Enemy Aura Towers (Affecting Enemies) --- 
-        enemy_aura_towers = []
-        for tower in self.towers:
-            # Check if the tower has a special block and an aura radius
-            if tower.special and tower.special.get('aura_radius', 0) > 0:
-                effect_type = tower.special.get('effect')
-                # Skip dot_amplification_aura as it affects towers, not enemies
-                if effect_type == 'dot_amplification_aura':
-                    continue
-                    
-                is_pulse_aura = effect_type and effect_type.endswith('_pulse_aura')
-                is_continuous_aura = tower.attack_type in ['aura', 'hybrid']
-                
-                # Consider it if it's a standard continuous aura OR a pulse aura OR radiance_aura
-                if is_continuous_aura or is_pulse_aura or effect_type == 'radiance_aura':
-                    aura_targets = tower.special.get('targets', []) # Pulse auras might still define targets
-                    # Check if the targets list contains enemy types or the old "enemies" string
-                    # Ensure the aura isn't targeting towers (handled above in tower_buff_auras)
-                    targets_enemies = any(t in ["ground", "air", "enemies"] for t in aura_targets) or aura_targets == "enemies"
-                    targets_towers = "towers" in aura_targets or aura_targets == "towers" # Check specifically
-                    
-                    # Include if it targets enemies and NOT exclusively towers
-                    if targets_enemies and not targets_towers:
-                        aura_radius_units = tower.special.get('aura_radius', 0)
-                        aura_radius_pixels = aura_radius_units * (config.GRID_SIZE / 200.0)
-                        aura_radius_sq = aura_radius_pixels ** 2
-                        enemy_aura_towers.append({
-                            'tower': tower,
-                            'radius_sq': aura_radius_sq,
-                            'special': tower.special
-                        })
-                        # Debug print to confirm inclusion
-                        #print(f"DEBUG: Included {tower.tower_id} (Type: {tower.attack_type}, Effect: {effect_type}) in enemy_aura_towers.")
-                        pass
+        # Whether a tower's aura affects enemies is decided once, when its spec is compiled
+        enemy_aura_towers = [EnemyAura(tower, tower.special_spec, tower.special_spec.aura_radius_sq, tower.effect_hooks.aura_apply)
+                             for tower in self.towers if tower.spec.is_enemy_aura]
+        aura_context = self.aura_context
+        aura_context.current_time = current_time
+        aura_context.time_delta = time_delta
+        aura_context.tower_buff_auras = self.tower_buff_auras
 
         
         # --- NEW: Process Tower-Targeting PULSE Auras --- 
         pulse_aura_towers = [
             t for t in self.towers 
-            if t.special and 
-            t.special.get("effect") == "crit_damage_pulse_aura" and # Or other pulse effects targeting towers
-            "towers" in t.special.get("targets", [])
+            if t.spec.effect == SpecialEffect.CRIT_DAMAGE_PULSE_AURA and # Or other pulse effects targeting towers
+            t.special_spec.targets_towers
         ]
         
         for pulse_tower in pulse_aura_towers:
-            special = pulse_tower.special
-            interval = special.get("interval", 1.0)
-            duration = special.get("duration", 1.0)
-            crit_bonus = special.get("crit_multiplier_bonus", 0.0)
+            special = pulse_tower.special_spec
+            interval = special.pulse_interval
+            duration = special.params.duration
+            crit_bonus = special.params.crit_multiplier_bonus
             aura_radius_sq = pulse_tower.aura_radius_pixels ** 2
             
             # Check if it's time to pulse
@@ -1722,9 +1547,8 @@ class GameScene:
                     # Use the pre-calculated aura_radius_pixels if available
                     if hasattr(pulse_tower, 'aura_radius_pixels'):
                         pulse_radius_pixels = pulse_tower.aura_radius_pixels
-                    else: # Fallback: Calculate from special data if needed
-                        aura_radius_units = special.get('aura_radius', 0)
-                        pulse_radius_pixels = aura_radius_units * (config.GRID_SIZE / 200.0) 
+                    else: # Fallback: Use the compiled radius
+                        pulse_radius_pixels = special.aura_radius_pixels
                         
                     pulse_color = (255, 0, 0, 100) # Faint RED (RGBA)
                     pulse_duration = 0.5 # seconds
@@ -1757,6 +1581,18 @@ class GameScene:
                     pass
         # --- END Tower Pulse Aura Processing ---
         
+        # --- NEW: Rebuild the enemy spatial index once for this tick ---
+        # Targeting, projectiles, zones, orbiters and exploders all query it below
+        # Cells come straight from the enemy store's position arrays
+        live_rows = self.enemy_store.live_slots()
+        self.enemy_index.rebuild(self.enemy_store.owners_of(live_rows),
+                                 self.enemy_store.cells_of(live_rows, self.enemy_index.cell_size))
+        # Towers whose range covers no cell holding a live enemy skip their target scan below
+        if self.tower_coverage_dirty or self.tower_coverage.key != self.grid.version:
+            self.tower_coverage.rebuild(self.towers, self.grid.version)
+            self.tower_coverage_dirty = False
+        towers_with_enemies = self.tower_coverage.towers_with_enemies(self.enemy_index.buckets)
+        
         # --- Update Towers --- 
         for tower in self.towers:
             # --- Call Tower's Internal Update (for self-managed abilities) --- 
@@ -1778,18 +1614,17 @@ class GameScene:
             effective_interval = buffed_stats['attack_interval'] # Use the buffed interval
             
             # --- Gold Generation Check (Modified for Random) --- 
-            if tower.special:
-                effect_type = tower.special.get("effect")
+            special = tower.special_spec
+            if special:
+                effect_type = special.effect
                 amount = 0 # Initialize amount
-                interval = tower.special.get("interval", 10.0) 
+                interval = special.gold_check_interval
                 
                 if current_time - tower.last_pulse_time >= interval:
-                    if effect_type == "random_gold_generation":
-                        min_gold = tower.special.get("min_gold", 1)
-                        max_gold = tower.special.get("max_gold", 1)
-                        amount = random.randint(min_gold, max_gold) # Generate random amount
-                    elif effect_type == "gold_generation":
-                        amount = tower.special.get("amount", 0) # Get fixed amount
+                    if effect_type == SpecialEffect.RANDOM_GOLD_GENERATION:
+                        amount = random.randint(special.params.min_gold, special.params.max_gold) # Generate random amount
+                    elif effect_type == SpecialEffect.GOLD_GENERATION:
+                        amount = special.params.amount # Get fixed amount
                     
                     if amount > 0:
                         self.money += amount
@@ -1818,14 +1653,14 @@ class GameScene:
             # --- End Gold Generation --- 
             
             # --- Specific Broadside Firing Logic --- 
-            is_broadside = tower.special and tower.special.get("effect") == "broadside"
+            is_broadside = tower.spec.effect == SpecialEffect.BROADSIDE
             if is_broadside:
                 if current_time - tower.last_attack_time >= effective_interval:
                     # Check if there are any enemies within range before firing
                     enemies_in_range = False
-                    for enemy in self.enemies:
-                        if enemy.health > 0 and enemy.type in tower.targets:
-                            if tower.is_in_range(enemy.x, enemy.y):
+                    if tower in towers_with_enemies:
+                        for enemy in self.enemy_index.query_annulus(tower.x, tower.y, tower.range_min_pixels, tower.range):
+                            if enemy.health > 0 and enemy.target_bit & tower.target_mask:
                                 enemies_in_range = True
                                 break
                     
@@ -1836,7 +1671,7 @@ class GameScene:
                         grid_offset_y = config.UI_PANEL_PADDING
                         # Capture and process results for broadside
                         # Pass self.towers for potential adjacency checks within attack
-                        attack_results = tower.attack(None, current_time, self.enemies, self.tower_buff_auras, grid_offset_x, grid_offset_y, all_towers=self.towers) 
+                        attack_results = tower.attack(None, current_time, self.enemies, self.tower_buff_auras, grid_offset_x, grid_offset_y, all_towers=self.towers, enemy_index=self.enemy_index) 
                         if isinstance(attack_results, dict):
                             new_projectiles = attack_results.get('projectiles', [])
                             if new_projectiles:
@@ -1849,13 +1684,21 @@ class GameScene:
             
             # --- Standard Attack Targeting Logic (Skip if Broadside handled above) ---
             elif not is_broadside:
+                # --- NEW: Towers still cooling down skip the target scan entirely ---
+                # Beams (and the facet focuser's beam visual) follow their targets every frame
+                if current_time < tower.last_attack_time + effective_interval \
+                        and tower.attack_type != 'beam' and tower.tower_id != 'crystal_castle_facet_focuser':
+                    continue
+
                 # --- 1. Find Potential Targets ---
                 potential_targets = []
-                for enemy in self.enemies: # Indentation Level 1 (12 spaces)
-                    if enemy.health > 0 and enemy.type in tower.targets:
-                        if tower.target_armor_type and enemy.armor_type not in tower.target_armor_type:
-                            continue
-                        if tower.is_in_range(enemy.x, enemy.y):
+                # Only enemies in the tower's range annulus come back from the index (same test as is_in_range).
+                # Towers covering no occupied cell leave the list empty without querying.
+                if tower in towers_with_enemies:
+                    for enemy in self.enemy_index.query_annulus(tower.x, tower.y, tower.range_min_pixels, tower.range):
+                        if enemy.health > 0 and enemy.target_bit & tower.target_mask:
+                            if tower.target_armor_type and enemy.armor_type not in tower.target_armor_type:
+                                continue
                             potential_targets.append(enemy)
 
                 # --- Select Actual Target(s) ---
@@ -1864,7 +1707,7 @@ class GameScene:
 
                 if tower.attack_type == 'beam': # Indentation Level 2 (16 spaces)
                     # Beam logic remains the same: target closest up to max_targets
-                    if tower.tower_data.get("target_priority") == "current" and tower.beam_targets:
+                    if tower.target_priority == "current" and tower.beam_targets:
                         # Keep current targets if they're still valid
                         valid_current_targets = []
                         for target in tower.beam_targets:
@@ -1875,14 +1718,12 @@ class GameScene:
                             current_primary_target = valid_current_targets[0]
                         else:
                             # If no valid current targets, fall back to closest targeting
-                            potential_targets.sort(key=lambda e: (e.x - tower.x)**2 + (e.y - tower.y)**2)
-                            actual_targets = potential_targets[:tower.beam_max_targets]
+                            actual_targets = tower.target_selector.best_k(tower.x, tower.y, potential_targets, tower.beam_max_targets)
                             tower.beam_targets = actual_targets
                             current_primary_target = actual_targets[0] if actual_targets else None
                     else:
-                        # Default beam targeting behavior
-                        potential_targets.sort(key=lambda e: (e.x - tower.x)**2 + (e.y - tower.y)**2)
-                        actual_targets = potential_targets[:tower.beam_max_targets]
+                        # Default beam targeting behavior (k best by the tower's priority; closest unless ordered otherwise)
+                        actual_targets = tower.target_selector.best_k(tower.x, tower.y, potential_targets, tower.beam_max_targets)
                         tower.beam_targets = actual_targets
                         current_primary_target = actual_targets[0] if actual_targets else None
 
@@ -1905,7 +1746,7 @@ class GameScene:
                     # --- END Beam Sound Management ---
 
                     # --- Laser Painter Target Tracking ---
-                    is_painter = tower.special and tower.special.get('effect') == 'laser_painter'
+                    is_painter = tower.spec.effect == SpecialEffect.LASER_PAINTER
                     if is_painter: # Indentation Level 3 (20 spaces)
                         if current_primary_target != tower.painting_target:
                             # Target changed or lost
@@ -2007,9 +1848,9 @@ class GameScene:
                     # --- NEW: Apply Beam Effects (Damage & Slow) --- 
                     # Check adjacency requirements first
                     proceed_with_beam_effects = True
-                    if tower.special and tower.special.get("effect") == "requires_solar_adjacency":
-                        required_count = tower.special.get("required_count", 3)
-                        race_to_check = tower.special.get("race_to_check", "solar")
+                    if tower.spec.effect == SpecialEffect.REQUIRES_SOLAR_ADJACENCY:
+                        required_count = tower.special_spec.params.required_count
+                        race_to_check = tower.special_spec.params.race_to_check
                         # Assuming self.towers is accessible here
                         adjacent_count = tower.count_adjacent_race_towers(self.towers, race_to_check)
                         if adjacent_count < required_count:
@@ -2026,7 +1867,7 @@ class GameScene:
                                     apply_damage_now = False
                                     if is_painter:
                                         if target_enemy == tower.painting_target and tower.paint_start_time > 0 and \
-                                           (current_time - tower.paint_start_time >= tower.special.get('charge_duration', 2.0)):
+                                           (current_time - tower.paint_start_time >= tower.special_spec.params.charge_duration):
                                             apply_damage_now = True
                                             tower.paint_start_time = 0.0 # Reset charge
                                     else:
@@ -2043,8 +1884,8 @@ class GameScene:
                                     # --- End Apply Damage ---
                                     
                                     # --- Apply Slow Effect --- 
-                                    if tower.special and tower.special.get('effect') == 'slow':
-                                        slow_percentage = tower.special.get('slow_percentage', 0)
+                                    if tower.spec.effect == SpecialEffect.SLOW:
+                                        slow_percentage = tower.special_spec.params.slow_percentage
                                         if slow_percentage > 0:
                                             # Calculate slow multiplier (e.g., 50% slow means 0.5x speed)
                                             slow_multiplier = 1.0 - (slow_percentage / 100.0)
@@ -2062,30 +1903,9 @@ class GameScene:
 
                 elif potential_targets: # Indentation Level 2 (16 spaces) - Non-beam tower with potential targets
                     # --- NEW: Target Priority Logic --- 
-                    target_priority = tower.tower_data.get("target_priority", "closest") # Default to closest
-                    
-                    # Perform sorting based on priority
-                    if target_priority == "highest_health":
-                        potential_targets.sort(key=lambda e: getattr(e, 'health', 0), reverse=True) # Use getattr for safety
-                    elif target_priority == "lowest_health":
-                        potential_targets.sort(key=lambda e: getattr(e, 'health', 0)) # Use getattr for safety
-                    elif target_priority == "furthest":
-                        potential_targets.sort(key=lambda e: (e.x - tower.x)**2 + (e.y - tower.y)**2, reverse=True)
-                    elif target_priority == "random":
-                        pass # Don't sort for random, pick later
-                    else: # Default is "closest"
-                        potential_targets.sort(key=lambda e: (e.x - tower.x)**2 + (e.y - tower.y)**2)
-                    
-                    # Select the target
-                    if target_priority == "random":
-                        if potential_targets: # Ensure list is not empty before choosing
-                            actual_targets = [random.choice(potential_targets)]
-                        else:
-                            actual_targets = [] # No target if list was empty
-                    elif potential_targets: # If list not empty after sorting (and not random)
-                        actual_targets = [potential_targets[0]] # Select the first one
-                    else: # Should not happen if potential_targets was initially non-empty, but safety check
-                        actual_targets = []
+                    # The priority was resolved to a selector once in Tower.__init__; one O(n) pass picks the target
+                    best_target = tower.target_selector.best(tower.x, tower.y, potential_targets)
+                    actual_targets = [best_target] if best_target is not None else []
                     # --- END: Target Priority Logic --- 
                     
                     # --- Store target for drawing --- 
@@ -2095,7 +1915,7 @@ class GameScene:
                     # --- Attack Check and Execution for Standard/Special Towers --- 
                     # (This block remains largely the same, using the `actual_targets` list determined above)
                     interval_ready = current_time >= tower.last_attack_time + effective_interval
-                    is_marking_tower = tower.special and tower.special.get("effect") == "apply_mark"
+                    is_marking_tower = tower.spec.effect == SpecialEffect.APPLY_MARK
                     is_whip_tower = tower.attack_type == 'whip'
 
                     if interval_ready and (actual_targets or is_marking_tower or is_whip_tower):
@@ -2140,7 +1960,8 @@ class GameScene:
                                 grid_offset_x,
                                 grid_offset_y,
                                 visual_assets=visual_assets,
-                                all_towers=self.towers
+                                all_towers=self.towers,
+                                enemy_index=self.enemy_index
                             )
                             # --- Process Generic Attack Results --- 
                             self.process_attack_results(attack_results, grid_offset_x, grid_offset_y)
@@ -2149,9 +1970,9 @@ class GameScene:
 
         # --- Process Pulsed Auras (Affecting Enemies) ---
         for aura_data in enemy_aura_towers: 
-            tower = aura_data['tower']
-            special = aura_data['special']
-            effect_type = special.get('effect')
+            tower = aura_data.tower
+            special = aura_data.special
+            effect_type = special.effect
             
             # Special debug for miasma pillar
             if tower.tower_id == 'alchemists_miasma_pillar':
@@ -2159,8 +1980,8 @@ class GameScene:
                 pass
 
             # Check if this aura is a pulsed type
-            if effect_type and effect_type.endswith('_pulse_aura'):
-                interval = special.get('interval', 1.0)
+            if special.is_pulse_aura:
+                interval = special.pulse_interval
                 # Check pulse timing ONCE per tower
                 #print(f"PULSE-DEBUG: Tower {tower.tower_id} checking pulse timing | Current time: {current_time:.2f} | Last pulse: {tower.last_pulse_time:.2f} | Interval: {interval}")
                 pass
@@ -2168,8 +1989,8 @@ class GameScene:
                     #print(f"PULSE-DEBUG: Tower {tower.tower_id} TRIGGERING PULSE NOW!")
                     tower.last_pulse_time = current_time # Update time immediately
 
-                    radius_sq = aura_data['radius_sq']
-                    allowed_targets = special.get('targets', [])
+                    radius_sq = aura_data.radius_sq
+                    allowed_mask = special.target_mask # "enemies" covers both ground and air
                    
                     # --- Create Visual Pulse Effect --- 
                     try:
@@ -2230,80 +2051,26 @@ class GameScene:
                     # --- End Visual Pulse Effect ---
 
                     # Now find and affect ALL valid enemies in range
-                    for enemy in self.enemies: # Iterate through all current enemies
+                    for enemy in self.enemy_index.query_circle(tower.x, tower.y, math.sqrt(radius_sq)): # Only enemies near the pulse
                         # --- DEBUG: Target Type & Range Pre-check ---
                         if tower.tower_id == 'igloo_frost_pulse': # Log for frost pulse
                             #print(f"FROST PULSE DEBUG: Checking {enemy.enemy_id} at distance {math.sqrt((enemy.x - tower.x)**2 + (enemy.y - tower.y)**2):.1f}px")
                             pass
                         # --- END DEBUG ---
                         
-                        # Handle both array format ["ground", "air"] and string format "enemies"
-                        is_valid_target = False
-                        if isinstance(allowed_targets, list):
-                            is_valid_target = enemy.type in allowed_targets
-                        elif allowed_targets == "enemies":
-                            is_valid_target = True  # "enemies" means all enemy types
-                        
-                        if enemy.health > 0 and is_valid_target:
+                        # Targets were compiled to a bitmask (array format ["ground", "air"] or string format "enemies")
+                        if enemy.health > 0 and enemy.target_bit & allowed_mask:
                             dist_sq = (enemy.x - tower.x)**2 + (enemy.y - tower.y)**2
                             if dist_sq <= radius_sq:
-                                # Apply the specific pulse effect
-                                if effect_type == 'slow_pulse_aura':
-                                    slow_percentage = special.get('slow_percentage', 0)
-                                    duration = special.get('duration', 1.0)
-                                    multiplier = 1.0 - (slow_percentage / 100.0)
-                                    enemy.apply_status_effect('slow', duration, multiplier, current_time)
-                                elif effect_type == 'damage_pulse_aura':
-                                    pulse_damage = special.get('pulse_damage', 0)
-                                    damage_type = special.get('pulse_damage_type', 'normal')
-                                    enemy.take_damage(pulse_damage, damage_type)
-                   
-
-                                elif effect_type == 'stun_pulse_aura':
-                                    duration = special.get('duration', 0.5)
-                                    enemy.apply_status_effect('stun', duration, None, current_time)
-    
-                                
-                                # --- NEW: Bonechill Pulse --- 
-                                elif effect_type == 'bonechill_pulse_aura':
-                                    duration = special.get('bonechill_duration', 3.0) # Get duration from JSON, default 3s
-                                    enemy.apply_status_effect('bonechill', duration, None, current_time)
-                                    # --- ADDED BONECHILL APPLICATION LOG ---
-                                    print(f"$$$ BONECHILL APPLIED by {tower.tower_id} to {enemy.enemy_id} for {duration}s at {current_time:.2f}s")
-                                    # --- END LOG ---
-
-                                # --- End Bonechill Pulse --- 
-
-                                # --- NEW: DoT Pulse Aura --- 
-                                elif effect_type == 'dot_pulse_aura':
-                                    dot_name = special.get('dot_effect_name', 'unnamed_dot')
-                                    base_dot_damage = special.get('dot_damage', 0)
-                                    dot_interval = special.get('dot_interval', 1.0)
-                                    dot_duration = special.get('dot_duration', 1.0)
-                                    dot_damage_type = special.get('dot_damage_type', 'normal')
-                                    
-                                    # Get amplification from nearby Plague Reactors
-                                    amp_multiplier = tower.get_dot_amplification_multiplier(self.tower_buff_auras)
-                                    amplified_dot_damage = base_dot_damage * amp_multiplier
-                                    
-                                    # Apply the DoT to the enemy
-                                    enemy.apply_dot_effect(dot_name, amplified_dot_damage, dot_interval, dot_duration, dot_damage_type, current_time)
-                                    
-                                    # --- CHECK FOR SLOW EFFECT IN DOT PULSE ---
-                                    slow_percentage = special.get('slow_percentage', 0)
-                                    if slow_percentage > 0:
-                                        slow_duration = special.get('duration', 1.0)
-                                        slow_multiplier = 1.0 - (slow_percentage / 100.0)
-                                        enemy.apply_status_effect('slow', slow_duration, slow_multiplier, current_time)
-                                    # --- END SLOW EFFECT CHECK ---
-                                   
-                                # --- End DoT Pulse Aura ---
+                                # Apply the specific pulse effect (handler registered for the tower's effect)
+                                if aura_data.apply:
+                                    aura_data.apply(tower, special, enemy, dist_sq, aura_context)
 
         # --- Update Projectiles --- 
         newly_created_projectiles = [] # List to hold projectiles from bounces/splits etc.
         newly_created_effects = [] # List to hold effects from impacts
         
-        for proj in self.projectiles[:]:
+        for proj in self.projectiles: # Removal marks dead; no copy needed
             # --- CHECK PROJECTILE TYPE ---
             is_boomerang = type(proj).__name__ == 'OffsetBoomerangProjectile'
             is_grenade = type(proj).__name__ == 'GrenadeProjectile'
@@ -2312,7 +2079,7 @@ class GameScene:
 
             if is_boomerang:
                 # --- Update Boomerang (which manages its own 'finished' state) ---
-                proj.update(time_delta, self.enemies) # Boomerang update handles collisions and state changes internally
+                proj.update(time_delta, self.enemies, enemy_index=self.enemy_index) # Boomerang update handles collisions and state changes internally
                 if proj.finished:
                     try:
                         self.projectiles.remove(proj)
@@ -2321,10 +2088,10 @@ class GameScene:
                         print("Warning: Tried to remove finished boomerang that was already removed?")
             elif is_grenade:
                 # --- Update Grenade (which handles its own collisions and detonation) ---
-                proj.move(time_delta, self.enemies, self.towers)
+                proj.move(time_delta, self.enemies, self.towers, enemy_index=self.enemy_index)
                 if proj.has_detonated:
                     # Get explosion result
-                    explosion_result = proj.detonate(self.enemies)
+                    explosion_result = proj.detonate(self.enemies, enemy_index=self.enemy_index)
                     # Add any new effects
                     if explosion_result.get('new_effects'):
                         newly_created_effects.extend(explosion_result['new_effects'])
@@ -2367,16 +2134,15 @@ class GameScene:
                 else:
                     # Normal projectile movement
                     if is_standard_projectile:
-                        proj.move(time_delta, self.enemies)
+                        # Opt-in homing shots skip per-frame steering and land from the impact wheel
+                        if proj.begin_deferred_impact(current_time):
+                            self.projectiles.remove(proj)
+                            self.deferred_projectiles[proj] = None
+                            self.impact_wheel.schedule(proj.impact_time, proj)
+                            continue
+                        proj.move(time_delta, self.enemies, enemy_index=self.enemy_index)
                         if proj.collided:
-                            # Get collision results
-                            collision_result = proj.on_collision(self.enemies, current_time, self.tower_buff_auras)
-                            # Add any new projectiles
-                            if collision_result.get('new_projectiles'):
-                                newly_created_projectiles.extend(collision_result['new_projectiles'])
-                            # Add any new effects
-                            if collision_result.get('new_effects'):
-                                newly_created_effects.extend(collision_result['new_effects'])
+                            self.process_projectile_collision(proj, current_time, newly_created_projectiles, newly_created_effects)
                             # Check if projectile should linger (e.g., alien_prober)
                             # Only Projectile instances can linger
                             if hasattr(proj, 'is_lingering') and not proj.is_lingering:
@@ -2390,6 +2156,19 @@ class GameScene:
                         if hasattr(proj, 'collided') and proj.collided:
                             self.projectiles.remove(proj)
 
+        # --- Deferred-impact shots reaching their target this frame ---
+        for proj in self.impact_wheel.advance(current_time):
+            if proj not in self.deferred_projectiles:
+                continue
+            del self.deferred_projectiles[proj]
+            if proj.resolve_deferred_impact():
+                self.process_projectile_collision(proj, current_time, newly_created_projectiles, newly_created_effects)
+                if proj.is_lingering:
+                    self.projectiles.append(proj) # Linger timer runs in the loop above
+            else:
+                self.projectiles.append(proj) # Target teleported: simulate the rest of the flight
+        # --- End Deferred Impacts ---
+
         # Add any newly created items to the main lists AFTER iterating
         if newly_created_projectiles:
             self.projectiles.extend(newly_created_projectiles)
@@ -2399,24 +2178,8 @@ class GameScene:
             # print(f"Added {len(newly_created_effects)} new effects to main list.")
 
         # --- Update Visual Effects ---
-        for effect in self.effects[:]:  # Use a slice copy for safe removal
-            try:
-                # Call update() and check if effect is finished
-                if hasattr(effect, 'update') and callable(effect.update):
-                    if isinstance(effect, GroundEffectZone):
-                        if effect.update(time_delta, self.enemies):
-                            self.effects.remove(effect)
-                    else:
-                        if effect.update(time_delta):
-                            self.effects.remove(effect)
-                elif hasattr(effect, 'finished') and effect.finished:
-                    self.effects.remove(effect)
-            except Exception as e:
-                print(f"Error updating effect: {e}")
-                try:
-                    self.effects.remove(effect)  # Remove problematic effect
-                except ValueError:
-                    pass  # Already removed
+        # Each effect is updated exactly once per tick (ground zones also get the enemies)
+        self.effects.update(time_delta, self.enemies, enemy_index=self.enemy_index)
         # --- End Update Visual Effects ---
 
         # --- Update Status Visualizers --- <<< ADDED BLOCK
@@ -2432,306 +2195,172 @@ class GameScene:
         current_time_seconds = pygame.time.get_ticks() / 1000.0
         for tower in self.towers:
             for orb in tower.orbiters[:]: # Use slice copy for potential removal
-                if orb.update(time_delta, self.enemies, current_time_seconds):
+                if orb.update(time_delta, self.enemies, current_time_seconds, enemy_index=self.enemy_index):
                     # If update returns True (e.g., lifetime expired), remove
                     # tower.orbiters.remove(orb) 
                     pass # No removal logic yet
         # --- End Orbiter Update ---
 
         # --- Update Pass-Through Exploders --- 
-        for exploder in self.pass_through_exploders[:]: # Use slice copy for safe removal
-            should_remove = exploder.update(time_delta, self.enemies, current_time_seconds)
+        for exploder in self.pass_through_exploders:
+            should_remove = exploder.update(time_delta, self.enemies, current_time_seconds, enemy_index=self.enemy_index)
             if should_remove:
                 # update returns True when max distance is reached and explosion is done
                 self.pass_through_exploders.remove(exploder)
         # --- End Pass-Through Exploder Update ---
 
-        # --- Update GROUND Effects (Like Fallout Zone) --- 
-        # This section can be removed since we now handle GroundEffectZone in the main loop
-        # --- End Ground Effects ---
-
-        # --- Update Standard Effects --- 
-        for effect in [ef for ef in self.effects if not isinstance(ef, GroundEffectZone)][:]:
-            if isinstance(effect, FlamethrowerParticleEffect):
-                # Flamethrower effect update doesn't return True/False for finish status yet
-                # It sets self.finished internally
-                effect.update(time_delta)
-                if effect.finished:
-                    try: self.effects.remove(effect) 
-                    except ValueError: pass
-            elif isinstance(effect, AcidSpewParticleEffect): # Added check for AcidSpew
-                effect.update(time_delta)
-                if effect.finished:
-                    try: self.effects.remove(effect) 
-                    except ValueError: pass
-            elif isinstance(effect, DrainParticleEffect): # NEW: Check for DrainParticleEffect
-                effect.update(time_delta)
-                if effect.finished:
-                    try: self.effects.remove(effect) 
-                    except ValueError: pass
-            elif effect.update(time_delta): # Standard effects return True when finished
-                try: self.effects.remove(effect)
-                except ValueError: pass
-            
         # --- NEW: Apply Enemy Aura Effects --- 
-        # Reset aura effects on all enemies first
-        for enemy in self.enemies:
+        # Aura towers are static: the per-cell aura map is rebuilt only when towers change
+        if self.enemy_aura_map_dirty:
+            armor_auras = []
+            for aura_tower in self.towers:
+                special = aura_tower.special_spec
+                if special and special.target_mask & TARGET_ENEMIES and special.effect == SpecialEffect.ENEMY_ARMOR_REDUCTION_AURA:
+                    reduction_amount = special.params.reduction_amount
+                    if reduction_amount > 0:
+                        armor_auras.append((aura_tower, aura_tower.aura_radius_pixels, reduction_amount))
+            # Pulsed auras fire on their own timer above, so only continuous ones go in the map
+            # (and only those with an aura_apply handler, so enemies never visit auras that do nothing)
+            continuous_auras = [aura_data for aura_data in enemy_aura_towers
+                                if not aura_data.special.is_pulse_aura and aura_data.apply]
+            self.enemy_aura_map.rebuild(continuous_auras, armor_auras)
+            self.enemy_aura_map_dirty = False
+
+        # Positions and health are read from the enemy store arrays in one go (auras never move
+        # an enemy, and each aura only damages the enemy it is applied to)
+        live_rows = self.enemy_store.live_slots()
+        live_state = list(zip(self.enemy_store.owners_of(live_rows),
+                              self.enemy_store.x[live_rows].tolist(),
+                              self.enemy_store.y[live_rows].tolist(),
+                              self.enemy_store.health[live_rows].tolist()))
+
+        # Reset aura effects on all enemies, then apply the strongest armor reduction for each enemy's cell
+        for enemy, enemy_x, enemy_y, enemy_health in live_state:
             enemy.aura_armor_reduction = 0
             # Reset other potential enemy aura effects here
-        
-        # Find towers with enemy-affecting auras
-        enemy_aura_towers_to_process = [t for t in self.towers if t.special and t.special.get("targets") and ("enemies" in t.special.get("targets") or "ground" in t.special.get("targets") or "air" in t.special.get("targets")) and t.special.get("effect") == "enemy_armor_reduction_aura"]
-        
-        # Apply effects
-        for aura_tower in enemy_aura_towers_to_process:
-            reduction_amount = aura_tower.special.get("reduction_amount", 0)
-            if reduction_amount > 0:
-                aura_radius_sq = aura_tower.aura_radius_pixels ** 2
-                for enemy in self.enemies:
-                    if enemy.health > 0:
-                        dist_sq = (enemy.x - aura_tower.x)**2 + (enemy.y - aura_tower.y)**2
-                        if dist_sq <= aura_radius_sq:
-                            # Apply the reduction - use max if multiple auras could stack, or just set if non-stacking
-                            enemy.aura_armor_reduction = max(enemy.aura_armor_reduction, reduction_amount)
-                            #print(f"DEBUG: Applied aura reduction {reduction_amount} from {aura_tower.tower_id} to {enemy.enemy_id}. Current total: {enemy.aura_armor_reduction}") # Optional Debug
+            if enemy_health > 0:
+                aura_cell = self.enemy_aura_map.lookup(enemy_x, enemy_y)
+                if aura_cell is not None:
+                    enemy.aura_armor_reduction = aura_cell.armor_reduction_at(enemy_x, enemy_y)
         # --- END Enemy Aura Effects ---
         
         # --- Update Enemies (Main Loop) --- 
-        for enemy in self.enemies[:]:
+        for enemy, enemy_x, enemy_y, enemy_health in live_state:
             # --- Apply Continuous Auras (Affecting Enemies) --- 
-            if enemy.health > 0:
-                # Ensure this loop uses enemy_aura_towers
-                for aura_data in enemy_aura_towers:
-                    tower = aura_data['tower']
-                    special = aura_data['special']
-                    radius_sq = aura_data['radius_sq']
-                    effect_type = special.get('effect')
-
-                    # Skip pulsed auras (handled above)
-                    if effect_type and effect_type.endswith('_pulse_aura'):
-                        continue 
-                    
-                    # Check distance
-                    dist_sq = (enemy.x - tower.x)**2 + (enemy.y - tower.y)**2
-                    if dist_sq <= radius_sq:
-                        allowed_targets = special.get('targets', []) 
-                        if enemy.type in allowed_targets:
-                            # Handle Continuous Auras 
-                            if effect_type == 'damage_aura':
-                                dot_damage = special.get('dot_damage', 0)
-                                dot_interval = special.get('dot_interval', 1.0)
-                                if dot_interval > 0:
-                                    damage_per_sec = dot_damage / dot_interval
-                                    damage_this_frame = damage_per_sec * time_delta
-                                    damage_type = special.get('dot_damage_type', 'normal')
-                                    enemy.take_damage(damage_this_frame, damage_type)
-                                    
-                            elif effect_type == 'radiance_aura': # Handle Sun King's Radiance
-                                dot_damage = special.get('dot_damage', 0)
-                                dot_interval = special.get('dot_interval', 1.0)
-                                if dot_interval > 0:
-                                    damage_per_sec = dot_damage / dot_interval
-                                    damage_this_frame = damage_per_sec * time_delta
-                                    damage_type = special.get('dot_damage_type', 'fire') # Use fire as default for radiance
-                                    enemy.take_damage(damage_this_frame, damage_type)
-
-                            elif effect_type == 'slow_aura':
-                                slow_percentage = special.get('slow_percentage', 0)
-                                multiplier = 1.0 - (slow_percentage / 100.0)
-                                enemy.apply_status_effect('slow', time_delta * 1.5, multiplier, current_time)
-                                
-                            elif effect_type == 'storm_aura': # Added check for storm_aura
-                                # Apply Damage Component
-                                dot_damage = special.get('dot_damage', 0)
-                                dot_interval = special.get('dot_interval', 1.0)
-                                if dot_interval > 0:
-                                    damage_per_sec = dot_damage / dot_interval
-                                    damage_this_frame = damage_per_sec * time_delta
-                                    damage_type = special.get('dot_damage_type', 'arcane') # Default to arcane for storm?
-                                    enemy.take_damage(damage_this_frame, damage_type)
-                                # Apply Slow Component
-                                slow_percentage = special.get('slow_percentage', 0)
-                                if slow_percentage > 0:
-                                    multiplier = 1.0 - (slow_percentage / 100.0)
-                                    enemy.apply_status_effect('slow', time_delta * 1.5, multiplier, current_time)
-                                    
-                            # --- NEW: Vortex Damage Aura --- 
-                            elif effect_type == 'vortex_damage_aura':
-                                tick_interval = special.get('tick_interval', 0.1) 
-                                # Check interval using the tower's last_aura_tick_time
-                                if current_time >= tower.last_aura_tick_time + tick_interval:
-                                    # Update tick time ONCE per tower, after interval check
-                                    tower.last_aura_tick_time = current_time 
-                                    # Get damage parameters
-                                    min_dmg = special.get('min_damage_at_edge', 0)
-                                    max_dmg = special.get('max_damage_at_center', 0)
-                                    damage_type = special.get('damage_type', 'arcane')
-                                    aura_radius = special.get('aura_radius', 0) # Radius in abstract units
-                                    
-                                    # Calculate radius squared in pixels
-                                    radius_scale_factor = config.GRID_SIZE / 200.0
-                                    aura_radius_pixels = aura_radius * radius_scale_factor
-                                    aura_radius_pixels_sq = aura_radius_pixels ** 2
-
-                                    # Calculate distance squared (already have dist_sq from outer loop)
-                                    # dist_sq = (enemy.x - tower.x)**2 + (enemy.y - tower.y)**2
-                                    
-                                    if aura_radius_pixels > 0: # Avoid division by zero if radius is 0
-                                        # Calculate normalized distance (0 at center, 1 at edge)
-                                        normalized_distance = math.sqrt(dist_sq) / aura_radius_pixels
-                                        normalized_distance = max(0.0, min(1.0, normalized_distance)) # Clamp between 0 and 1
-                                        
-                                        # Calculate damage scale factor (1 at center, 0 at edge)
-                                        damage_scale_factor = 1.0 - normalized_distance
-                                        
-                                        # Calculate damage for this tick
-                                        damage_range = max_dmg - min_dmg
-                                        damage_this_tick = min_dmg + (damage_range * damage_scale_factor)
-                                        
-                                        if damage_this_tick > 0:
-                                            # print(f"DEBUG Vortex: Dist={math.sqrt(dist_sq):.1f}/{aura_radius_pixels:.1f}, NormDist={normalized_distance:.2f}, Scale={damage_scale_factor:.2f}, Dmg={damage_this_tick:.2f}") # Debug
-                                            enemy.take_damage(damage_this_tick, damage_type)
-                                            # Note: Need to update tower.last_aura_tick_time outside this inner enemy loop << FIXED
-                            # --- END Vortex Damage Aura --- 
-
-            # --- Move Enemy --- 
-            # Enemy.move() handles status updates internally
-            # Pass avg_tile_size for consistent coordinate conversion
-            enemy.move(current_time, tile_size=self.avg_tile_size)
-            
-            # --- Continue moving towards objective midpoint if path finished ---
-            # Calculate midpoint of objective area in grid-relative pixel coordinates
-            objective_midpoint_x_grid = self.objective_area_x + config.OBJECTIVE_AREA_WIDTH // 2
-            objective_midpoint_y_grid = self.objective_area_y + config.OBJECTIVE_AREA_HEIGHT // 2
-            objective_midpoint_x = objective_midpoint_x_grid * self.avg_tile_size + (self.avg_tile_size // 2)
-            objective_midpoint_y = objective_midpoint_y_grid * self.avg_tile_size + (self.avg_tile_size // 2)
+            aura_cell = self.enemy_aura_map.lookup(enemy_x, enemy_y) if enemy_health > 0 else None
+            if aura_cell is not None and aura_cell.auras:
+                strongest_slow = None # Overlapping slows collapse to the strongest one
+                for aura_data, fully_covered in aura_cell.auras:
+                    tower = aura_data.tower
+                    special = aura_data.special
+
+                    # Check distance (only needed when the aura covers part of this cell, or for vortex falloff)
+                    dist_sq = (enemy_x - tower.x)**2 + (enemy_y - tower.y)**2
+                    if fully_covered or dist_sq <= aura_data.radius_sq:
+                        if enemy.target_bit & special.target_mask:
+                            # Handle Continuous Auras (damage is applied by the handler, slows are returned)
+                            slow_multiplier = aura_data.apply(tower, special, enemy, dist_sq, aura_context)
+                            if slow_multiplier is not None and (strongest_slow is None or slow_multiplier < strongest_slow):
+                                strongest_slow = slow_multiplier
+
+                # One slow application per frame, using the strongest aura covering the enemy
+                if strongest_slow is not None:
+                    enemy.apply_status_effect('slow', time_delta * 1.5, strongest_slow, current_time)
+
+        # --- Move Enemies ---
+        # One vectorised pass over the enemy store (status expiry, DoTs, path following, wander)
+        # Pass avg_tile_size for consistent coordinate conversion
+        self.enemy_store.maybe_compact()
+        self.enemy_store.step(current_time, self.avg_tile_size)
+
+        # --- Continue moving towards objective midpoint if path finished ---
+        # Calculate midpoint of objective area in grid-relative pixel coordinates
+        objective_midpoint_x_grid = self.objective_area_x + config.OBJECTIVE_AREA_WIDTH // 2
+        objective_midpoint_y_grid = self.objective_area_y + config.OBJECTIVE_AREA_HEIGHT // 2
+        objective_midpoint_x = objective_midpoint_x_grid * self.avg_tile_size + (self.avg_tile_size // 2)
+        objective_midpoint_y = objective_midpoint_y_grid * self.avg_tile_size + (self.avg_tile_size // 2)
+        live_rows = self.enemy_store.live_slots()
+        # enemy.speed is already in pixels per frame, no time_delta needed
+        self.enemy_store.walk_past_path_end(objective_midpoint_x, objective_midpoint_y, live_rows)
+
+        # --- Check for Walkover Tower Trigger --- 
+        # Only enemies standing on a walkover tower's tile are visited (one mask over the store positions)
+        # Assumes walkover towers are 1x1 for simplicity now
+        walkover_towers = {(tower.top_left_grid_x, tower.top_left_grid_y): tower
+                           for tower in self.towers if tower.spec.trigger_on_walkover}
+        if walkover_towers:
+            walkover_rows = self.enemy_store.rows_in_cells(live_rows, self.avg_tile_size, walkover_towers)
+            for enemy in self.enemy_store.owners_of(walkover_rows):
+                if enemy.health > 0:
+                    tower = walkover_towers[(int(enemy.x // self.avg_tile_size), int(enemy.y // self.avg_tile_size))]
+                    # Check if enemy type is a valid target
+                    if enemy.target_bit & tower.target_mask:
+                        # Apply the special effect (e.g., burn DoT)
+                        on_walkover = tower.effect_hooks.on_walkover
+                        if on_walkover:
+                            on_walkover(tower, tower.special_spec, enemy, aura_context)
+                        # Other walkover effects (e.g. instant damage) register an on_walkover handler
+        # --- End Walkover Check --- 
+
+        # --- Objective check --- 
+        # Check if enemy has reached the midpoint of the objective area
+        # For Y: enemy must have reached or passed the midpoint (since enemies move top to bottom)
+        # For X: enemy should be within a reasonable range of the midpoint (within half the objective width)
+        x_tolerance = (config.OBJECTIVE_AREA_WIDTH * self.avg_tile_size) // 2
+        objective_rows = self.enemy_store.rows_reaching(live_rows, objective_midpoint_x, objective_midpoint_y, x_tolerance)
+        # If enemy has reached the midpoint, remove them (they are skipped by the death check below)
+        for enemy in self.enemy_store.owners_of(objective_rows):
             
-            # If enemy has finished the path but hasn't reached the midpoint yet, continue moving
-            if enemy.path_index >= len(enemy.grid_path):
-                # Calculate direction to midpoint
-                dx = objective_midpoint_x - enemy.x
-                dy = objective_midpoint_y - enemy.y
-                distance = math.sqrt(dx**2 + dy**2)
-                
-                if distance > 0:
-                    # Move towards midpoint (enemy.speed is already in pixels per frame, no time_delta needed)
-                    move_x = (dx / distance) * enemy.speed
-                    move_y = (dy / distance) * enemy.speed
-                    enemy.x += move_x
-                    enemy.y += move_y
-                    # Update rect position
-                    enemy.rect.center = (int(enemy.x), int(enemy.y))
+            # --- Check for Boss Reaching Objective (Loss Condition) ---
+            instant_loss = False
+            game_mode = self.game.selected_wave_mode
+            boss_ids_for_loss = []
+            if game_mode == 'classic' or game_mode == 'plus':
+                boss_ids_for_loss = ['lord_supermaul']
+            elif game_mode == 'advanced' or game_mode == 'wild':
+                boss_ids_for_loss = ['lord_supermaul', 'lord_supermaul_reborn']
             
-            # --- Check for Walkover Tower Trigger --- 
-            if enemy.health > 0:
-                current_grid_x = int(enemy.x // self.avg_tile_size)
-                current_grid_y = int(enemy.y // self.avg_tile_size)
-                
-                for tower in self.towers:
-                    # Check if tower triggers on walkover and enemy is on its tile
-                    # Assumes walkover towers are 1x1 for simplicity now
-                    if tower.tower_data.get("trigger_on_walkover", False) and \
-                       tower.top_left_grid_x == current_grid_x and \
-                       tower.top_left_grid_y == current_grid_y:
-                           
-                       # Check if enemy type is a valid target
-                       if enemy.type in tower.targets:
-                            # Apply the special effect (e.g., burn DoT)
-                            if tower.special:
-                                effect_type = tower.special.get("effect")
-                                if effect_type == "burn":
-                                    base_dot_damage = tower.special.get("dot_damage", 0)
-                                    dot_interval = tower.special.get("dot_interval", 1.0)
-                                    dot_duration = tower.special.get("dot_duration", 1.0)
-                                    dot_damage_type = tower.special.get("dot_damage_type", tower.damage_type)
-                                    # Get amplification
-                                    amp_multiplier = tower.get_dot_amplification_multiplier(self.tower_buff_auras)
-                                    amplified_dot_damage = base_dot_damage * amp_multiplier
-                                    # Apply the burn DoT
-                                    enemy.apply_dot_effect(effect_type, amplified_dot_damage, dot_interval, dot_duration, dot_damage_type, current_time)
-                                    #print(f"Enemy {enemy.enemy_id} walked over Fire Pit {tower.tower_id}, applied burn.")
-                                # --- Add check for Earth Spine --- 
-                                elif effect_type == "ground_spike_dot":
-                                    base_dot_damage = tower.special.get("dot_damage", 0)
-                                    dot_interval = tower.special.get("dot_interval", 1.0)
-                                    dot_duration = tower.special.get("dot_duration", 1.0)
-                                    dot_damage_type = tower.special.get("dot_damage_type", tower.damage_type)
-                                    # Get amplification
-                                    amp_multiplier = tower.get_dot_amplification_multiplier(self.tower_buff_auras)
-                                    amplified_dot_damage = base_dot_damage * amp_multiplier
-                                    # Apply the spike DoT
-                                    enemy.apply_dot_effect(effect_type, amplified_dot_damage, dot_interval, dot_duration, dot_damage_type, current_time)
-                                    #print(f"Enemy {enemy.enemy_id} walked over Earth Spine {tower.tower_id}, applied {effect_type}.")
-                                # Add other walkover effects here if needed (e.g., instant damage)
-                                # elif effect_type == "walkover_damage": ... 
-                                break # Stop checking towers for this enemy once triggered
-            # --- End Walkover Check --- 
-
-            # --- Objective check --- 
-            # Reuse the midpoint calculation from above (already calculated before walkover check)
-            # Check if enemy has reached the midpoint of the objective area
-            # For Y: enemy must have reached or passed the midpoint (since enemies move top to bottom)
-            # For X: enemy should be within a reasonable range of the midpoint (within half the objective width)
-            x_tolerance = (config.OBJECTIVE_AREA_WIDTH * self.avg_tile_size) // 2
-            has_reached_objective = (enemy.y >= objective_midpoint_y and 
-                                    abs(enemy.x - objective_midpoint_x) <= x_tolerance)
-            
-            # If enemy has reached the midpoint, remove them
-            if has_reached_objective:
-                
-                # --- Check for Boss Reaching Objective (Loss Condition) ---
-                instant_loss = False
-                game_mode = self.game.selected_wave_mode
-                boss_ids_for_loss = []
-                if game_mode == 'classic' or game_mode == 'plus':
-                    boss_ids_for_loss = ['lord_supermaul']
-                elif game_mode == 'advanced' or game_mode == 'wild':
-                    boss_ids_for_loss = ['lord_supermaul', 'lord_supermaul_reborn']
+            if enemy.enemy_id in boss_ids_for_loss:
+                #print(f"!!! BOSS LOSS CONDITION MET: {enemy.enemy_id} reached objective in {game_mode} mode.")
+                trigger_game_end(is_victory=False)
+                instant_loss = True # Game ended, stop further processing
+            # --- End Boss Check ---
+
+            if not instant_loss and self.game_state == GAME_STATE_RUNNING:
+                # Only deduct life if game hasn't ended due to boss
+                self.lives -= 1
+                # Update tower selector lives display if present
+                if hasattr(self, 'tower_selector') and self.tower_selector:
+                    try:
+                        self.tower_selector.update_lives(self.lives)
+                    except Exception:
+                        pass
+                # --- Play Life Loss Sound ---
+                if self.loss_life_sound:
+                    self.loss_life_sound.play()
+                # --- End Play Sound ---
+                #print(f"*** OBJECTIVE REACHED by {enemy.enemy_id}. Decrementing wave counter from {self.enemies_alive_this_wave}...") # DEBUG
+                # Only decrement if this enemy belongs to the current wave
+                if hasattr(enemy, 'wave_index') and enemy.wave_index == self.current_wave_index:
+                    if self.enemies_alive_this_wave > 0: self.enemies_alive_this_wave -= 1
+                self.enemies.remove(enemy)
+                #print(f"Enemy reached objective. Lives remaining: {self.lives}")
+                #print(f"  Enemies left this wave NOW: {self.enemies_alive_this_wave}") # DEBUG
                 
-                if enemy.enemy_id in boss_ids_for_loss:
-                    #print(f"!!! BOSS LOSS CONDITION MET: {enemy.enemy_id} reached objective in {game_mode} mode.")
+                # --- Check Lives <= 0 (Loss Condition) ---
+                if self.lives <= 0:
                     trigger_game_end(is_victory=False)
-                    instant_loss = True # Game ended, stop further processing
-                # --- End Boss Check ---
-
-                if not instant_loss and self.game_state == GAME_STATE_RUNNING:
-                    # Only deduct life if game hasn't ended due to boss
-                    self.lives -= 1
-                    # Update tower selector lives display if present
-                    if hasattr(self, 'tower_selector') and self.tower_selector:
-                        try:
-                            self.tower_selector.update_lives(self.lives)
-                        except Exception:
-                            pass
-                    # --- Play Life Loss Sound ---
-                    if self.loss_life_sound:
-                        self.loss_life_sound.play()
-                    # --- End Play Sound ---
-                    #print(f"*** OBJECTIVE REACHED by {enemy.enemy_id}. Decrementing wave counter from {self.enemies_alive_this_wave}...") # DEBUG
-                    # Only decrement if this enemy belongs to the current wave
-                    if hasattr(enemy, 'wave_index') and enemy.wave_index == self.current_wave_index:
-                        if self.enemies_alive_this_wave > 0: self.enemies_alive_this_wave -= 1
-                    self.enemies.remove(enemy)
-                    #print(f"Enemy reached objective. Lives remaining: {self.lives}")
-                    #print(f"  Enemies left this wave NOW: {self.enemies_alive_this_wave}") # DEBUG
-                    
-                    # --- Check Lives <= 0 (Loss Condition) ---
-                    if self.lives <= 0:
-                        trigger_game_end(is_victory=False)
-                    # --- End Lives Check ---
-                elif enemy in self.enemies: # Only remove if not already removed by state change
-                    # Remove enemy even if game ended, but don't process further
-                    # Only decrement if this enemy belongs to the current wave
-                    if hasattr(enemy, 'wave_index') and enemy.wave_index == self.current_wave_index:
-                        if self.enemies_alive_this_wave > 0: self.enemies_alive_this_wave -= 1
-                    self.enemies.remove(enemy) 
-                
-                # Continue to next enemy in the loop regardless of state change this iteration
-                continue # Skip death check below if enemy reached objective 
+                # --- End Lives Check ---
+            elif enemy in self.enemies: # Only remove if not already removed by state change
+                # Remove enemy even if game ended, but don't process further
+                # Only decrement if this enemy belongs to the current wave
+                if hasattr(enemy, 'wave_index') and enemy.wave_index == self.current_wave_index:
+                    if self.enemies_alive_this_wave > 0: self.enemies_alive_this_wave -= 1
+                self.enemies.remove(enemy) 
         
         # --- Remove dead enemies & Check for Win Condition--- 
-        # Check remaining enemies for death AFTER objective check
-        for enemy in self.enemies[:]: 
+        # Check remaining enemies for death AFTER objective check (one vectorised health mask)
+        for enemy in self.enemy_store.dead_enemies(): 
             if enemy.health <= 0: 
                 
                 # --- Check for Boss Defeat (Win Condition) ---
@@ -2792,6 +2421,12 @@ class GameScene:
                     if hasattr(enemy, 'wave_index') and enemy.wave_index == self.current_wave_index:
                         if self.enemies_alive_this_wave > 0: self.enemies_alive_this_wave -= 1
                     self.enemies.remove(enemy) 
+
+        # --- Compact entity containers (removals above only marked entries dead) ---
+        self.projectiles.compact()
+        self.effects.compact()
+        self.pass_through_exploders.compact()
+        self.enemies.compact()
             
     def draw(self, screen, time_delta, current_time):
         """Draw the game scene"""
@@ -3013,6 +2648,9 @@ class GameScene:
         # Draw projectiles
         for proj in self.projectiles:
             proj.draw(screen, self.projectile_assets, grid_offset_x, grid_offset_y)
+        for proj in self.deferred_projectiles:
+            proj.sync_deferred_position(current_time) # Deferred shots are only positioned for drawing
+            proj.draw(screen, self.projectile_assets, grid_offset_x, grid_offset_y)
             
         # --- Draw Orbiting Damagers --- 
         for tower in self.towers:
@@ -3028,23 +2666,8 @@ class GameScene:
             exploder.draw(screen, self.projectile_assets, grid_offset_x, grid_offset_y)
         # --- End Pass-Through Exploder Draw --- 
             
-        # Draw Active Effects (on top of enemies/projectiles)
-        # Draw Ground Effects first, then others
-        for effect in self.effects:
-            if isinstance(effect, GroundEffectZone):
-                effect.draw(screen, grid_offset_x, grid_offset_y) # Pass offsets
-            elif isinstance(effect, FlamethrowerParticleEffect):
-                effect.draw(screen, grid_offset_x, grid_offset_y) # Pass offsets
-            elif isinstance(effect, AcidSpewParticleEffect): # Added check for AcidSpew
-                effect.draw(screen, grid_offset_x, grid_offset_y) # Pass offsets
-            elif isinstance(effect, DrainParticleEffect): # NEW: Check for DrainParticleEffect
-                effect.draw(screen, grid_offset_x, grid_offset_y) # Pass offsets
-            elif isinstance(effect, ExpandingCircleEffect): # Handle new effect type
-                effect.draw(screen, grid_offset_x, grid_offset_y) # Pass offsets
-            elif hasattr(effect, 'draw'):
-                # For regular Effect objects (like blood splatter), pass camera offsets
-                # They will use stored offsets if available, or the passed offsets
-                effect.draw(screen, grid_offset_x, grid_offset_y)
+        # Draw Active Effects (on top of enemies/projectiles), in the order they were added
+        self.effects.draw(screen, grid_offset_x, grid_offset_y)
             
         # Draw Active Beams 
         # This is where beam damage/effects per frame should be applied too
@@ -3062,9 +2685,9 @@ class GameScene:
             if should_draw_beam_visual:
                 # --- Adjacency Check for Beams (e.g., UltraMirror) --- 
                 proceed_with_beam = True # Assume we can proceed unless check fails
-                if tower.special and tower.special.get("effect") == "requires_solar_adjacency":
-                    required_count = tower.special.get("required_count", 3)
-                    race_to_check = tower.special.get("race_to_check", "solar")
+                if tower.spec.effect == SpecialEffect.REQUIRES_SOLAR_ADJACENCY:
+                    required_count = tower.special_spec.params.required_count
+                    race_to_check = tower.special_spec.params.race_to_check
                     # We have access to self.towers here in GameScene
                     adjacent_count = tower.count_adjacent_race_towers(self.towers, race_to_check)
                     
@@ -3107,13 +2730,13 @@ class GameScene:
                     # --- End Color Parsing ---
 
                     if tower.special:
-                        effect_type = tower.special.get('effect')
-                        if effect_type == 'laser_painter':
+                        effect_type = tower.spec.effect
+                        if effect_type == SpecialEffect.LASER_PAINTER:
                             is_painter = True
-                            charge_duration = tower.special.get('charge_duration', 2.0)
-                            slow_percentage = tower.special.get('slow_percentage', 0)
-                        elif effect_type == 'slow': # Handle normal slow beams
-                            slow_percentage = tower.special.get('slow_percentage', 0)
+                            charge_duration = tower.special_spec.params.charge_duration
+                            slow_percentage = tower.special_spec.params.slow_percentage
+                        elif effect_type == SpecialEffect.SLOW: # Handle normal slow beams
+                            slow_percentage = tower.special_spec.params.slow_percentage
                         
                         # Allow beam color override from special
                         if tower.special.get('beam_color'):
@@ -3189,6 +2812,11 @@ class GameScene:
                             
                 # --- End Apply Damage & Effects --- 
 
+        # --- NEW: Placement Blocking Overlay (debug, 'blockmap' console command) ---
+        if self.show_placement_overlay:
+            self.draw_placement_overlay(screen)
+        # --- END Placement Blocking Overlay ---
+
         # Draw Tower Previews (Hover and Placement)
         if self.is_dragging and self.drag_preview_positions:
             selected_tower_id = self.tower_selector.get_selected_tower()
@@ -3198,9 +2826,9 @@ class GameScene:
                     grid_width = tower_data.get('grid_width', 1)
                     grid_height = tower_data.get('grid_height', 1)
                     
-                    # Draw preview for each valid position
+                    # Draw preview for each valid position (already validated jointly in handle_event)
                     for grid_x, grid_y in self.drag_preview_positions:
-                        is_valid_placement = self.is_valid_tower_placement(grid_x, grid_y, grid_width, grid_height)
+                        is_valid_placement = True
                         
                         # Calculate preview position - center the tower on the grid cell
                         offset_x = (grid_width - 1) // 2
@@ -4067,7 +3695,83 @@ class GameScene:
 
 
     def is_valid_tower_placement(self, grid_x, grid_y, grid_width, grid_height):
-        """Check if a tower can be placed at the given position"""
+        """Check if a tower can be placed at the given position (O(1) lookup in the placement map)"""
+        # Get the tower data to check if it's traversable
+        selected_tower_id = self.tower_selector.get_selected_tower() # Assumes tower is selected
+        if not selected_tower_id: # Should not happen if called from placement, but safety check
+            #print("Validation Error: No tower selected for pathfinding check.")
+            return False
+        tower_data = self.available_towers.get(selected_tower_id)
+        if not tower_data:
+            #print(f"Validation Error: Tower data not found for {selected_tower_id}")
+            return False
+        is_traversable = tower_data.get('traversable', False)
+
+        grid_x = int(grid_x)
+        grid_y = int(grid_y)
+        if not (0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height):
+            return False # Footprint centre outside the grid
+        placement_map = self.get_placement_map(grid_width, grid_height, is_traversable)
+        flags = placement_map[grid_y * self.grid_width + grid_x]
+        return flags == (PLACEMENT_CLEAR | PLACEMENT_KEEPS_PATH)
+
+    def get_placement_map(self, grid_width, grid_height, is_traversable):
+        """
+        Returns a bytearray of PLACEMENT_* flags for every footprint centre cell,
+        rebuilt in one sweep only when the tower layout or the footprint size changes.
+        """
+        # layout_version also covers traversable towers, which never change grid.version
+        key = (self.grid.layout_version, int(grid_width), int(grid_height), bool(is_traversable))
+        if self.placement_map is None or self.placement_map_key != key:
+            self.placement_map = self.build_placement_map(int(grid_width), int(grid_height), is_traversable)
+            self.placement_map_key = key
+        return self.placement_map
+
+    def draw_placement_overlay(self, screen):
+        """Tints every centre cell where the selected tower would fit but would block the path."""
+        selected_tower_id = self.tower_selector.get_selected_tower()
+        tower_data = self.available_towers.get(selected_tower_id) if selected_tower_id else None
+        if not tower_data:
+            return
+        placement_map = self.get_placement_map(tower_data.get('grid_width', 1),
+                                                tower_data.get('grid_height', 1),
+                                                tower_data.get('traversable', False))
+        avg_tile_size = (self.actual_tile_width + self.actual_tile_height) // 2
+        cell_surface = pygame.Surface((avg_tile_size, avg_tile_size), pygame.SRCALPHA)
+        cell_surface.fill((255, 0, 0, 70))
+        offset_x = self.play_area_left - int(self.cam_x)
+        offset_y = self.play_area_top - int(self.cam_y)
+        for index, flags in enumerate(placement_map):
+            if flags == PLACEMENT_CLEAR: # Fits, but would block the path
+                x = index % self.grid_width
+                y = index // self.grid_width
+                screen.blit(cell_surface, (offset_x + x * avg_tile_size, offset_y + y * avg_tile_size))
+
+    def build_placement_map(self, grid_width, grid_height, is_traversable):
+        """Sweeps every centre cell once, recording footprint clearance and whether it would block the path."""
+        placement_map = bytearray(self.grid_width * self.grid_height)
+        validator = None if is_traversable else self.get_placement_validator()
+        for y in range(self.grid_height):
+            for x in range(self.grid_width):
+                if not self.is_footprint_clear(x, y, grid_width, grid_height):
+                    continue
+                flags = PLACEMENT_CLEAR
+                # Traversable towers never affect the path
+                if validator is None or not validator.blocks_path(self.get_footprint_cells(x, y, grid_width, grid_height)):
+                    flags |= PLACEMENT_KEEPS_PATH
+                placement_map[y * self.grid_width + x] = flags
+        return placement_map
+
+    def get_footprint_cells(self, grid_x, grid_y, grid_width, grid_height):
+        """Returns the (x, y) cells covered by a tower centred on the given grid position."""
+        start_x = int(grid_x) - (int(grid_width) - 1) // 2
+        start_y = int(grid_y) - (int(grid_height) - 1) // 2
+        return [(x, y)
+                for y in range(start_y, start_y + int(grid_height))
+                for x in range(start_x, start_x + int(grid_width))]
+
+    def is_footprint_clear(self, grid_x, grid_y, grid_width, grid_height):
+        """Checks bounds, restricted areas and tower overlap for a footprint (no path check)."""
         # Ensure grid coordinates are integers for range() operations
         grid_x = int(grid_x)
         grid_y = int(grid_y)
@@ -4139,68 +3843,145 @@ class GameScene:
             #print("Validation failed: Outside grid bounds.")
             return False
 
-        # 2. Check for Existing Towers (Overlap Check)
-        for existing_tower in self.towers:
-            existing_start_x = existing_tower.top_left_grid_x
-            existing_end_x = existing_tower.top_left_grid_x + existing_tower.grid_width - 1
-            existing_start_y = existing_tower.top_left_grid_y
-            existing_end_y = existing_tower.top_left_grid_y + existing_tower.grid_height - 1
-
-            # Simple Axis-Aligned Bounding Box (AABB) overlap check
-            if not (new_end_x < existing_start_x or new_start_x > existing_end_x or
-                    new_end_y < existing_start_y or new_start_y > existing_end_y):
-                #print("Validation failed: Cannot place on existing tower.")
-                return False # Found an overlap
+        # 2. Check for Existing Towers (cell -> tower layer covers traversable towers too)
+        for y in range(new_start_y, new_end_y + 1):
+            for x in range(new_start_x, new_end_x + 1):
+                if self.grid.tower_at(x, y) is not None:
+                    #print("Validation failed: Cannot place on existing tower.")
+                    return False # Found an overlap
 
         # 3. Check for Restricted Cells ('2') and Non-Traversable Towers ('1')
         for y in range(new_start_y, new_end_y + 1):
             for x in range(new_start_x, new_end_x + 1):
                 # Check if the cell is restricted ('2')
-                if self.grid[y][x] == 2:
+                if self.grid.get_cell(x, y) == CELL_RESTRICTED:
                     #print("Validation failed: Cannot place in restricted area.")
                     return False
                 # Check if the cell is occupied by a non-traversable tower ('1')
                 # (This might be redundant with the overlap check above, but is safe)
-                if self.grid[y][x] == 1:
+                if self.grid.get_cell(x, y) == CELL_TOWER:
                     #print("Validation failed: Cannot place on existing non-traversable tower footprint.")
                     return False
 
-        # --- 4. Pathfinding Check ---
-        # Get the tower data to check if it's traversable
-        selected_tower_id = self.tower_selector.get_selected_tower() # Assumes tower is selected
-        if not selected_tower_id: # Should not happen if called from placement, but safety check
-            #print("Validation Error: No tower selected for pathfinding check.")
-            return False
-        tower_data = self.available_towers.get(selected_tower_id)
-        if not tower_data:
-            #print(f"Validation Error: Tower data not found for {selected_tower_id}")
-            return False
-        is_traversable = tower_data.get('traversable', False)
-
-        # Only modify temp_grid for path check IF the tower is NOT traversable
-        if not is_traversable:
-            # Create a temporary copy of the grid
-            temp_grid = deepcopy(self.grid)
-            # Simulate placing the tower on the temporary grid
-            for y in range(new_start_y, new_end_y + 1):
-                for x in range(new_start_x, new_end_x + 1):
-                    # Bounds check again for safety
-                    if 0 <= y < self.grid_height and 0 <= x < self.grid_width:
-                        temp_grid[y][x] = 1 # Mark as obstacle
-
-            # Check if a path still exists on the modified temp grid
-            path = find_path(self.path_start_x, self.path_start_y, self.path_end_x, self.path_end_y, temp_grid)
-            if not path:
-                #print(f"Pathfinding failed: Placing non-traversable tower at ({grid_x},{grid_y}) would block the path.")
-                return False
-        # If traversable, skip the temp_grid modification and path check above
-        # else: # Implicitly uses self.grid for path check if traversable
-            # path = find_path(self.path_start_x, self.path_start_y, self.path_end_x, self.path_end_y, self.grid)
-            # if not path: ... # Path check for traversable is likely redundant if placement rules are correct
-
-        # All checks passed
         return True
 
+    def get_valid_drag_positions(self, positions, tower_data, max_towers):
+        """
+        Validates a dragged line of towers as one batch and returns the positions to place.
+
+        Positions overlapping an earlier tower of the same drag are skipped, as placement
+        would reject them anyway. The remaining footprints are checked cumulatively, so
+        the preview stops before the first tower that would complete a blocking wall.
+        """
+        grid_width = tower_data.get('grid_width', 1)
+        grid_height = tower_data.get('grid_height', 1)
+        placement_map = self.get_placement_map(grid_width, grid_height, tower_data.get('traversable', False))
+        accepted = []
+        footprints = []
+        claimed_cells = set()
+        for pos in positions:
+            if len(accepted) >= max_towers:
+                break
+            pos_x, pos_y = int(pos[0]), int(pos[1])
+            if not (0 <= pos_x < self.grid_width and 0 <= pos_y < self.grid_height):
+                continue
+            if not placement_map[pos_y * self.grid_width + pos_x] & PLACEMENT_CLEAR:
+                continue
+            cells = self.get_footprint_cells(pos[0], pos[1], grid_width, grid_height)
+            if claimed_cells.intersection(cells):
+                continue # Overlaps an earlier tower in this drag
+            claimed_cells.update(cells)
+            accepted.append(pos)
+            footprints.append(cells)
+
+        if tower_data.get('traversable', False):
+            return accepted # Traversable towers never affect the path
+        return accepted[:self.get_placement_validator().longest_valid_prefix(footprints)]
+
+    # --- NEW: Flow Field Helpers ---
+    def get_flow_field(self):
+        """Returns the shared ground flow field, rebuilding it if the grid changed."""
+        if self.flow_field is None or self.flow_field_version != self.grid.version:
+            self.flow_field = FlowField(self.grid, self.path_end_x, self.path_end_y)
+            self.flow_field_version = self.grid.version
+        return self.flow_field
+
+    def get_placement_validator(self):
+        """Returns the path-blocking validator for the current grid, rebuilding it if stale."""
+        if self.placement_validator is None or self.placement_validator_version != self.grid.version:
+            current_path = self.get_flow_field().path_from(self.path_start_x, self.path_start_y)
+            self.placement_validator = PlacementValidator(self.grid,
+                                                          self.path_start_x, self.path_start_y,
+                                                          self.path_end_x, self.path_end_y,
+                                                          current_path)
+            self.placement_validator_version = self.grid.version
+        return self.placement_validator
+
+    def get_spawn_path(self, is_air):
+        """Returns the spawn -> objective path as a shared tuple, cached until the grid changes."""
+        if is_air:
+            compute = lambda: find_path(self.path_start_x, self.path_start_y,
+                                        self.path_end_x, self.path_end_y, self.grid,
+                                        is_air_unit=True)
+        else:
+            # Ground units share the flow field instead of running A* per spawn
+            compute = lambda: self.get_flow_field().path_from(self.path_start_x, self.path_start_y)
+        return self.path_cache.get(self.path_start_x, self.path_start_y,
+                                   self.path_end_x, self.path_end_y,
+                                   is_air, self.grid.version, compute)
+
+    def schedule_enemy_repath(self):
+        """Queues every ground enemy for re-routing; the work is spread over frames by process_enemy_repaths."""
+        self.pending_repaths.clear() # Anyone still queued is re-queued against the newest grid
+        for enemy in self.enemies:
+            if enemy.type != 'air':
+                self.pending_repaths.append(enemy)
+
+    def process_enemy_repaths(self, time_budget=REPATH_TIME_BUDGET):
+        """
+        Re-routes queued enemies from the shared flow field within a per-frame time budget.
+        Enemies standing in the same cell share one path; enemies with no route left are removed.
+        """
+        if not self.pending_repaths:
+            return
+        flow_field = self.get_flow_field() # One reverse search from the objective for everyone
+        if self.repath_cache_version != self.flow_field_version:
+            self.repath_cell_cache = {}
+            self.repath_cache_version = self.flow_field_version
+
+        deadline = time.perf_counter() + time_budget
+        processed = 0
+        while self.pending_repaths:
+            if processed >= REPATH_MIN_PER_FRAME and time.perf_counter() >= deadline:
+                break # Continue next frame
+            enemy = self.pending_repaths.popleft()
+            processed += 1
+            if enemy.health <= 0:
+                continue
+
+            # Get enemy's current grid position (use avg_tile_size for consistency)
+            current_cell = (int(enemy.x // self.avg_tile_size), int(enemy.y // self.avg_tile_size))
+            new_path = self.repath_cell_cache.get(current_cell)
+            if new_path is None:
+                new_path = tuple(flow_field.path_from(current_cell[0], current_cell[1]))
+                self.repath_cell_cache[current_cell] = new_path
+
+            if new_path:
+                # Update enemy's path
+                enemy.grid_path = new_path
+                enemy.path_index = 0  # Reset path index
+                enemy.path_grid = self.get_enemy_path_grid(enemy)
+            elif enemy in self.enemies:
+                # If no path found, remove the enemy (it's trapped)
+                self.enemies.remove(enemy)
+
+    def get_enemy_path_grid(self, enemy):
+        """Grid an enemy may use for line-of-sight waypoint compression (None = corners only)."""
+        if getattr(config, 'COMPRESS_ENEMY_PATHS', False) and enemy.type != 'air':
+            return self.grid
+        return None
+    # --- END Flow Field Helpers ---
+
     # --- Placeholder Enemy Spawning --- 
     def spawn_test_enemy(self, enemy_id):
         """Spawns a test enemy of the given ID."""
@@ -4246,7 +4027,9 @@ class GameScene:
                       enemy_data=enemy_data_with_modifier, 
                       armor_type=armor_type_name, # Pass armor name
                       damage_modifiers=damage_modifiers,
-                      wave_index=None) # Test enemies don't count toward wave completion
+                      wave_index=None, # Test enemies don't count toward wave completion
+                      store=self.enemy_store)
+        enemy.path_grid = self.get_enemy_path_grid(enemy)
         self.enemies.append(enemy)
         #print(f"Spawned test enemy: {enemy_id} (Armor: {armor_type_name}) with path length {len(grid_path)}")
 
@@ -4261,13 +4044,7 @@ class GameScene:
             return # Stop the sell action
         # --- END Prevent selling during active wave ---
 
-        tower_to_sell = None
-        for tower in self.towers:
-            # Check if the click coordinates fall within the tower's footprint
-            if (tower.top_left_grid_x <= grid_x < tower.top_left_grid_x + tower.grid_width and
-                tower.top_left_grid_y <= grid_y < tower.top_left_grid_y + tower.grid_height):
-                tower_to_sell = tower
-                break # Found the tower
+        tower_to_sell = self.grid.tower_at(int(grid_x), int(grid_y)) # O(1) cell -> tower lookup
                 
         if tower_to_sell:
             sell_value = int(tower_to_sell.cost * 0.5) # 50% sell value, rounded down
@@ -4311,25 +4088,17 @@ class GameScene:
             # Update UI display
             self.tower_selector.update_money(self.money)
             
-            # Check if the sold tower was traversable before clearing grid cells
-            is_traversable = tower_to_sell.tower_data.get('traversable', False)
-            
-            if not is_traversable:
-                # Clear grid cells occupied by the non-traversable tower
-                for y in range(tower_to_sell.top_left_grid_y, tower_to_sell.top_left_grid_y + tower_to_sell.grid_height):
-                    for x in range(tower_to_sell.top_left_grid_x, tower_to_sell.top_left_grid_x + tower_to_sell.grid_width):
-                        # Bounds check just in case
-                        if 0 <= y < self.grid_height and 0 <= x < self.grid_width:
-                            # Only clear if it was marked as 1 (tower), leave restricted areas (2) alone
-                            if self.grid[y][x] == 1:
-                                self.grid[y][x] = 0 # Set back to empty
-                #print(f"Cleared grid cells for sold non-traversable tower {tower_to_sell.tower_id}.")
-            else:
-                pass
-                #print(f"Skipped clearing grid cells for sold traversable tower {tower_to_sell.tower_id}.")
+            # Free the footprint (only cells marked as tower are cleared, restricted areas stay)
+            self.grid.clear_footprint(tower_to_sell)
+            if not tower_to_sell.tower_data.get('traversable', False):
+                self.schedule_enemy_repath() # Opened cells may give shorter routes
                         
             # Remove tower from list
             self.towers.remove(tower_to_sell)
+            self.tower_adjacency.remove_tower(tower_to_sell)
+            self.tower_coverage_dirty = True
+            self.enemy_aura_map_dirty = True
+            self.tower_buffs_dirty = True
             
             # --- Update Tower Links After Sell --- 
             self.update_tower_links()
@@ -4407,12 +4176,78 @@ class GameScene:
             pass
         return damage_types
 
+    def build_tower_buff_auras(self):
+        """Rebuild self.tower_buff_auras (buffs towers give other towers) from the current towers."""
+        # Store as instance variable for use in draw method
+        self.tower_buff_auras = []
+        # processed_tower_ids = set() # Track which tower IDs we've already processed # REMOVE THIS LINE
+
+        for tower in self.towers:
+            # Skip if we've already processed this tower # REMOVE THIS BLOCK
+            # if tower.tower_id in processed_tower_ids:
+            #     continue
+            # processed_tower_ids.add(tower.tower_id)
+            
+            # Check if the tower has a special block
+            if tower.special:
+                effect_type = tower.special.get('effect')
+                is_standard_aura = (tower.attack_type == 'aura' or tower.attack_type == 'hybrid')
+                is_dot_amp_aura = effect_type == 'dot_amplification_aura'
+                is_attack_speed_aura = effect_type == 'adjacency_attack_speed_buff' # <<< ADDED CHECK FOR ADJACENCY BUFF
+                
+                # Process if it's a standard buff aura OR the DoT amp aura OR the attack speed aura
+                # MODIFIED CONDITION: Include 'adjacency_attack_speed_buff' here
+                if is_standard_aura or is_dot_amp_aura or is_attack_speed_aura:
+                # --- END MODIFICATION ---
+                    aura_radius_units = tower.special.get('aura_radius', 0)
+                    if aura_radius_units > 0:
+                        aura_radius_pixels = aura_radius_units * (config.GRID_SIZE / 200.0)
+                        aura_radius_sq = aura_radius_pixels ** 2
+                        self.tower_buff_auras.append({
+                            'tower': tower,
+                            'radius_sq': aura_radius_sq,
+                            'special': tower.special
+                        })
+                        if is_dot_amp_aura:
+                            #print(f"DEBUG: Added {tower.tower_id} (dot_amp_aura) to tower_buff_auras with radius {aura_radius_pixels:.1f}px")
+                            pass
+
+        # --- BEGIN Adjacency Buff Calculation ---
+        # One Police HQ entry per tower sharing an edge with it (adjacency graph, no per-pair geometry)
+        for hq in self.towers:
+            if hq.tower_id != 'police_hq':
+                continue
+            if hq.special and hq.special.get('effect') == 'adjacency_damage_buff' and "towers" in hq.special.get('targets', []):
+                for other_tower in self.tower_adjacency.edge_neighbors(hq):
+                    self.tower_buff_auras.append({
+                        'tower': hq, # The tower providing the buff
+                        'radius_sq': 0, # Radius doesn't apply here
+                        'special': hq.special
+                    })
+        # --- END Adjacency Buff Calculation --- 
+
+        # --- BEGIN Spark Power Plant Adjacency Buff Calculation ---
+        # One entry per touching tower (edge or corner); get_buffed_stats only applies it across shared edges
+        for plant in self.towers:
+            if plant.tower_id != 'spark_power_plant':
+                continue
+            if plant.special and plant.special.get('effect') == 'adjacency_attack_speed_buff' and "towers" in plant.special.get('targets', []):
+                for other_tower in self.tower_adjacency.touching(plant):
+                    #print(f"DEBUG: Power Plant at ({plant.center_grid_x},{plant.center_grid_y}) applying adjacency buff to {other_tower.tower_id} at ({other_tower.center_grid_x},{other_tower.center_grid_y})")
+                    self.tower_buff_auras.append({
+                        'tower': plant,
+                        'radius_sq': 0,
+                        'special': plant.special
+                    })
+        # --- END Spark Power Plant Adjacency Buff Calculation ---
+
     def update_tower_links(self):
         """Calculate and update the linked_neighbors list for all Arc Towers."""
         arc_towers = [t for t in self.towers if t.tower_id == 'spark_arc_tower'] # Corrected ID
         if len(arc_towers) < 2: 
             for t in arc_towers:
                 t.linked_neighbors = []
+            self.chain_topology.rebuild(arc_towers)
             return
 
         #print(f"DEBUG: Updating tower links for {len(arc_towers)} Arc Towers...") # Keep this print
@@ -4439,9 +4274,10 @@ class GameScene:
                         tower1.linked_neighbors.append(tower2)
                         # Enhanced Debug Print
                         #print(f"      DEBUG: LINK ADDED: ({tower1.center_grid_x},{tower1.center_grid_y}) -> ({tower2.center_grid_x},{tower2.center_grid_y})")
-            # Print final list for tower1
-            final_linked_ids = [f"({t.center_grid_x},{t.center_grid_y})" for t in tower1.linked_neighbors]
-            #print(f"  DEBUG: Tower1 ({tower1.center_grid_x},{tower1.center_grid_y}) final links: {final_linked_ids}")
+            #print(f"  DEBUG: Tower1 ({tower1.center_grid_x},{tower1.center_grid_y}) final links: {[(t.center_grid_x, t.center_grid_y) for t in tower1.linked_neighbors]}")
+
+        # Links changed: regroup chains, cached longest chains are recomputed lazily on the next zap
+        self.chain_topology.rebuild(arc_towers)
 
     def process_attack_results(self, attack_results, grid_offset_x, grid_offset_y):
         """Helper function to process the results dictionary from standard tower attacks."""
@@ -4471,7 +4307,7 @@ class GameScene:
                     damage_type = attack_results.get('damage_type', 'normal')
                     targets = attack_results.get('targets', ['ground', 'air'])
                     
-                    for enemy in self.enemies:
+                    for enemy in self.enemy_index.query_circle(tower.x, tower.y, radius):
                         if enemy.health > 0 and enemy.type in targets:
                             dx = enemy.x - tower.x
                             dy = enemy.y - tower.y
@@ -4480,15 +4316,17 @@ class GameScene:
                                 enemy.take_damage(damage, damage_type)
                     
                     # Clear grid cells before removing tower
+                    self.grid.clear_footprint(tower)
                     if not tower.tower_data.get('traversable', False):
-                        for y in range(tower.top_left_grid_y, tower.top_left_grid_y + tower.grid_height):
-                            for x in range(tower.top_left_grid_x, tower.top_left_grid_x + tower.grid_width):
-                                if 0 <= y < self.grid_height and 0 <= x < self.grid_width:
-                                    if self.grid[y][x] == 1:  # Only clear if it was marked as tower
-                                        self.grid[y][x] = 0
+                        self.schedule_enemy_repath()
                     
                     # Remove the tower
                     self.towers.remove(tower)
+                    self.tower_adjacency.remove_tower(tower)
+                    self.tower_coverage_dirty = True
+                    self.enemy_aura_map_dirty = True
+                    self.tower_buffs_dirty = True
+                    self.update_tower_links()
                     return
             
             # Add any projectiles created
@@ -4529,6 +4367,17 @@ class GameScene:
              if attack_results: 
                  self.projectiles.extend(attack_results)
 
+    def process_projectile_collision(self, proj, current_time, new_projectiles, new_effects):
+        """Run a standard projectile's on_collision and collect the projectiles/effects it spawns."""
+        # Get collision results
+        collision_result = proj.on_collision(self.enemies, current_time, self.tower_buff_auras, enemy_index=self.enemy_index)
+        # Add any new projectiles
+        if collision_result.get('new_projectiles'):
+            new_projectiles.extend(collision_result['new_projectiles'])
+        # Add any new effects
+        if collision_result.get('new_effects'):
+            new_effects.extend(collision_result['new_effects'])
+
     def attempt_chain_zap(self, initiating_tower, current_time, all_enemies, grid_offset_x, grid_offset_y):
         """Attempts to find the longest chain and trigger a zap, or fallback to standard attack."""
         # Check if tower is on cooldown from previous chain participation
@@ -4542,34 +4391,10 @@ class GameScene:
              return # Standard attack interval cooldown
 
         #print(f"Tower ({initiating_tower.center_grid_x},{initiating_tower.center_grid_y}) attempting chain zap...") # Keep
-        linked_ids = [f"({t.center_grid_x},{t.center_grid_y})" for t in initiating_tower.linked_neighbors]
-        #print(f"  Initiator neighbors: {linked_ids}") # Keep
-
-        # --- Pathfinding (DFS to find longest chain) --- 
-        longest_chain = [initiating_tower] 
-        stack = [(initiating_tower, [initiating_tower])] 
-        max_len = 1
-
-        while stack:
-            current_node, path = stack.pop() 
-            current_node_id = f"({current_node.center_grid_x},{current_node.center_grid_y})"
-            path_ids = [f"({t.center_grid_x},{t.center_grid_y})" for t in path]
-            #print(f"    DFS Pop: Node={current_node_id}, Path={path_ids}") # Keep
-
-            if len(path) > max_len:
-                max_len = len(path)
-                longest_chain = path
-                path_ids = [f"({t.center_grid_x},{t.center_grid_y})" for t in path] # Re-calculate for print
-                #print(f"      DFS: New longest_chain found! Length={max_len}, Path={path_ids}") # Keep
-
-            for neighbor in current_node.linked_neighbors:
-                neighbor_id = f"({neighbor.center_grid_x},{neighbor.center_grid_y})"
-                if neighbor not in path: 
-                     new_path = path + [neighbor]
-                     stack.append((neighbor, new_path))
-                     new_path_ids = [f"({t.center_grid_x},{t.center_grid_y})" for t in new_path]
-                     #print(f"        DFS Pushing: Node={neighbor_id}, Path={new_path_ids}") # Keep
-        # --- End DFS --- 
+
+        # --- Longest chain (cached per link layout, see update_tower_links) --- 
+        longest_chain = self.chain_topology.longest_chain(initiating_tower)
+        #print(f"  Longest chain: {[(t.center_grid_x, t.center_grid_y) for t in longest_chain]}") # Keep
 
         # Check if a chain longer than 1 was found
         chain_found = len(longest_chain) > 1
@@ -4580,13 +4405,11 @@ class GameScene:
             #print(f"... found chain: {[t.tower_id for t in longest_chain]}")
             # --- Target from End Node --- 
             target = None
-            potential_targets = []
-            for enemy in all_enemies:
-                 if enemy.health > 0 and enemy.type in end_node_tower.targets and end_node_tower.is_in_range(enemy.x, enemy.y):
-                     potential_targets.append(enemy)
+            potential_targets = self.enemy_index.k_nearest(
+                end_node_tower.x, end_node_tower.y, 1, max_radius=end_node_tower.range,
+                predicate=lambda enemy: enemy.health > 0 and enemy.type in end_node_tower.targets and end_node_tower.is_in_range(enemy.x, enemy.y))
             
             if potential_targets:
-                potential_targets.sort(key=lambda e: (e.x - end_node_tower.x)**2 + (e.y - end_node_tower.y)**2)
                 target = potential_targets[0]
                 #print(f"... end node {end_node_tower.tower_id} targeting {target.enemy_id}")
             else:
@@ -4651,12 +4474,10 @@ class GameScene:
             # --- Fallback to Standard Attack --- 
             #print("... no chain found. Falling back to standard attack.")
             fallback_target = None
-            potential_targets = []
-            for enemy in all_enemies:
-                 if enemy.health > 0 and enemy.type in initiating_tower.targets and initiating_tower.is_in_range(enemy.x, enemy.y):
-                     potential_targets.append(enemy)
+            potential_targets = self.enemy_index.k_nearest(
+                initiating_tower.x, initiating_tower.y, 1, max_radius=initiating_tower.range,
+                predicate=lambda enemy: enemy.health > 0 and enemy.type in initiating_tower.targets and initiating_tower.is_in_range(enemy.x, enemy.y))
             if potential_targets:
-                 potential_targets.sort(key=lambda e: (e.x - initiating_tower.x)**2 + (e.y - initiating_tower.y)**2)
                  fallback_target = potential_targets[0]
                  
             if fallback_target:
@@ -4942,6 +4763,7 @@ class GameScene:
         
         # Clear the locked towers
         self.locked_race_towers = {}
+        self.tower_buffs_dirty = True # Re-resolve tower buffs with the new roster
         
         # Update the tower selector with new towers
         if hasattr(self, 'tower_selector') and self.tower_selector:
@@ -5066,17 +4888,17 @@ class GameScene:
         #print(f"DEBUG Spawn: Spawning {enemy_id}, Type={enemy_data_with_modifier.get('type', 'ground')}, Is Air? {is_air}") # DEBUG
         # -------------------------------------
 
-        # Find initial path, passing air unit status
-        path = find_path(self.path_start_x, self.path_start_y, 
-                         self.path_end_x, self.path_end_y, self.grid,
-                         is_air_unit=is_air) # Pass the flag
+        # Find initial path, passing air unit status (shared via the path cache)
+        path = self.get_spawn_path(is_air)
 
         if path:
             # Spawn at the visual spawn point (center of spawn area)
             # Use the same coordinates as spawn_test_enemy() for consistency
             enemy = Enemy(self.visual_spawn_x_pixel, self.visual_spawn_y_pixel, 
                           path, enemy_id, enemy_data_with_modifier, armor_type_name, damage_modifiers,
-                          wave_index=self.current_wave_index)  # Track which wave this enemy belongs to
+                          wave_index=self.current_wave_index,  # Track which wave this enemy belongs to
+                          store=self.enemy_store)
+            enemy.path_grid = self.get_enemy_path_grid(enemy)
             self.enemies.append(enemy)
             self.enemies_alive_this_wave += 1 # Increment count for wave tracking
             #print(f"Spawned enemy: {enemy_id} (Wave: {self.current_wave_index + 1})")
@@ -5170,6 +4992,19 @@ class GameScene:
             print(f"Show coordinates: {status}")
             return
 
+        if cmd in ("blockmap", "block_map"):
+            self.show_placement_overlay = not self.show_placement_overlay
+            status = "enabled" if self.show_placement_overlay else "disabled"
+            print(f"Placement blocking overlay: {status}")
+            return
+
+        if cmd in ("pathstats", "path_stats"):
+            # Profiling: spawn path cache effectiveness
+            stats = self.path_cache.get_stats()
+            print(f"Path cache: {stats['hits']} hits, {stats['misses']} misses "
+                  f"({stats['hit_rate'] * 100:.1f}% hit rate), {stats['size']} cached, grid v{self.grid.version}")
+            return
+
         if cmd in ("mainmenu", "menu", "main_menu"):
             # Return to main menu / race selection screen
             if hasattr(self.game, 'return_to_menu'):
@@ -5186,10 +5021,10 @@ class GameScene:
                 if enemy.health > 0:
                     enemy.base_speed = 2.5
                     # Clear status effects that might affect speed (stuns, slows)
-                    if 'stun' in enemy.status_effects:
-                        del enemy.status_effects['stun']
-                    if 'slow' in enemy.status_effects:
-                        del enemy.status_effects['slow']
+                    if enemy.has_status_effect('stun'):
+                        enemy.clear_status_effect('stun')
+                    if enemy.has_status_effect('slow'):
+                        enemy.clear_status_effect('slow')
                     # Recalculate speed to ensure it's 2.5
                     if hasattr(enemy, 'recalculate_speed'):
                         enemy.recalculate_speed()
@@ -0,0 +1,16 @@
+"""Shared bootstrap for the tests: repo root on sys.path and headless SDL drivers."""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture
+def repo_root():
+    """Absolute path of the repository root (assets and data load relative to it)."""
+    return ROOT
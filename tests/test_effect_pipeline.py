@@ -0,0 +1,29 @@
+"""EffectPipeline updates each effect exactly once per tick."""
+import pygame
+import pytest
+
+from entities.effect import Effect, GroundEffectZone # config quits pygame on import, so import before the display is set up
+from utils.effect_pipeline import EffectPipeline
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    pygame.init()
+    pygame.display.set_mode((1, 1)) # Effect converts its image, which needs a display
+    yield
+
+
+def test_effects_expire_after_their_duration():
+    image = pygame.Surface((4, 4), pygame.SRCALPHA)
+    effect = Effect(0, 0, image, 1.0, (4, 4))
+    zone = GroundEffectZone(0, 0, 100, 1.0, 0, 0.5, "normal", ["ground"])
+    pipeline = EffectPipeline([effect, zone])
+
+    for _ in range(59):
+        pipeline.update(1 / 60, [], None)
+    assert effect in pipeline
+    assert zone in pipeline
+
+    pipeline.update(1 / 60, [], None)
+    assert effect not in pipeline
+    assert zone not in pipeline
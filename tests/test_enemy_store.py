@@ -0,0 +1,50 @@
+"""EnemyStore keeps enemy state in its columns and works on the listed (active) rows."""
+from entities.enemy import Enemy
+from utils.enemy_store import EnemyList, EnemyStore
+
+
+def make_enemy(store, x=16, y=16, health=10):
+    path = [(0, 0), (5, 0), (5, 5)]
+    return Enemy(x, y, path, 'test', {'health': health, 'speed': 2.0}, 'Light', {}, store=store)
+
+
+def test_enemy_state_lives_in_store_columns():
+    store = EnemyStore()
+    enemy = make_enemy(store)
+    enemy.x = 40.5
+    enemy.health -= 3
+    assert store.x[enemy.store_slot] == 40.5
+    assert store.health[enemy.store_slot] == 7
+    assert enemy.rect.center == (40, 16)
+
+
+def test_step_and_death_mask_cover_listed_enemies_only():
+    store = EnemyStore()
+    enemies = EnemyList()
+    listed = [make_enemy(store) for _ in range(3)]
+    enemies.extend(listed)
+    unlisted = make_enemy(store) # Never added to the list, so never stepped
+
+    for frame in range(5):
+        store.step(frame / 60, 32)
+    assert all(enemy.path_distance == 10.0 for enemy in listed)
+    assert unlisted.path_distance == 0.0
+
+    listed[0].health = 0
+    listed[2].health = -1
+    unlisted.health = 0
+    enemies.remove(listed[2])
+    assert store.dead_enemies() == [listed[0]]
+
+
+def test_compact_keeps_values_of_removed_enemies():
+    store = EnemyStore()
+    enemies = EnemyList()
+    enemies.extend(make_enemy(store, x=index) for index in range(4))
+    removed = list(enemies)[1]
+    enemies.remove(removed)
+    store.compact()
+    assert len(store) == 3
+    assert [enemy.x for enemy in enemies] == [0, 2, 3]
+    assert removed.store is not store
+    assert removed.x == 1
@@ -0,0 +1,57 @@
+"""Placement cache checks against a headless GameScene."""
+import json
+import os
+
+import pygame
+import pytest
+
+
+@pytest.fixture
+def scene(repo_root):
+    cwd = os.getcwd()
+    os.chdir(repo_root) # Assets and data are loaded relative to the repo root
+    try:
+        pygame.init()
+        from game import Game
+        with open("data/tower_races.json") as file:
+            data = json.load(file)
+        game = Game(data)
+        game.start_game(list(data["races"].keys()))
+        game_scene = game.active_game_scene
+        game_scene.money = 10**7
+        for race_data in data["races"].values():
+            game_scene.available_towers.update(race_data["towers"])
+        yield game_scene
+    finally:
+        os.chdir(cwd)
+
+
+def select(scene, tower_id):
+    scene.selected_tower = tower_id
+    scene.tower_selector.selected_tower = tower_id
+    scene.tower_preview = None
+
+
+def place(scene, tower_id, grid_x, grid_y):
+    select(scene, tower_id)
+    scene.handle_tower_placement(grid_x, grid_y)
+
+
+def test_traversable_tower_cell_is_not_placeable(scene):
+    select(scene, "pyro_fire_trap")
+    assert scene.is_valid_tower_placement(10, 10, 1, 1)
+    place(scene, "pyro_fire_trap", 10, 10)
+    assert len(scene.towers) == 1
+    # The cached placement map must see the traversable tower
+    assert not scene.is_valid_tower_placement(10, 10, 1, 1)
+    place(scene, "pyro_fire_trap", 10, 10)
+    assert len(scene.towers) == 1
+
+
+def test_selling_traversable_tower_frees_its_cell(scene):
+    place(scene, "pyro_fire_trap", 10, 10)
+    assert len(scene.towers) == 1
+    scene.sell_tower_at(10, 10)
+    assert len(scene.towers) == 0
+    select(scene, "pyro_fire_trap")
+    assert scene.is_valid_tower_placement(10, 10, 1, 1)
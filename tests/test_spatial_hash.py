@@ -0,0 +1,29 @@
+"""EnemySpatialHash queries against a brute-force scan."""
+import random
+
+from utils.spatial_hash import EnemySpatialHash
+
+
+class FakeEnemy:
+    def __init__(self, x, y, health):
+        self.x = x
+        self.y = y
+        self.health = health
+
+
+def make_enemies(count, seed=0):
+    rng = random.Random(seed)
+    return [FakeEnemy(rng.uniform(0, 1100), rng.uniform(0, 640), rng.choice((0, 50))) for _ in range(count)]
+
+
+def test_k_nearest_matches_brute_force():
+    enemies = make_enemies(400)
+    index = EnemySpatialHash(32)
+    index.rebuild(enemies)
+    alive = lambda enemy: enemy.health > 0
+    for x, y, k, max_radius in ((500, 300, 1, None), (40, 600, 5, 250), (900, 100, 12, 400), (550, 320, 3, 10)):
+        found = index.k_nearest(x, y, k, max_radius=max_radius, predicate=alive)
+        candidates = [e for e in enemies if alive(e) and
+                      (max_radius is None or (e.x - x) ** 2 + (e.y - y) ** 2 <= max_radius ** 2)]
+        expected = sorted(candidates, key=lambda e: (e.x - x) ** 2 + (e.y - y) ** 2)[:k]
+        assert found == expected
@@ -0,0 +1,84 @@
+import math
+from collections import namedtuple
+
+# One enemy-affecting aura tower: the tower, its compiled SpecialSpec, its radius squared in pixels
+# and the aura_apply handler registered for its effect (None if it has none)
+EnemyAura = namedtuple('EnemyAura', ('tower', 'special', 'radius_sq', 'apply'))
+
+class AuraCell:
+    """Auras reaching one cell, split into ones covering the whole cell and ones covering part of it."""
+    __slots__ = ("auras", "armor_reduction_full", "armor_partial")
+
+    def __init__(self):
+        self.auras = [] # (aura_entry, fully_covered) in tower order
+        self.armor_reduction_full = 0 # Strongest armor reduction covering the whole cell
+        self.armor_partial = [] # (x, y, radius_sq, amount) needing an exact distance check
+
+    def armor_reduction_at(self, x, y):
+        """Strongest armor reduction applying at (x, y)."""
+        reduction = self.armor_reduction_full
+        for aura_x, aura_y, radius_sq, amount in self.armor_partial:
+            if amount > reduction and (x - aura_x)**2 + (y - aura_y)**2 <= radius_sq:
+                reduction = amount
+        return reduction
+
+class EnemyAuraMap:
+    """
+    Per-cell lookup of the continuous auras that affect enemies.
+
+    Aura towers are static, so the map is rebuilt only when towers are placed,
+    sold or destroyed. An enemy's aura work is then one dict lookup for its
+    cell; auras that only partly cover the cell still get an exact distance
+    check so the result matches the old per-tower loop.
+    """
+    def __init__(self, cell_size):
+        self.cell_size = max(1, int(cell_size))
+        self.cells = {} # (cell_x, cell_y) -> AuraCell
+
+    def rebuild(self, aura_entries, armor_auras):
+        """
+        :param aura_entries: Continuous enemy auras (EnemyAura)
+        :param armor_auras: (tower, radius_pixels, reduction_amount) for enemy_armor_reduction_aura towers
+        """
+        cells = {}
+        for entry in aura_entries:
+            tower = entry.tower
+            for cell, full in self._cells_in_radius(tower.x, tower.y, math.sqrt(entry.radius_sq)):
+                aura_cell = cells.get(cell)
+                if aura_cell is None:
+                    aura_cell = cells[cell] = AuraCell()
+                aura_cell.auras.append((entry, full))
+        for tower, radius, amount in armor_auras:
+            radius_sq = radius ** 2
+            for cell, full in self._cells_in_radius(tower.x, tower.y, radius):
+                aura_cell = cells.get(cell)
+                if aura_cell is None:
+                    aura_cell = cells[cell] = AuraCell()
+                if full:
+                    aura_cell.armor_reduction_full = max(aura_cell.armor_reduction_full, amount)
+                else:
+                    aura_cell.armor_partial.append((tower.x, tower.y, radius_sq, amount))
+        self.cells = cells
+
+    def _cells_in_radius(self, x, y, radius):
+        """Yield ((cell_x, cell_y), fully_covered) for every cell the circle touches."""
+        cell_size = self.cell_size
+        radius_sq = radius * radius
+        for cy in range(int(math.floor((y - radius) / cell_size)), int(math.floor((y + radius) / cell_size)) + 1):
+            top = cy * cell_size
+            bottom = top + cell_size
+            near_dy = top - y if y < top else (y - bottom if y > bottom else 0.0)
+            far_dy = max(abs(y - top), abs(y - bottom))
+            for cx in range(int(math.floor((x - radius) / cell_size)), int(math.floor((x + radius) / cell_size)) + 1):
+                left = cx * cell_size
+                right = left + cell_size
+                near_dx = left - x if x < left else (x - right if x > right else 0.0)
+                if near_dx * near_dx + near_dy * near_dy > radius_sq:
+                    continue
+                far_dx = max(abs(x - left), abs(x - right))
+                yield (cx, cy), far_dx * far_dx + far_dy * far_dy <= radius_sq
+
+    def lookup(self, x, y):
+        """Return the AuraCell for pixel (x, y), or None if no aura reaches it."""
+        cell_size = self.cell_size
+        return self.cells.get((int(x // cell_size), int(y // cell_size)))
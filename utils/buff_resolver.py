@@ -0,0 +1,52 @@
+class BuffResolver:
+    """
+    Caches Tower.get_buffed_stats for the scene's tower_buff_auras list.
+
+    Aura, adjacency and swarm power buffs only depend on where towers stand,
+    so each tower's static totals are computed once per layout change (place,
+    sell, destroy, race unlock). Pulsed buffs and gattling spin-up still change
+    over time and are layered on top, memoized for the current frame so the
+    tower loop, Tower.attack and the tooltip code share one result.
+    """
+    def __init__(self):
+        self.auras = None # The aura list the static totals were built from
+        self.all_towers = []
+        self.static = {} # tower -> dict from Tower.compute_static_buffs
+        self.frame_time = None
+        self.frame_cache = {} # tower -> ((gattling_level, pulsed_buff_version), buffed stats)
+
+    def rebuild(self, towers, tower_buff_auras):
+        """Recompute every tower's static buff totals for a new layout."""
+        self.auras = tower_buff_auras
+        self.all_towers = towers
+        self.static = {}
+        self.frame_time = None
+        self.frame_cache = {}
+        for tower in towers:
+            tower.buff_resolver = self
+            self.static[tower] = tower.compute_static_buffs(tower_buff_auras, towers)
+
+    def get(self, tower, current_time):
+        """Return the tower's buffed stats at current_time (same dict as get_buffed_stats)."""
+        if current_time != self.frame_time:
+            self.frame_time = current_time
+            self.frame_cache = {}
+        key = (tower.gattling_level, tower.pulsed_buff_version)
+        cached = self.frame_cache.get(tower)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        static_buffs = self.static.get(tower)
+        if static_buffs is None:
+            # Tower placed since the last rebuild (e.g. drawn before the next update)
+            static_buffs = self.static[tower] = tower.compute_static_buffs(self.auras, self.all_towers)
+        stats = tower.apply_dynamic_buffs(static_buffs, current_time)
+        self.frame_cache[tower] = (key, stats)
+        return stats
+
+    def get_stats(self):
+        """Return a small dict describing the cache state."""
+        return {
+            'towers': len(self.static),
+            'auras': len(self.auras) if self.auras is not None else 0,
+            'frame_cached': len(self.frame_cache),
+        }
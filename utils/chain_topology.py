@@ -0,0 +1,90 @@
+class ChainTopology:
+    """
+    Cached longest link chains for Spark Arc Towers.
+
+    Rebuilt whenever update_tower_links changes the links. Towers are grouped
+    into connected components once; the longest simple chain starting at a
+    tower is found by the same depth-first search the zap always used (same
+    visiting order, so the same chain wins ties) and cached until the next
+    rebuild. The search stops early once a chain covers the whole component,
+    and large clusters are capped at `search_budget` expanded paths, keeping
+    the best chain found so far instead of going exponential.
+    """
+    def __init__(self, search_budget=20000):
+        """
+        :param search_budget: Maximum number of partial chains expanded per search
+        """
+        self.search_budget = search_budget
+        self.component_of = {} # tower -> component index
+        self.component_sizes = []
+        self.longest = {} # tower -> cached longest chain starting at it
+        self.version = 0
+
+    def rebuild(self, towers):
+        """Recompute connected components from each tower's linked_neighbors and drop cached chains."""
+        self.component_of = {}
+        self.component_sizes = []
+        self.longest = {}
+        self.version += 1
+        # Links are per-tower radii and may be one-way, so group by undirected reachability
+        undirected = {tower: set() for tower in towers}
+        for tower in towers:
+            for neighbor in tower.linked_neighbors:
+                undirected[tower].add(neighbor)
+                if neighbor in undirected:
+                    undirected[neighbor].add(tower)
+        for tower in towers:
+            if tower in self.component_of:
+                continue
+            index = len(self.component_sizes)
+            self.component_of[tower] = index
+            stack = [tower]
+            size = 0
+            while stack:
+                node = stack.pop()
+                size += 1
+                for neighbor in undirected.get(node, ()):
+                    if neighbor not in self.component_of:
+                        self.component_of[neighbor] = index
+                        stack.append(neighbor)
+            self.component_sizes.append(size)
+
+    def longest_chain(self, start):
+        """Return the longest chain (list of towers, starting with `start`) following linked_neighbors."""
+        chain = self.longest.get(start)
+        if chain is None:
+            chain = self.longest[start] = self._search(start)
+        return chain
+
+    def _search(self, start):
+        if not start.linked_neighbors:
+            return [start]
+        component = self.component_of.get(start)
+        max_possible = self.component_sizes[component] if component is not None else float('inf')
+        longest_chain = [start]
+        max_len = 1
+        stack = [(start, [start], {start})]
+        expanded = 0
+        while stack:
+            current_node, path, visited = stack.pop()
+            if len(path) > max_len:
+                max_len = len(path)
+                longest_chain = path
+                if max_len >= max_possible:
+                    break # Chain already covers the whole component
+            expanded += 1
+            if expanded > self.search_budget:
+                break # Large cluster: keep the best chain found so far
+            for neighbor in current_node.linked_neighbors:
+                if neighbor not in visited:
+                    stack.append((neighbor, path + [neighbor], visited | {neighbor}))
+        return longest_chain
+
+    def get_stats(self):
+        """Return a small dict describing the cached topology."""
+        return {
+            'towers': len(self.component_of),
+            'components': len(self.component_sizes),
+            'largest_component': max(self.component_sizes) if self.component_sizes else 0,
+            'cached_chains': len(self.longest),
+        }
@@ -0,0 +1,78 @@
+from utils.entity_list import EntityList
+
+class EffectHandler:
+    """
+    How the pipeline drives one effect class, resolved once per class.
+
+    The effect protocol: `update(time_delta)` - or `update(time_delta,
+    enemies, enemy_index=...)` when the class sets `needs_enemies = True` -
+    returns True when the effect is done, or the effect sets `finished`
+    instead (the particle effects do); `draw(screen, grid_offset_x,
+    grid_offset_y)` renders it. Objects without an update are kept until
+    their `finished` flag is set.
+    """
+    __slots__ = ('effect_type', 'needs_enemies', 'has_update', 'has_draw')
+
+    def __init__(self, effect_type):
+        self.effect_type = effect_type
+        self.needs_enemies = getattr(effect_type, 'needs_enemies', False)
+        self.has_update = callable(getattr(effect_type, 'update', None))
+        self.has_draw = callable(getattr(effect_type, 'draw', None))
+
+    def update(self, effect, time_delta, enemies, enemy_index):
+        """Advance the effect one tick. Returns True once it has finished."""
+        if self.has_update:
+            if self.needs_enemies:
+                done = effect.update(time_delta, enemies, enemy_index=enemy_index)
+            else:
+                done = effect.update(time_delta)
+            if done:
+                return True
+        return getattr(effect, 'finished', False)
+
+    def draw(self, effect, screen, grid_offset_x, grid_offset_y):
+        if self.has_draw:
+            effect.draw(screen, grid_offset_x, grid_offset_y)
+
+class EffectPipeline(EntityList):
+    """
+    The scene's visual effects: an EntityList whose entries are updated
+    exactly once per tick and drawn in insertion order.
+
+    Each effect gets its class's EffectHandler when it is added, so the
+    frame loop makes no isinstance checks.
+    """
+    def __init__(self, effects=()):
+        self._handlers = {} # effect class -> EffectHandler
+        self._handler_of = {} # effect -> EffectHandler
+        super().__init__(effects)
+
+    def handler_for(self, effect_type):
+        handler = self._handlers.get(effect_type)
+        if handler is None:
+            handler = self._handlers[effect_type] = EffectHandler(effect_type)
+        return handler
+
+    def append(self, effect):
+        self._handler_of[effect] = self.handler_for(type(effect))
+        return super().append(effect)
+
+    def remove(self, effect):
+        super().remove(effect)
+        self._handler_of.pop(effect, None)
+
+    def update(self, time_delta, enemies, enemy_index=None):
+        """Update every effect once and remove the finished ones."""
+        handler_of = self._handler_of
+        for effect in self:
+            try:
+                if handler_of[effect].update(effect, time_delta, enemies, enemy_index):
+                    self.remove(effect)
+            except Exception as e:
+                print(f"Error updating effect: {e}")
+                self.discard(effect) # Remove problematic effect
+
+    def draw(self, screen, grid_offset_x, grid_offset_y):
+        handler_of = self._handler_of
+        for effect in self:
+            handler_of[effect].draw(effect, screen, grid_offset_x, grid_offset_y)
@@ -0,0 +1,78 @@
+"""
+Special-effect dispatch table.
+
+Each SpecialEffect registers its handlers once, per hook, and every tower
+binds the EffectHooks for its effect when it is built. Towers and their
+projectiles then call only the handlers their effect actually has (a hook
+the effect does not use is None), instead of walking a chain of string
+comparisons every frame, attack and hit.
+
+Hooks and the handler signatures they expect:
+    on_tick(tower, current_time, all_enemies, all_towers)
+        Once per frame from Tower.update.
+    on_attack(tower, target, initial_damage, current_time)
+        After a standard attack has been made.
+    on_hit(tower, enemy, current_time) -> effect name or None
+        When a projectile hits an enemy that survives (primary or pierced).
+    on_kill(tower, enemy) -> gold to add (0 for none)
+        When a projectile kills an enemy.
+    aura_apply(tower, special, enemy, dist_sq, context) -> slow multiplier or None
+        For each enemy an enemy aura (pulsed or continuous) reaches.
+        `special` is the tower's SpecialSpec and `context` an AuraContext. Continuous slows are returned so the scene can keep only
+        the strongest one; everything else is applied directly.
+    on_walkover(tower, special, enemy, context)
+        Each frame an enemy stands on a trigger_on_walkover tower's tile
+        (a walkover tower can also be a pulsed aura, so this is its own hook).
+"""
+from collections import namedtuple
+
+HOOKS = ('on_tick', 'on_attack', 'on_hit', 'on_kill', 'aura_apply', 'on_walkover')
+
+EffectHooks = namedtuple('EffectHooks', HOOKS)
+NO_HOOKS = EffectHooks(*(None for _ in HOOKS))
+
+_handlers = {} # SpecialEffect -> {hook: handler}
+_bound = {} # SpecialEffect -> EffectHooks (cleared whenever a handler is registered)
+
+class AuraContext:
+    """Per-frame values the aura handlers need; the scene refreshes one instance each frame."""
+    __slots__ = ('current_time', 'time_delta', 'tower_buff_auras')
+
+    def __init__(self, current_time=0.0, time_delta=0.0, tower_buff_auras=None):
+        self.current_time = current_time
+        self.time_delta = time_delta
+        self.tower_buff_auras = tower_buff_auras if tower_buff_auras is not None else []
+
+def register(hook, *effects):
+    """
+    Decorator registering a handler for one hook of one or more effects.
+
+    :param hook: One of HOOKS
+    :param effects: SpecialEffect members the handler serves
+    """
+    if hook not in HOOKS:
+        raise ValueError(f"Unknown effect hook '{hook}'")
+    def decorator(handler):
+        for effect in effects:
+            hooks = _handlers.setdefault(effect, {})
+            if hook in hooks:
+                raise ValueError(f"{effect.value} already has an {hook} handler")
+            hooks[hook] = handler
+        _bound.clear()
+        return handler
+    return decorator
+
+def hooks_for(effect):
+    """The EffectHooks for a SpecialEffect (NO_HOOKS for None or an effect without handlers)."""
+    if effect is None:
+        return NO_HOOKS
+    hooks = _bound.get(effect)
+    if hooks is None:
+        handlers = _handlers.get(effect)
+        hooks = EffectHooks(*(handlers.get(hook) for hook in HOOKS)) if handlers else NO_HOOKS
+        _bound[effect] = hooks
+    return hooks
+
+def registered_effects(hook=None):
+    """Effects with at least one handler (or with a handler for `hook`)."""
+    return [effect for effect, hooks in _handlers.items() if hook is None or hook in hooks]
@@ -0,0 +1,415 @@
+import numpy as np
+
+from utils.entity_list import EntityList
+
+class EnemyStore:
+    """
+    Structure-of-arrays movement and status state for every enemy.
+
+    Each Enemy owns one row (`enemy.store_slot`). Per-frame work that used to
+    run once per enemy in Enemy.move - slow/stun expiry, speed, advancing
+    along the path polyline, wander drift - runs here as a handful of NumPy
+    passes over all rows at once, and death detection is a single mask over
+    the health column. Path polylines are copied into pooled point arrays
+    so segment lookups and interpolation vectorise too.
+
+    Every per-enemy number (position, health, path index, speed, armor, path
+    distance, wander offsets, slow/stun) lives only here; Enemy exposes them
+    as properties, so the arrays are the single source of truth. The passes
+    read and write the arrays directly; only rows with status effects/DoTs
+    to tick or a polyline to rebuild call back into their Enemy.
+
+    A row is `active` while its enemy is in the scene's EnemyList; `step`
+    and `dead_enemies` work on the active rows, which are kept in the list's
+    order. Inactive rows are reclaimed by `maybe_compact`; their enemies are
+    moved to a small store of their own so anything still holding them
+    (projectiles, effects) reads stable values.
+    """
+    FLOAT_FIELDS = ('x', 'y', 'speed', 'base_speed', 'health', 'armor',
+                    'slow_value', 'slow_until', 'stun_until',
+                    'path_distance', 'wander_x', 'wander_y', 'wander_limit', 'wander_step',
+                    'last_x', 'last_y', 'tile_size')
+    INT_FIELDS = ('segment', 'poly_start', 'poly_len', 'base_index', 'path_index', 'path_len')
+    BOOL_FIELDS = ('has_path', 'path_dirty', 'active', 'ticking') # ticking: has status effects or DoTs to update
+
+    def __init__(self, capacity=64, rng=None):
+        """
+        :param capacity: Initial number of rows (grows by doubling)
+        :param rng: Optional numpy Generator for wander drift
+        """
+        self.capacity = max(1, capacity)
+        self.size = 0 # Rows handed out so far (live or not)
+        self.owners = [] # row -> Enemy
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.zeros(self.capacity, dtype=np.float64))
+        for name in self.INT_FIELDS:
+            setattr(self, name, np.zeros(self.capacity, dtype=np.intp))
+        for name in self.BOOL_FIELDS:
+            setattr(self, name, np.zeros(self.capacity, dtype=bool))
+        self.slow_until.fill(-np.inf)
+        self.stun_until.fill(-np.inf)
+        self.last_x.fill(np.nan)
+        self.last_y.fill(np.nan)
+        # Pooled polyline points: row r uses [poly_start[r], poly_start[r] + poly_len[r])
+        self.pool_capacity = 256
+        self.pool_size = 0
+        self.pool_x = np.zeros(self.pool_capacity, dtype=np.float64)
+        self.pool_y = np.zeros(self.pool_capacity, dtype=np.float64)
+        self.pool_cumulative = np.zeros(self.pool_capacity, dtype=np.float64)
+        self.pool_waypoint = np.zeros(self.pool_capacity, dtype=np.intp) # Source waypoint of each point (-1 for the start point)
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    def __len__(self):
+        return self.size
+
+    # --- Rows ---
+    def add(self, enemy):
+        """Give `enemy` a new row and return its index."""
+        if self.size >= self.capacity:
+            self._grow_rows(self.capacity * 2)
+        slot = self.size
+        self.size += 1
+        self.owners.append(enemy)
+        for name in self.FLOAT_FIELDS:
+            getattr(self, name)[slot] = 0.0
+        for name in self.INT_FIELDS:
+            getattr(self, name)[slot] = 0
+        for name in self.BOOL_FIELDS:
+            getattr(self, name)[slot] = False
+        self.slow_value[slot] = 1.0
+        self.slow_until[slot] = -np.inf
+        self.stun_until[slot] = -np.inf
+        self.last_x[slot] = np.nan
+        self.last_y[slot] = np.nan
+        return slot
+
+    def activate(self, slot):
+        """Mark a row as in the scene (stepped and checked for death)."""
+        self.active[slot] = True
+
+    def release(self, slot):
+        """Mark a row as gone from the scene; compaction reclaims it."""
+        self.active[slot] = False
+
+    def live_slots(self):
+        """Indices of the active rows, in order."""
+        return np.flatnonzero(self.active[:self.size])
+
+    def owners_of(self, slots):
+        """The enemies owning `slots`, in the same order."""
+        owners = self.owners
+        return [owners[slot] for slot in slots.tolist()]
+
+    def rows_in_cells(self, slots, cell_size, cells):
+        """Rows of `slots` whose (cell_x, cell_y) for `cell_size` pixel cells is one of `cells`, in order."""
+        if not cells or not len(slots):
+            return slots[:0]
+        cell_x = (self.x[slots] // cell_size).astype(np.intp)
+        cell_y = (self.y[slots] // cell_size).astype(np.intp)
+        inside = np.zeros(len(slots), dtype=bool)
+        for x, y in cells:
+            inside |= (cell_x == x) & (cell_y == y)
+        return slots[inside]
+
+    def rows_reaching(self, slots, centre_x, min_y, x_tolerance):
+        """Rows of `slots` at or below `min_y` and within `x_tolerance` of `centre_x` (the objective test), in order."""
+        xs = self.x[slots]
+        return slots[(self.y[slots] >= min_y) & (np.abs(xs - centre_x) <= x_tolerance)]
+
+    def cells_of(self, slots, cell_size):
+        """(cell_x, cell_y) of each row in `slots` for a grid of `cell_size` pixels."""
+        cell_x = (self.x[slots] // cell_size).astype(np.intp)
+        cell_y = (self.y[slots] // cell_size).astype(np.intp)
+        return list(zip(cell_x.tolist(), cell_y.tolist()))
+
+    def _grow_rows(self, capacity):
+        for name in self.FLOAT_FIELDS + self.INT_FIELDS + self.BOOL_FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def _reserve_pool(self, count):
+        needed = self.pool_size + count
+        if needed <= self.pool_capacity:
+            return
+        capacity = self.pool_capacity
+        while capacity < needed:
+            capacity *= 2
+        for name in ('pool_x', 'pool_y', 'pool_cumulative', 'pool_waypoint'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.pool_size] = old[:self.pool_size]
+            setattr(self, name, new)
+        self.pool_capacity = capacity
+
+    def set_polyline(self, slot, polyline, base_index, tile_size):
+        """Copy a freshly built PathPolyline into the pool for row `slot` and restart it at distance 0."""
+        count = len(polyline.xs)
+        self._reserve_pool(count)
+        start = self.pool_size
+        end = start + count
+        self.pool_x[start:end] = polyline.xs
+        self.pool_y[start:end] = polyline.ys
+        self.pool_cumulative[start:end] = polyline.cumulative
+        self.pool_waypoint[start] = -1
+        if count > 1:
+            self.pool_waypoint[start + 1:end] = polyline.waypoint_indices
+        self.pool_size = end
+        self.poly_start[slot] = start
+        self.poly_len[slot] = count
+        self.base_index[slot] = base_index
+        self.path_index[slot] = base_index
+        self.path_distance[slot] = 0.0
+        self.segment[slot] = 0
+        self.tile_size[slot] = tile_size
+        self.has_path[slot] = True
+        self.path_dirty[slot] = False
+
+    # --- Compaction ---
+    def _extract(self, rows):
+        """New store holding copies of `rows` (in order) with their polylines re-pooled."""
+        rows = np.asarray(rows, dtype=np.intp)
+        other = EnemyStore(capacity=len(rows), rng=self.rng)
+        count = len(rows)
+        for name in self.FLOAT_FIELDS + self.INT_FIELDS + self.BOOL_FIELDS:
+            getattr(other, name)[:count] = getattr(self, name)[rows]
+        other.size = count
+        other.owners = [self.owners[row] for row in rows.tolist()]
+        # Re-pool the polylines back to back
+        lengths = self.poly_len[rows] * self.has_path[rows]
+        total = int(lengths.sum())
+        other._reserve_pool(total)
+        if total:
+            new_starts = np.cumsum(lengths) - lengths
+            point_rows = np.repeat(np.arange(count), lengths)
+            offsets = np.arange(total) - np.repeat(new_starts, lengths)
+            source = self.poly_start[rows][point_rows] + offsets
+            other.pool_x[:total] = self.pool_x[source]
+            other.pool_y[:total] = self.pool_y[source]
+            other.pool_cumulative[:total] = self.pool_cumulative[source]
+            other.pool_waypoint[:total] = self.pool_waypoint[source]
+            other.poly_start[:count] = new_starts
+        other.pool_size = total
+        for slot, enemy in enumerate(other.owners):
+            enemy.store = other
+            enemy.store_slot = slot
+        return other
+
+    def compact(self):
+        """Drop inactive rows; their enemies keep their values in a detached store."""
+        active = self.active[:self.size]
+        dead_rows = np.flatnonzero(~active)
+        if len(dead_rows):
+            self._extract(dead_rows) # Rebinds the departed enemies to their own store
+        live = self._extract(np.flatnonzero(active))
+        # Take over the compacted arrays
+        for name in self.FLOAT_FIELDS + self.INT_FIELDS + self.BOOL_FIELDS:
+            setattr(self, name, getattr(live, name))
+        for name in ('pool_x', 'pool_y', 'pool_cumulative', 'pool_waypoint', 'pool_capacity', 'pool_size', 'capacity', 'size', 'owners'):
+            setattr(self, name, getattr(live, name))
+        for slot, enemy in enumerate(self.owners):
+            enemy.store = self
+            enemy.store_slot = slot
+
+    def maybe_compact(self):
+        """Compact once inactive rows or stale polyline points outnumber live ones. Returns True if it ran."""
+        active = self.active[:self.size]
+        live_count = int(np.count_nonzero(active))
+        if self.size <= 2 * live_count + 64:
+            live_points = int(self.poly_len[:self.size][active].sum())
+            if self.pool_size <= 2 * live_points + 4096:
+                return False
+        self.compact()
+        return True
+
+    # --- Per-row status ---
+    def apply_slow(self, slot, multiplier, until):
+        self.slow_value[slot] = multiplier
+        self.slow_until[slot] = until
+
+    def apply_stun(self, slot, until):
+        self.stun_until[slot] = until
+
+    def recalculate_speed(self, slot, current_time=None):
+        """Speed of one row from its base speed and active slow/stun (expiry checked against current_time if given)."""
+        stun_until = self.stun_until[slot]
+        slow_until = self.slow_until[slot]
+        if current_time is None:
+            stunned = stun_until > -np.inf
+            slowed = slow_until > -np.inf
+        else:
+            stunned = current_time < stun_until
+            slowed = current_time < slow_until
+        if stunned:
+            self.speed[slot] = 0.0
+        elif slowed:
+            self.speed[slot] = self.base_speed[slot] * min(1.0, self.slow_value[slot])
+        else:
+            self.speed[slot] = self.base_speed[slot]
+
+    # --- Vectorised passes ---
+    def step(self, current_time, tile_size, slots=None):
+        """
+        Advance the active rows (or just `slots`) by one frame (what Enemy.move did per enemy).
+
+        Runs generic status expiry and DoTs per enemy (only for rows flagged
+        as ticking), rebuilds polylines for rows whose path changed or that
+        were moved by something else, then updates speed, path distance,
+        position and wander for all of them in vectorised passes.
+        """
+        if slots is None:
+            slots = self.live_slots()
+        if not len(slots):
+            return
+
+        # Status effects other than slow/stun and DoTs stay per enemy (rare, and they can deal damage)
+        ticking_rows = slots[self.ticking[slots]]
+        if len(ticking_rows):
+            owners = self.owners
+            for row in ticking_rows.tolist():
+                enemy = owners[row]
+                if enemy.status_effects:
+                    enemy.update_status_effects(current_time)
+                if enemy.active_dots:
+                    enemy.update_dots(current_time)
+                if not (enemy.status_effects or enemy.active_dots):
+                    self.ticking[row] = False
+
+        # Slow/stun expiry and speed for everyone
+        stunned = current_time < self.stun_until[slots]
+        slowed = current_time < self.slow_until[slots]
+        self.slow_until[slots] = np.where(slowed, self.slow_until[slots], -np.inf)
+        self.stun_until[slots] = np.where(stunned, self.stun_until[slots], -np.inf)
+        slow_multiplier = np.where(slowed, np.minimum(1.0, self.slow_value[slots]), 1.0)
+        self.speed[slots] = np.where(stunned, 0.0, self.base_speed[slots] * slow_multiplier)
+
+        # Rebuild polylines where the path changed or something else moved the enemy
+        on_path = self.path_index[slots] < self.path_len[slots]
+        stale = (~self.has_path[slots] | self.path_dirty[slots] |
+                 (self.tile_size[slots] != tile_size) |
+                 (self.x[slots] != self.last_x[slots]) | (self.y[slots] != self.last_y[slots]))
+        stale_rows = slots[on_path & stale]
+        if len(stale_rows):
+            owners = self.owners
+            for row in stale_rows.tolist():
+                owners[row].build_path_polyline(tile_size)
+
+        moving_slots = slots[on_path]
+        if len(moving_slots):
+            self._advance(moving_slots)
+
+    def walk_past_path_end(self, target_x, target_y, slots=None):
+        """Move rows that have finished their path straight towards (target_x, target_y) by their speed."""
+        if slots is None:
+            slots = self.live_slots()
+        finished = slots[self.path_index[slots] >= self.path_len[slots]]
+        if not len(finished):
+            return
+        dx = target_x - self.x[finished]
+        dy = target_y - self.y[finished]
+        distance = np.sqrt(dx ** 2 + dy ** 2)
+        moving = distance > 0
+        if not moving.any():
+            return
+        finished = finished[moving]
+        distance = distance[moving]
+        speed = self.speed[finished]
+        self.x[finished] += (dx[moving] / distance) * speed
+        self.y[finished] += (dy[moving] / distance) * speed
+
+    def _advance(self, slots):
+        """Move the given rows along their pooled polylines by one frame of speed, plus wander."""
+        speed = self.speed[slots]
+        distance = self.path_distance[slots] + speed
+        segment = self.segment[slots]
+        start = self.poly_start[slots]
+        length = self.poly_len[slots]
+        last_point = start + length - 1
+        last_segment = length - 2
+        cumulative = self.pool_cumulative
+        # Distances only grow, so segments step forward a few at most per frame
+        while True:
+            can_advance = segment < last_segment
+            if not can_advance.any():
+                break
+            next_index = np.minimum(start + segment + 1, last_point)
+            can_advance &= distance >= cumulative[next_index]
+            if not can_advance.any():
+                break
+            segment = segment + can_advance
+
+        # Interpolate within the segment (same cases as PathPolyline.position_at)
+        total_length = cumulative[last_point]
+        i0 = start + segment
+        i1 = np.minimum(i0 + 1, last_point)
+        segment_length = cumulative[i1] - cumulative[i0]
+        positive = segment_length > 0
+        t = np.where(positive, (distance - cumulative[i0]) / np.where(positive, segment_length, 1.0), 0.0)
+        base_x = self.pool_x[i0] + (self.pool_x[i1] - self.pool_x[i0]) * t
+        base_y = self.pool_y[i0] + (self.pool_y[i1] - self.pool_y[i0]) * t
+        base_x = np.where(positive, base_x, self.pool_x[i1])
+        base_y = np.where(positive, base_y, self.pool_y[i1])
+        at_end = distance >= total_length
+        base_x = np.where(at_end, self.pool_x[last_point], base_x)
+        base_y = np.where(at_end, self.pool_y[last_point], base_y)
+        single = length == 1
+        base_x = np.where(single, self.pool_x[start], base_x)
+        base_y = np.where(single, self.pool_y[start], base_y)
+
+        # Waypoints passed (PathPolyline.waypoints_passed)
+        passed = np.where(at_end, length - 1, segment)
+        waypoint = self.pool_waypoint[start + passed]
+        self.path_index[slots] = self.base_index[slots] + np.where(passed == 0, 0, waypoint + 1)
+
+        # Drift the wander offset a little, keeping it bounded
+        wander_x = self.wander_x[slots]
+        wander_y = self.wander_y[slots]
+        drifting = speed > 0
+        if drifting.any():
+            step = self.wander_step[slots]
+            limit = self.wander_limit[slots]
+            jitter = self.rng.uniform(-1.0, 1.0, size=(2, len(slots))) * step
+            wander_x = np.where(drifting, np.clip(wander_x + jitter[0], -limit, limit), wander_x)
+            wander_y = np.where(drifting, np.clip(wander_y + jitter[1], -limit, limit), wander_y)
+            self.wander_x[slots] = wander_x
+            self.wander_y[slots] = wander_y
+
+        new_x = base_x + wander_x
+        new_y = base_y + wander_y
+        self.path_distance[slots] = distance
+        self.segment[slots] = segment
+        self.x[slots] = new_x
+        self.y[slots] = new_y
+        self.last_x[slots] = new_x
+        self.last_y[slots] = new_y
+
+    def dead_enemies(self):
+        """The enemies of active rows with health <= 0, in order."""
+        size = self.size
+        return self.owners_of(np.flatnonzero(self.active[:size] & (self.health[:size] <= 0)))
+
+    def get_stats(self):
+        """Return a small dict describing the store's occupancy."""
+        return {
+            'rows': self.size,
+            'active': int(np.count_nonzero(self.active[:self.size])),
+            'capacity': self.capacity,
+            'pool_points': self.pool_size,
+            'pool_capacity': self.pool_capacity,
+        }
+
+class EnemyList(EntityList):
+    """
+    The scene's enemies: an EntityList that keeps each enemy's EnemyStore
+    row marked active while the enemy is in the list.
+    """
+    def append(self, enemy):
+        handle = super().append(enemy)
+        enemy.store.activate(enemy.store_slot)
+        return handle
+
+    def remove(self, enemy):
+        super().remove(enemy)
+        enemy.store.release(enemy.store_slot)
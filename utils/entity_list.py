@@ -0,0 +1,149 @@
+from collections import namedtuple
+
+EntityHandle = namedtuple('EntityHandle', ('slot', 'generation'))
+
+class EntityList:
+    """
+    Ordered container for the scene's projectiles, effects and enemies.
+
+    Removal is O(1): the entity's slot is emptied and its generation bumped,
+    and the dead entry is skipped by iteration until `compact` drops all
+    dead entries in one pass (the scene does this once per frame). Order is
+    kept, so update and draw order match what a plain list gave.
+
+    Iteration visits the entities present when it starts, skipping any that
+    are removed on the way, so loops can add and remove without copying the
+    list first. A handle (slot, generation) stays valid only while its
+    entity is in the container; `get` returns None once it has been removed.
+    """
+    def __init__(self, entities=()):
+        self._slot_entity = [] # slot -> entity (None once removed)
+        self._slot_generation = [] # slot -> generation, bumped on removal
+        self._slot_of = {} # entity -> slot
+        self._order = [] # Slots in insertion order (dead ones until compacted)
+        self._by_type = {} # exact type -> slots in insertion order
+        self._free_slots = [] # Reusable slots (only after compaction, so stale order entries stay dead)
+        self._released = [] # Slots emptied since the last compaction
+        self.extend(entities)
+
+    def __len__(self):
+        return len(self._slot_of)
+
+    def __bool__(self):
+        return bool(self._slot_of)
+
+    def __contains__(self, entity):
+        return entity in self._slot_of
+
+    def __iter__(self):
+        slot_entity = self._slot_entity
+        order = self._order
+        for index in range(len(order)): # Entities added during iteration are not visited
+            entity = slot_entity[order[index]]
+            if entity is not None:
+                yield entity
+
+    def __repr__(self):
+        return f"EntityList({list(self)!r})"
+
+    # --- Adding and removing ---
+    def append(self, entity):
+        """Add an entity at the end and return its handle. Adding one that is already present is a no-op."""
+        slot = self._slot_of.get(entity)
+        if slot is not None:
+            return EntityHandle(slot, self._slot_generation[slot])
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._slot_entity[slot] = entity
+        else:
+            slot = len(self._slot_entity)
+            self._slot_entity.append(entity)
+            self._slot_generation.append(0)
+        self._slot_of[entity] = slot
+        self._order.append(slot)
+        bucket = self._by_type.get(type(entity))
+        if bucket is None:
+            self._by_type[type(entity)] = [slot]
+        else:
+            bucket.append(slot)
+        return EntityHandle(slot, self._slot_generation[slot])
+
+    def extend(self, entities):
+        for entity in entities:
+            self.append(entity)
+
+    def remove(self, entity):
+        """Remove an entity in O(1). Raises ValueError if it is not present (like list.remove)."""
+        slot = self._slot_of.pop(entity, None)
+        if slot is None:
+            raise ValueError("EntityList.remove(x): x not in container")
+        self._slot_entity[slot] = None
+        self._slot_generation[slot] += 1
+        self._released.append(slot)
+
+    def discard(self, entity):
+        """Remove an entity if present."""
+        if entity in self._slot_of:
+            self.remove(entity)
+
+    def clear(self):
+        for entity in list(self._slot_of):
+            self.remove(entity)
+        self.compact()
+
+    def compact(self):
+        """Drop dead entries in one pass and make their slots reusable. Returns how many were dropped."""
+        if not self._released:
+            return 0
+        slot_entity = self._slot_entity
+        self._order = [slot for slot in self._order if slot_entity[slot] is not None]
+        for entity_type, bucket in list(self._by_type.items()):
+            live = [slot for slot in bucket if slot_entity[slot] is not None]
+            if live:
+                self._by_type[entity_type] = live
+            else:
+                del self._by_type[entity_type]
+        dropped = len(self._released)
+        self._free_slots.extend(self._released)
+        self._released = []
+        return dropped
+
+    # --- Handles ---
+    def handle(self, entity):
+        """Handle for an entity in the container (ValueError if absent)."""
+        slot = self._slot_of.get(entity)
+        if slot is None:
+            raise ValueError("EntityList.handle(x): x not in container")
+        return EntityHandle(slot, self._slot_generation[slot])
+
+    def get(self, handle):
+        """The entity a handle refers to, or None if it has since been removed."""
+        slot, generation = handle
+        if slot < len(self._slot_entity) and self._slot_generation[slot] == generation:
+            return self._slot_entity[slot]
+        return None
+
+    # --- Views ---
+    def of_type(self, *types):
+        """Live entities that are instances of any of `types`, type by type in insertion order."""
+        slot_entity = self._slot_entity
+        for entity_type, bucket in list(self._by_type.items()):
+            if not issubclass(entity_type, types):
+                continue
+            for index in range(len(bucket)):
+                entity = slot_entity[bucket[index]]
+                if entity is not None:
+                    yield entity
+
+    def live(self):
+        """A plain list of the live entities, in order."""
+        return list(self)
+
+    def get_stats(self):
+        """Return a small dict describing the container."""
+        return {
+            'live': len(self._slot_of),
+            'pending_dead': len(self._released),
+            'slots': len(self._slot_entity),
+            'types': len(self._by_type),
+        }
@@ -0,0 +1,103 @@
+"""Compact occupancy grid shared by placement, pathing and tower lookups."""
+
+# Cell values (same meaning as the old list-of-lists grid)
+CELL_EMPTY = 0
+CELL_TOWER = 1
+CELL_RESTRICTED = 2
+
+class OccupancyGrid:
+    """
+    Grid of cell values stored in one flat bytearray, plus a cell -> tower layer.
+
+    Reads keep the old `grid[y][x]` form (rows are memoryview slices), so the
+    pathfinding helpers work unchanged. Writes must go through set_cell /
+    fill_footprint / clear_footprint so that `version` increases; caches such
+    as flow fields and path caches compare against it to know when to rebuild.
+    `version` only tracks path-blocking cells; `layout_version` also increases
+    whenever the tower layer changes (traversable towers included), for caches
+    of where towers may be placed.
+    """
+    def __init__(self, width, height, fill=CELL_EMPTY):
+        self.width = width
+        self.height = height
+        self.cells = bytearray([fill]) * (width * height)
+        self._view = memoryview(self.cells)
+        self._rows = [self._view[y * width:(y + 1) * width] for y in range(height)]
+        self.towers = [None] * (width * height) # Tower occupying each cell (traversable towers included)
+        self.version = 0
+        self.layout_version = 0
+
+    # --- Read access ---
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, y):
+        """Row access so existing grid[y][x] reads keep working (read-only by convention)."""
+        return self._rows[y]
+
+    def in_bounds(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def get_cell(self, x, y):
+        """Return the cell value at (x, y)."""
+        return self.cells[y * self.width + x]
+
+    def tower_at(self, x, y):
+        """Return the tower occupying (x, y), or None. O(1)."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.towers[y * self.width + x]
+        return None
+
+    # --- Write access (bumps version) ---
+    def set_cell(self, x, y, value):
+        """Set a single cell value, bumping the version if it changed."""
+        index = y * self.width + x
+        if self.cells[index] != value:
+            self.cells[index] = value
+            self.version += 1
+            self.layout_version += 1
+
+    def fill_footprint(self, tower, blocks_path=True):
+        """
+        Register a tower over its footprint. Non-traversable towers also mark
+        their cells as CELL_TOWER.
+        """
+        changed = False
+        layout_changed = False
+        for y in range(tower.top_left_grid_y, tower.top_left_grid_y + tower.grid_height):
+            for x in range(tower.top_left_grid_x, tower.top_left_grid_x + tower.grid_width):
+                if 0 <= x < self.width and 0 <= y < self.height:
+                    index = y * self.width + x
+                    if self.towers[index] is not tower:
+                        self.towers[index] = tower
+                        layout_changed = True
+                    if blocks_path and self.cells[index] != CELL_TOWER:
+                        self.cells[index] = CELL_TOWER
+                        changed = True
+        if changed:
+            self.version += 1
+        if changed or layout_changed:
+            self.layout_version += 1
+
+    def clear_footprint(self, tower):
+        """Remove a tower from its footprint, freeing any CELL_TOWER cells (restricted cells are left alone)."""
+        changed = False
+        layout_changed = False
+        for y in range(tower.top_left_grid_y, tower.top_left_grid_y + tower.grid_height):
+            for x in range(tower.top_left_grid_x, tower.top_left_grid_x + tower.grid_width):
+                if 0 <= x < self.width and 0 <= y < self.height:
+                    index = y * self.width + x
+                    if self.towers[index] is tower:
+                        self.towers[index] = None
+                        layout_changed = True
+                    if self.cells[index] == CELL_TOWER:
+                        self.cells[index] = CELL_EMPTY
+                        changed = True
+        if changed:
+            self.version += 1
+        if changed or layout_changed:
+            self.layout_version += 1
+
+    def copy_rows(self):
+        """Return a plain list-of-lists snapshot (for debugging or legacy callers)."""
+        return [list(row) for row in self._rows]
@@ -0,0 +1,78 @@
+import math
+
+class PathPolyline:
+    """
+    A path converted once into pixel points with cumulative arc-lengths.
+
+    Movers keep a single scalar "distance travelled" and ask for the position
+    at that distance, so per-frame movement is a segment lookup plus a lerp
+    instead of re-normalising a direction vector every frame.
+    """
+    __slots__ = ("xs", "ys", "cumulative", "total_length", "waypoint_indices")
+
+    def __init__(self, points, waypoint_indices=None):
+        """
+        :param points: Sequence of (x, y) pixel points (at least one)
+        :param waypoint_indices: Optional source waypoint index for each point after the first
+        """
+        self.waypoint_indices = waypoint_indices
+        self.xs = [float(p[0]) for p in points]
+        self.ys = [float(p[1]) for p in points]
+        cumulative = [0.0]
+        for i in range(1, len(points)):
+            cumulative.append(cumulative[-1] + math.hypot(self.xs[i] - self.xs[i - 1], self.ys[i] - self.ys[i - 1]))
+        self.cumulative = cumulative
+        self.total_length = cumulative[-1]
+
+    @classmethod
+    def from_grid_path(cls, start_x, start_y, grid_path, tile_size, keep_indices=None):
+        """
+        Build a polyline that starts at a pixel position and then visits the
+        centre of each grid cell in `grid_path`.
+
+        :param keep_indices: Optional indices into grid_path to visit (see
+                             pathfinding.compress_path); defaults to every cell
+        """
+        if keep_indices is None:
+            keep_indices = range(len(grid_path))
+        half = tile_size // 2
+        points = [(start_x, start_y)]
+        points.extend((grid_path[i][0] * tile_size + half, grid_path[i][1] * tile_size + half) for i in keep_indices)
+        return cls(points, list(keep_indices))
+
+    def advance_segment(self, distance, segment):
+        """
+        Return the index of the segment containing `distance`, starting the
+        search at `segment`. Distances only grow, so this is amortised O(1).
+        """
+        last_segment = len(self.cumulative) - 2
+        while segment < last_segment and distance >= self.cumulative[segment + 1]:
+            segment += 1
+        return segment
+
+    def position_at(self, distance, segment):
+        """Return the (x, y) point `distance` pixels along the path, within the given segment."""
+        if segment < 0 or len(self.xs) == 1:
+            return self.xs[0], self.ys[0]
+        if distance >= self.total_length:
+            return self.xs[-1], self.ys[-1]
+        start = self.cumulative[segment]
+        length = self.cumulative[segment + 1] - start
+        if length <= 0:
+            return self.xs[segment + 1], self.ys[segment + 1]
+        t = (distance - start) / length
+        return (self.xs[segment] + (self.xs[segment + 1] - self.xs[segment]) * t,
+                self.ys[segment] + (self.ys[segment + 1] - self.ys[segment]) * t)
+
+    def points_passed(self, distance, segment):
+        """Number of points (after the first) already reached at `distance`."""
+        if distance >= self.total_length:
+            return len(self.xs) - 1
+        return segment
+
+    def waypoints_passed(self, distance, segment):
+        """Number of source waypoints already passed at `distance` (skipped ones count once a later point is reached)."""
+        passed = self.points_passed(distance, segment)
+        if passed == 0:
+            return 0
+        return self.waypoint_indices[passed - 1] + 1
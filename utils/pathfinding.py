@@ -1,100 +1,452 @@
 import heapq
+from collections import deque, OrderedDict
 from config import *
 
-class Node:
-    def __init__(self, x, y, g_cost=float('inf'), h_cost=0, parent=None):
-        self.x = x
-        self.y = y
-        self.g_cost = g_cost  # Cost from start to current node
-        self.h_cost = h_cost  # Estimated cost from current node to end
-        self.f_cost = g_cost + h_cost  # Total cost
-        self.parent = parent
-        
-    def __lt__(self, other):
-        return self.f_cost < other.f_cost
-
 def manhattan_distance(x1, y1, x2, y2):
     """Calculate Manhattan distance between two points"""
     return abs(x1 - x2) + abs(y1 - y2)
 
-def get_neighbors(node, grid, is_air_unit=False):
-    """Get valid neighboring nodes, considering unit type."""
-    neighbors = []
-    directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # Right, Down, Left, Up
-    
-    for dx, dy in directions:
-        new_x, new_y = node.x + dx, node.y + dy
-        
-        # Check if the new position is within grid bounds
-        if 0 <= new_x < len(grid[0]) and 0 <= new_y < len(grid):
-            # Check cell walkability based on unit type
-            is_walkable = False
-            if is_air_unit:
-                # Air units only care about bounds, ignore cell values (0, 1, 2)
-                is_walkable = True
-            else: # Ground unit
-                # Ground units should ONLY walk on 0 (empty), not 1 (tower) or 2 (restricted)
-                if grid[new_y][new_x] == 0:
-                    is_walkable = True
-                    
-            if is_walkable:
-                neighbors.append(Node(new_x, new_y))
-            
-    return neighbors
+class _SearchBuffers:
+    """
+    Per-cell scratch arrays for find_path, allocated once per grid size and
+    reused across calls. Instead of clearing them, each search bumps a
+    generation counter; a cell's entry only counts if its stamp matches.
+    """
+    def __init__(self, size):
+        self.size = size
+        self.g_cost = [0] * size
+        self.parent = [-1] * size
+        self.seen = [0] * size   # Generation in which g_cost/parent were written
+        self.closed = [0] * size # Generation in which the cell was expanded
+        self.generation = 0
+
+    def next_generation(self):
+        self.generation += 1
+        return self.generation
+
+_search_buffers = None
+
+def _get_search_buffers(size):
+    global _search_buffers
+    if _search_buffers is None or _search_buffers.size != size:
+        _search_buffers = _SearchBuffers(size)
+    return _search_buffers
+
+def _flatten_grid(grid, width, height):
+    """Flat row-major cell values; OccupancyGrid already stores them that way."""
+    cells = getattr(grid, 'cells', None)
+    if cells is not None and len(cells) == width * height:
+        return cells
+    flat = []
+    for row in grid:
+        flat.extend(row)
+    return flat
 
 def find_path(start_x, start_y, end_x, end_y, grid, is_air_unit=False):
     """
     Find a path from start to end using A* algorithm.
     
+    Cells are flat integer indices (y * width + x). g-costs and parents live in
+    preallocated arrays shared between calls, and heap entries are plain ints
+    encoding (f, h, cell); stale entries are skipped when popped (lazy deletion).
+    
     :param start_x: Starting x coordinate
     :param start_y: Starting y coordinate
     :param end_x: Ending x coordinate
     :param end_y: Ending y coordinate
     :param grid: 2D grid representing the map (0 = walkable, 1 = obstacle)
+    :param is_air_unit: Air units ignore cell values and only respect bounds
     :return: List of (x, y) coordinates representing the path
     """
-    start_node = Node(start_x, start_y, g_cost=0)
-    end_node = Node(end_x, end_y)
-    
-    open_set = []
-    closed_set = set()
-    node_dict = {}  # Keep track of nodes by their coordinates
-    
-    heapq.heappush(open_set, start_node)
-    node_dict[(start_x, start_y)] = start_node
-    
-    while open_set:
-        current = heapq.heappop(open_set)
-        
-        # Check if we've reached the end
-        if current.x == end_x and current.y == end_y:
+    height = len(grid)
+    width = len(grid[0]) if height else 0
+    if not (0 <= start_x < width and 0 <= start_y < height and 0 <= end_x < width and 0 <= end_y < height):
+        return []
+    size = width * height
+    cells = None if is_air_unit else _flatten_grid(grid, width, height)
+
+    buffers = _get_search_buffers(size)
+    generation = buffers.next_generation()
+    g_cost = buffers.g_cost
+    parent = buffers.parent
+    seen = buffers.seen
+    closed = buffers.closed
+
+    start = start_y * width + start_x
+    goal = end_y * width + end_x
+    # Heap key = (f * h_span + h) * size + cell; ties prefer the smaller h (closer to goal)
+    h_span = width + height
+    key_scale = h_span * size
+
+    g_cost[start] = 0
+    parent[start] = -1
+    seen[start] = generation
+    start_h = abs(start_x - end_x) + abs(start_y - end_y)
+    open_heap = [start_h * key_scale + start_h * size + start]
+    heappop = heapq.heappop
+    heappush = heapq.heappush
+
+    while open_heap:
+        current = heappop(open_heap) % size
+        if closed[current] == generation:
+            continue # Stale entry (lazy deletion)
+        if current == goal:
             path = []
-            while current:
-                path.append((current.x, current.y))
-                current = current.parent
+            while current != -1:
+                path.append((current % width, current // width))
+                current = parent[current]
             return path[::-1]  # Reverse the path
-            
-        closed_set.add((current.x, current.y))
-        
-        # Check all neighbors
-        for neighbor in get_neighbors(current, grid, is_air_unit):
-            if (neighbor.x, neighbor.y) in closed_set:
+        closed[current] = generation
+
+        cx = current % width
+        next_g = g_cost[current] + 1  # Cost to move to neighbor
+        # Same neighbour order as before: +y, +x, -y, -x
+        for neighbor, in_bounds in ((current + width, current + width < size),
+                                    (current + 1, cx + 1 < width),
+                                    (current - width, current >= width),
+                                    (current - 1, cx > 0)):
+            if not in_bounds or closed[neighbor] == generation:
                 continue
-                
-            g_cost = current.g_cost + 1  # Cost to move to neighbor
-            
-            # Check if we've found a better path to this node
-            if (neighbor.x, neighbor.y) in node_dict:
-                if g_cost >= node_dict[(neighbor.x, neighbor.y)].g_cost:
-                    continue
-                node_dict[(neighbor.x, neighbor.y)].g_cost = g_cost
-                node_dict[(neighbor.x, neighbor.y)].f_cost = g_cost + node_dict[(neighbor.x, neighbor.y)].h_cost
-            else:
-                neighbor.g_cost = g_cost
-                neighbor.h_cost = manhattan_distance(neighbor.x, neighbor.y, end_x, end_y)
-                neighbor.f_cost = g_cost + neighbor.h_cost
-                neighbor.parent = current
-                node_dict[(neighbor.x, neighbor.y)] = neighbor
-                heapq.heappush(open_set, neighbor)
-    
+            if cells is not None and cells[neighbor] != 0:
+                continue # Ground units only walk on 0 (not tower 1 / restricted 2)
+            if seen[neighbor] == generation and next_g >= g_cost[neighbor]:
+                continue
+            seen[neighbor] = generation
+            g_cost[neighbor] = next_g
+            parent[neighbor] = current
+            h = abs(neighbor % width - end_x) + abs(neighbor // width - end_y)
+            heappush(open_heap, (next_g + h) * key_scale + h * size + neighbor)
+
     return []  # No path found
+
+class FlowField:
+    """
+    Distance field to a single goal cell, built with a breadth-first search.
+
+    Every ground enemy can share one field: instead of running A* per enemy,
+    an enemy just steps to the neighbouring cell with the lowest distance.
+    Rebuild the field whenever the grid changes.
+    """
+    def __init__(self, grid, end_x, end_y):
+        self.end_x = end_x
+        self.end_y = end_y
+        self.width = len(grid[0]) if grid else 0
+        self.height = len(grid)
+        # distances[y][x] = steps to the goal, -1 if unreachable
+        self.distances = compute_distance_field(grid, end_x, end_y)
+
+    def distance_at(self, x, y):
+        """Return the step distance from (x, y) to the goal, or -1 if unreachable."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.distances[y][x]
+        return -1
+
+    def next_cell(self, x, y):
+        """
+        Return the neighbouring cell one step closer to the goal, or None.
+
+        Works from non-walkable cells too (e.g. an enemy standing where a tower
+        was just placed) by stepping onto the best reachable neighbour.
+        """
+        if x == self.end_x and y == self.end_y:
+            return None
+        best = None
+        best_distance = -1
+        for dx, dy in FLOW_DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.width and 0 <= ny < self.height:
+                d = self.distances[ny][nx]
+                if d >= 0 and (best_distance < 0 or d < best_distance):
+                    best = (nx, ny)
+                    best_distance = d
+        return best
+
+    def path_from(self, start_x, start_y):
+        """
+        Follow the field from (start_x, start_y) to the goal.
+
+        :return: List of (x, y) cells including start and goal, or [] if the goal
+                 cannot be reached (same contract as find_path).
+        """
+        path = [(start_x, start_y)]
+        x, y = start_x, start_y
+        # A valid walk can never be longer than the number of cells
+        for _ in range(self.width * self.height):
+            if x == self.end_x and y == self.end_y:
+                return path
+            step = self.next_cell(x, y)
+            if step is None:
+                return []
+            x, y = step
+            path.append(step)
+        return []
+
+# Same neighbour order as find_path so ties break the same way
+FLOW_DIRECTIONS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+def compute_distance_field(grid, end_x, end_y):
+    """
+    Breadth-first search outward from the goal over walkable (0) cells.
+
+    :param grid: 2D grid indexed grid[y][x] (0 = walkable)
+    :return: 2D list of step distances to the goal, -1 where unreachable
+    """
+    height = len(grid)
+    width = len(grid[0]) if grid else 0
+    distances = [[-1] * width for _ in range(height)]
+    if not (0 <= end_x < width and 0 <= end_y < height):
+        return distances
+
+    distances[end_y][end_x] = 0
+    frontier = deque([(end_x, end_y)])
+    while frontier:
+        x, y = frontier.popleft()
+        next_distance = distances[y][x] + 1
+        for dx, dy in FLOW_DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height and distances[ny][nx] < 0 and grid[ny][nx] == 0:
+                distances[ny][nx] = next_distance
+                frontier.append((nx, ny))
+    return distances
+
+def find_path_avoiding(start_x, start_y, end_x, end_y, grid, blocked=()):
+    """
+    Breadth-first shortest path over walkable cells, treating `blocked` cells as
+    obstacles. Lets callers test hypothetical placements without copying the grid.
+
+    :param blocked: Collection of (x, y) cells to treat as non-walkable
+    :return: List of (x, y) coordinates from start to end, or [] if unreachable
+    """
+    if (start_x, start_y) in blocked or (end_x, end_y) in blocked:
+        return []
+    height = len(grid)
+    width = len(grid[0]) if grid else 0
+    parents = {(start_x, start_y): None}
+    frontier = deque([(start_x, start_y)])
+    while frontier:
+        cell = frontier.popleft()
+        if cell[0] == end_x and cell[1] == end_y:
+            path = []
+            while cell is not None:
+                path.append(cell)
+                cell = parents[cell]
+            return path[::-1]
+        for dx, dy in FLOW_DIRECTIONS:
+            nx, ny = cell[0] + dx, cell[1] + dy
+            if 0 <= nx < width and 0 <= ny < height and grid[ny][nx] == 0:
+                neighbor = (nx, ny)
+                if neighbor not in parents and neighbor not in blocked:
+                    parents[neighbor] = cell
+                    frontier.append(neighbor)
+    return []
+
+def is_reachable(start_x, start_y, end_x, end_y, grid, blocked=()):
+    """Check whether the end cell can be reached from the start, treating `blocked` cells as obstacles."""
+    return bool(find_path_avoiding(start_x, start_y, end_x, end_y, grid, blocked))
+
+class PathCache:
+    """
+    Small LRU cache of paths keyed on (start, end, is_air, grid version).
+
+    Paths are stored as tuples so every enemy can share the same object safely.
+    Entries for an older grid version are dropped as soon as a newer version is
+    seen, so placing or selling a tower invalidates the cache automatically.
+    """
+    def __init__(self, max_size=32):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.grid_version = None
+        # Profiling counters
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, start_x, start_y, end_x, end_y, is_air_unit, grid_version, compute):
+        """
+        Return the cached path, calling `compute()` on a miss.
+
+        :param compute: Zero-argument callable returning a list/tuple of (x, y) cells
+        :return: Tuple of (x, y) cells (empty tuple if no path)
+        """
+        if grid_version != self.grid_version:
+            self.invalidate()
+            self.grid_version = grid_version
+        key = (start_x, start_y, end_x, end_y, is_air_unit, grid_version)
+        path = self.entries.get(key)
+        if path is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return path
+        self.misses += 1
+        path = tuple(compute())
+        self.entries[key] = path
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+        return path
+
+    def invalidate(self):
+        """Drop every cached path."""
+        self.entries.clear()
+
+    def get_stats(self):
+        """Return hit/miss counters for profiling."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.entries),
+            "hit_rate": (self.hits / total) if total else 0.0,
+        }
+
+def has_line_of_sight(x0, y0, x1, y1, grid, is_air_unit=False):
+    """
+    Check that the straight line between two cell centres only crosses walkable cells.
+
+    Uses a supercover walk, so when the line passes exactly through a cell corner
+    both side cells must be walkable too (no squeezing diagonally past a tower).
+    """
+    if is_air_unit:
+        return True
+    dx = abs(x1 - x0)
+    dy = abs(y1 - y0)
+    step_x = 1 if x1 > x0 else -1
+    step_y = 1 if y1 > y0 else -1
+    x, y = x0, y0
+    # error = (distance to next vertical edge) - (distance to next horizontal edge), scaled
+    error = dx - dy
+    dx2 = dx * 2
+    dy2 = dy * 2
+    while x != x1 or y != y1:
+        if error > 0:
+            x += step_x
+            error -= dy2
+        elif error < 0:
+            y += step_y
+            error += dx2
+        else:
+            # Exactly through a corner: both neighbours must be clear
+            if grid[y][x + step_x] != 0 or grid[y + step_y][x] != 0:
+                return False
+            x += step_x
+            y += step_y
+            error += dx2 - dy2
+        if grid[y][x] != 0:
+            return False
+    return True
+
+def compress_path(path, grid=None, is_air_unit=False):
+    """
+    Reduce a cell-by-cell path to its corner waypoints.
+
+    Collinear runs are always merged (the route is unchanged). If a grid is given,
+    waypoints are also skipped while the straight line to a later waypoint stays on
+    walkable cells, so enemies cut across open ground.
+
+    :param path: Sequence of (x, y) cells as returned by find_path
+    :param grid: Optional 2D grid for line-of-sight shortcuts
+    :return: List of indices into `path` of the waypoints to keep (always includes the last)
+    """
+    count = len(path)
+    if count <= 2:
+        return list(range(count))
+
+    keep = [0]
+    anchor = 0
+    if grid is None:
+        for i in range(1, count - 1):
+            ax, ay = path[i - 1]
+            bx, by = path[i]
+            cx, cy = path[i + 1]
+            if (bx - ax, by - ay) != (cx - bx, cy - by): # Direction changes here
+                keep.append(i)
+        keep.append(count - 1)
+        return keep
+
+    while anchor < count - 1:
+        ax, ay = path[anchor]
+        furthest = anchor + 1
+        for candidate in range(anchor + 2, count):
+            cx, cy = path[candidate]
+            if has_line_of_sight(ax, ay, cx, cy, grid, is_air_unit):
+                furthest = candidate
+            else:
+                break
+        keep.append(furthest)
+        anchor = furthest
+    return keep
+
+if __name__ == "__main__":
+    # Micro-benchmark (python -m utils.pathfinding): repeated searches on the standard
+    # 35x20 grid with a wall maze, against the Node-object A* find_path used before the
+    # flat-index rewrite. The old search never re-parented an improved node, so its
+    # path can come out longer than the new one.
+    import time
+
+    class _ReferenceNode:
+        def __init__(self, x, y, g_cost=float('inf'), h_cost=0, parent=None):
+            self.x = x
+            self.y = y
+            self.g_cost = g_cost
+            self.h_cost = h_cost
+            self.f_cost = g_cost + h_cost
+            self.parent = parent
+
+        def __lt__(self, other):
+            return self.f_cost < other.f_cost
+
+    def _reference_find_path(start_x, start_y, end_x, end_y, grid, is_air_unit=False):
+        """The old find_path: a Node per neighbour, a closed set and a coordinate dict."""
+        open_set = [_ReferenceNode(start_x, start_y, g_cost=0)]
+        closed_set = set()
+        node_dict = {(start_x, start_y): open_set[0]}
+        while open_set:
+            current = heapq.heappop(open_set)
+            if current.x == end_x and current.y == end_y:
+                path = []
+                while current:
+                    path.append((current.x, current.y))
+                    current = current.parent
+                return path[::-1]
+            closed_set.add((current.x, current.y))
+            for dx, dy in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+                new_x, new_y = current.x + dx, current.y + dy
+                if not (0 <= new_x < len(grid[0]) and 0 <= new_y < len(grid)):
+                    continue
+                if not is_air_unit and grid[new_y][new_x] != 0:
+                    continue
+                neighbor = _ReferenceNode(new_x, new_y)
+                if (new_x, new_y) in closed_set:
+                    continue
+                g_cost = current.g_cost + 1
+                known = node_dict.get((new_x, new_y))
+                if known is not None:
+                    if g_cost >= known.g_cost:
+                        continue
+                    known.g_cost = g_cost
+                    known.f_cost = g_cost + known.h_cost
+                else:
+                    neighbor.g_cost = g_cost
+                    neighbor.h_cost = manhattan_distance(new_x, new_y, end_x, end_y)
+                    neighbor.f_cost = g_cost + neighbor.h_cost
+                    neighbor.parent = current
+                    node_dict[(new_x, new_y)] = neighbor
+                    heapq.heappush(open_set, neighbor)
+        return []
+
+    bench_width = FIXED_TOTAL_GRID_WIDTH_TILES
+    bench_height = FIXED_TOTAL_GRID_HEIGHT_TILES
+    bench_grid = [[0] * bench_width for _ in range(bench_height)]
+    for wall_y in range(3, bench_height - 3, 3):
+        gap_x = 1 if (wall_y // 3) % 2 else bench_width - 2
+        for wall_x in range(1, bench_width - 1):
+            if wall_x != gap_x:
+                bench_grid[wall_y][wall_x] = 1
+    runs = 2000
+    timings = {}
+    for label, search in (("old", _reference_find_path), ("new", find_path)):
+        started = time.perf_counter()
+        for _ in range(runs):
+            bench_path = search(bench_width // 2, 1, bench_width // 2, bench_height - 2, bench_grid)
+        timings[label] = (time.perf_counter() - started) / runs
+        print(f"{label} find_path: {runs} searches on {bench_width}x{bench_height}, path length {len(bench_path)}, "
+              f"{timings[label] * 1e6:.1f} us/search")
+    print(f"speedup: {timings['old'] / timings['new']:.2f}x")
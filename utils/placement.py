@@ -0,0 +1,148 @@
+from utils.pathfinding import FLOW_DIRECTIONS, find_path_avoiding, is_reachable
+
+class PlacementValidator:
+    """
+    Answers "would blocking these cells cut the spawn from the objective?"
+    without copying the grid.
+
+    Built once per grid state from the current shortest path and the set of
+    cut cells (cells that every spawn -> objective route must pass through).
+    A footprint that misses the current path cannot block it, and a footprint
+    containing a cut cell always does, so most queries cost O(footprint).
+    Only multi-cell footprints that cross the path without hitting a cut cell
+    fall back to a (local) detour search around the footprint.
+    """
+    def __init__(self, grid, start_x, start_y, end_x, end_y, current_path):
+        """
+        :param grid: 2D grid indexed grid[y][x] (0 = walkable)
+        :param current_path: Current spawn -> objective path as (x, y) cells ([] if none)
+        """
+        self.grid = grid
+        self.start = (start_x, start_y)
+        self.end = (end_x, end_y)
+        self.path = list(current_path)
+        self.path_cells = frozenset(current_path)
+        self.path_positions = {cell: index for index, cell in enumerate(self.path)}
+        self.cut_cells = self._find_cut_cells() if current_path else frozenset()
+        self.fallback_searches = 0 # Profiling: how often the slow path was needed
+
+    def blocks_path(self, cells):
+        """
+        Return True if marking every cell in `cells` as an obstacle would leave
+        no route from start to end.
+
+        :param cells: Collection of (x, y) footprint cells
+        """
+        if not self.path_cells:
+            return True # Already blocked; nothing can be placed that fixes it
+        first_hit = last_hit = None
+        for cell in cells:
+            if cell in self.cut_cells:
+                return True
+            position = self.path_positions.get(cell)
+            if position is not None:
+                if first_hit is None or position < first_hit:
+                    first_hit = position
+                if last_hit is None or position > last_hit:
+                    last_hit = position
+        if first_hit is None:
+            return False # Current path survives untouched
+        if len(cells) == 1:
+            return False # A single non-cut cell can always be walked around
+        # The path before the first blocked cell and after the last one is still
+        # intact, so only a local detour between those two cells is needed.
+        # (start/end are cut cells, so both neighbours exist.)
+        self.fallback_searches += 1
+        detour_from = self.path[first_hit - 1]
+        detour_to = self.path[last_hit + 1]
+        return not is_reachable(detour_from[0], detour_from[1], detour_to[0], detour_to[1],
+                                self.grid, blocked=frozenset(cells))
+
+    def longest_valid_prefix(self, footprints):
+        """
+        Validate a sequence of footprints placed one after another (e.g. a
+        dragged wall). Each footprint is applied to one scratch set of blocked
+        cells, so a wall that only blocks the path as a whole is caught.
+
+        Cut cells of the original grid stay cut cells as more cells are blocked,
+        and the current path is only re-searched when a footprint lands on it.
+
+        :param footprints: List of footprints, each a list of (x, y) cells
+        :return: Number of leading footprints that can all be placed together
+        """
+        if not self.path_cells:
+            return 0
+        blocked = set() # Scratch occupancy shared by the whole batch
+        current_path = self.path_cells
+        for index, cells in enumerate(footprints):
+            touches_path = False
+            for cell in cells:
+                if cell in self.cut_cells:
+                    return index
+                if cell in current_path:
+                    touches_path = True
+            blocked.update(cells)
+            if touches_path:
+                self.fallback_searches += 1
+                new_path = find_path_avoiding(self.start[0], self.start[1], self.end[0], self.end[1],
+                                              self.grid, blocked=blocked)
+                if not new_path:
+                    return index
+                current_path = frozenset(new_path)
+        return len(footprints)
+
+    def _find_cut_cells(self):
+        """
+        Find the cells whose removal disconnects start from end.
+
+        Iterative Tarjan articulation-point search rooted at start; a cell v is a
+        start/end cut cell if end lies in the DFS subtree of a child c of v with
+        low[c] >= disc[v]. Start and end themselves are always included.
+        """
+        grid = self.grid
+        height = len(grid)
+        width = len(grid[0]) if grid else 0
+        start, end = self.start, self.end
+
+        disc = {start: 0}
+        low = {start: 0}
+        # Subtree of a cell = discovery indices [disc, last_disc] inclusive
+        last_disc = {}
+        counter = 1
+        stack = [(start, None, iter(FLOW_DIRECTIONS))]
+        children = {start: []}
+        while stack:
+            cell, parent, directions = stack[-1]
+            advanced = False
+            for dx, dy in directions:
+                nx, ny = cell[0] + dx, cell[1] + dy
+                if not (0 <= nx < width and 0 <= ny < height) or grid[ny][nx] != 0:
+                    continue
+                neighbor = (nx, ny)
+                if neighbor not in disc:
+                    disc[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    children[cell].append(neighbor)
+                    children[neighbor] = []
+                    stack.append((neighbor, cell, iter(FLOW_DIRECTIONS)))
+                    advanced = True
+                    break
+                if neighbor != parent:
+                    low[cell] = min(low[cell], disc[neighbor])
+            if advanced:
+                continue
+            stack.pop()
+            last_disc[cell] = counter - 1
+            if parent is not None:
+                low[parent] = min(low[parent], low[cell])
+
+        cut_cells = {start, end}
+        if end not in disc:
+            return frozenset(cut_cells)
+        end_disc = disc[end]
+        for cell, kids in children.items():
+            for child in kids:
+                if low[child] >= disc[cell] and disc[child] <= end_disc <= last_disc[child]:
+                    cut_cells.add(cell)
+                    break
+        return frozenset(cut_cells)
@@ -0,0 +1,167 @@
+import heapq
+
+class EnemySpatialHash:
+    """
+    Uniform grid of enemies bucketed at tile resolution, rebuilt once per tick.
+
+    Buckets are keyed by the position an enemy had when `rebuild` ran; enemies
+    keep moving during the tick (and harpoons/knockbacks nudge them), so every
+    query widens its bucket range by `slack` pixels and then does the exact
+    distance test against the enemy's *current* x/y. Results come back in the
+    same order as the list passed to `rebuild`, so callers that sort or pick
+    randomly behave exactly as they did when scanning the full list.
+    """
+    def __init__(self, cell_size, slack=None):
+        """
+        :param cell_size: Bucket size in pixels (normally one tile)
+        :param slack: Extra search margin in pixels for movement since rebuild (defaults to one cell)
+        """
+        self.cell_size = max(1, int(cell_size))
+        self.slack = self.cell_size if slack is None else slack
+        self.buckets = {}
+        self.order = {}
+        self.enemies = []
+
+    def __len__(self):
+        return len(self.enemies)
+
+    def __iter__(self):
+        return iter(self.enemies)
+
+    def rebuild(self, enemies, cells=None):
+        """
+        Re-bucket every enemy. Call once per tick before anything queries.
+
+        :param cells: Optional (cell_x, cell_y) per enemy, already computed (e.g. from the EnemyStore arrays)
+        """
+        enemies = list(enemies)
+        cell_size = self.cell_size
+        if cells is None:
+            cells = [(int(enemy.x // cell_size), int(enemy.y // cell_size)) for enemy in enemies]
+        buckets = {}
+        order = {}
+        for index, (enemy, key) in enumerate(zip(enemies, cells)):
+            order[enemy] = index
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [enemy]
+            else:
+                bucket.append(enemy)
+        self.buckets = buckets
+        self.order = order
+        self.enemies = enemies
+
+    def _candidates(self, left, top, right, bottom):
+        """Enemies in every bucket overlapping the (slack-padded) box, in rebuild order."""
+        cell_size = self.cell_size
+        slack = self.slack
+        min_cx = int((left - slack) // cell_size)
+        max_cx = int((right + slack) // cell_size)
+        min_cy = int((top - slack) // cell_size)
+        max_cy = int((bottom + slack) // cell_size)
+        buckets = self.buckets
+        found = []
+        # Large queries: walking the occupied buckets is cheaper than walking empty cells
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(buckets):
+            for (cx, cy), bucket in buckets.items():
+                if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy:
+                    found.extend(bucket)
+        else:
+            for cy in range(min_cy, max_cy + 1):
+                for cx in range(min_cx, max_cx + 1):
+                    bucket = buckets.get((cx, cy))
+                    if bucket:
+                        found.extend(bucket)
+        if len(found) > 1:
+            found.sort(key=self.order.__getitem__)
+        return found
+
+    # --- Queries ---
+    def query_circle(self, x, y, radius):
+        """Enemies whose centre is within `radius` pixels of (x, y) (inclusive)."""
+        radius_sq = radius * radius
+        return [enemy for enemy in self._candidates(x - radius, y - radius, x + radius, y + radius)
+                if (enemy.x - x) ** 2 + (enemy.y - y) ** 2 <= radius_sq]
+
+    def query_annulus(self, x, y, min_radius, max_radius):
+        """Enemies with min_radius <= distance <= max_radius (matches Tower.is_in_range)."""
+        min_sq = min_radius * min_radius
+        max_sq = max_radius * max_radius
+        result = []
+        for enemy in self._candidates(x - max_radius, y - max_radius, x + max_radius, y + max_radius):
+            dist_sq = (enemy.x - x) ** 2 + (enemy.y - y) ** 2
+            if min_sq <= dist_sq <= max_sq:
+                result.append(enemy)
+        return result
+
+    def query_aabb(self, left, top, right, bottom):
+        """Enemies whose centre lies inside the box (inclusive)."""
+        return [enemy for enemy in self._candidates(left, top, right, bottom)
+                if left <= enemy.x <= right and top <= enemy.y <= bottom]
+
+    def k_nearest(self, x, y, k, max_radius=None, predicate=None):
+        """
+        Return up to `k` enemies nearest to (x, y), closest first.
+
+        Searches outward ring by ring and stops once the next ring cannot
+        contain anything closer than the current k-th candidate.
+
+        :param max_radius: Optional search limit in pixels
+        :param predicate: Optional filter, e.g. lambda e: e.health > 0
+        """
+        if k <= 0 or not self.buckets:
+            return []
+        cell_size = self.cell_size
+        order = self.order
+        center_cx = int(x // cell_size)
+        center_cy = int(y // cell_size)
+        max_sq = None if max_radius is None else max_radius * max_radius
+        # Furthest ring that can hold anything: bounded by max_radius, or by the occupied buckets
+        if max_radius is not None:
+            max_ring = int((max_radius + self.slack) // cell_size) + 1
+        else:
+            max_ring = 0
+            for cx, cy in self.buckets:
+                max_ring = max(max_ring, abs(cx - center_cx), abs(cy - center_cy))
+        heap = [] # Max-heap of (-dist_sq, -order, enemy) holding the best k so far
+        for ring in range(max_ring + 1):
+            if ring:
+                cells = [(center_cx + dx, center_cy - ring) for dx in range(-ring, ring + 1)]
+                cells += [(center_cx + dx, center_cy + ring) for dx in range(-ring, ring + 1)]
+                cells += [(center_cx - ring, center_cy + dy) for dy in range(-ring + 1, ring)]
+                cells += [(center_cx + ring, center_cy + dy) for dy in range(-ring + 1, ring)]
+            else:
+                cells = [(center_cx, center_cy)]
+            for key in cells:
+                bucket = self.buckets.get(key)
+                if not bucket:
+                    continue
+                for enemy in bucket:
+                    if predicate is not None and not predicate(enemy):
+                        continue
+                    dist_sq = (enemy.x - x) ** 2 + (enemy.y - y) ** 2
+                    if max_sq is not None and dist_sq > max_sq:
+                        continue
+                    entry = (-dist_sq, -order[enemy], enemy)
+                    if len(heap) < k:
+                        heapq.heappush(heap, entry)
+                    elif entry[:2] > heap[0][:2]:
+                        heapq.heapreplace(heap, entry)
+            # Anything in ring+1 or beyond is at least this far away (minus movement slack)
+            if len(heap) == k:
+                reach = ring * cell_size - self.slack
+                if reach > 0 and reach * reach > -heap[0][0]:
+                    break
+        heap.sort(key=lambda entry: (-entry[0], -entry[1]))
+        return [entry[2] for entry in heap]
+
+    # --- Debug ---
+    def get_stats(self):
+        """Return a small dict describing bucket occupancy."""
+        sizes = [len(bucket) for bucket in self.buckets.values()]
+        return {
+            'enemies': len(self.enemies),
+            'buckets': len(sizes),
+            'max_bucket': max(sizes) if sizes else 0,
+            'cell_size': self.cell_size,
+        }
@@ -0,0 +1,143 @@
+"""
+Target priority selection.
+
+Priorities are resolved by name once (per tower) into plain functions, so the
+per-frame work is a single O(n) pass for one target or heapq.nsmallest for
+k targets. Ties resolve to the earliest candidate, exactly like the stable
+sorts these replace.
+"""
+import heapq
+import random
+
+DEFAULT_PRIORITY = "closest"
+
+# --- Single-best selection (one pass, keeps the first of equal keys) ---
+def _select_closest(x, y, candidates):
+    best = None
+    best_key = 0.0
+    for enemy in candidates:
+        key = (enemy.x - x)**2 + (enemy.y - y)**2
+        if best is None or key < best_key:
+            best = enemy
+            best_key = key
+    return best
+
+def _select_furthest(x, y, candidates):
+    best = None
+    best_key = 0.0
+    for enemy in candidates:
+        key = (enemy.x - x)**2 + (enemy.y - y)**2
+        if best is None or key > best_key:
+            best = enemy
+            best_key = key
+    return best
+
+def _select_highest_health(x, y, candidates):
+    best = None
+    best_key = 0
+    for enemy in candidates:
+        key = getattr(enemy, 'health', 0)
+        if best is None or key > best_key:
+            best = enemy
+            best_key = key
+    return best
+
+def _select_lowest_health(x, y, candidates):
+    best = None
+    best_key = 0
+    for enemy in candidates:
+        key = getattr(enemy, 'health', 0)
+        if best is None or key < best_key:
+            best = enemy
+            best_key = key
+    return best
+
+def _select_first(x, y, candidates):
+    """Enemy with the least path left to walk (closest to the objective)."""
+    best = None
+    best_key = 0.0
+    for enemy in candidates:
+        key = enemy.get_remaining_path_distance()
+        if best is None or key < best_key:
+            best = enemy
+            best_key = key
+    return best
+
+def _select_last(x, y, candidates):
+    """Enemy with the most path left to walk (most recently spawned)."""
+    best = None
+    best_key = 0.0
+    for enemy in candidates:
+        key = enemy.get_remaining_path_distance()
+        if best is None or key > best_key:
+            best = enemy
+            best_key = key
+    return best
+
+def _select_random(x, y, candidates):
+    return random.choice(candidates) if candidates else None
+
+# --- k-best selection keys (heapq.nsmallest is stable, like sorted()[:k]) ---
+def _closest_key(x, y):
+    return lambda enemy: (enemy.x - x)**2 + (enemy.y - y)**2
+
+def _furthest_key(x, y):
+    return lambda enemy: -((enemy.x - x)**2 + (enemy.y - y)**2)
+
+def _highest_health_key(x, y):
+    return lambda enemy: -getattr(enemy, 'health', 0)
+
+def _lowest_health_key(x, y):
+    return lambda enemy: getattr(enemy, 'health', 0)
+
+def _first_key(x, y):
+    return lambda enemy: enemy.get_remaining_path_distance()
+
+def _last_key(x, y):
+    return lambda enemy: -enemy.get_remaining_path_distance()
+
+# name -> (single-best function, k-best key factory or None)
+PRIORITIES = {
+    "closest": (_select_closest, _closest_key),
+    "furthest": (_select_furthest, _furthest_key),
+    "highest_health": (_select_highest_health, _highest_health_key),
+    "lowest_health": (_select_lowest_health, _lowest_health_key),
+    "first": (_select_first, _first_key),
+    "last": (_select_last, _last_key),
+    "random": (_select_random, None),
+}
+
+class TargetSelector:
+    """
+    A target priority resolved once from its name.
+
+    Unknown names (including the beam-only "current") behave like "closest".
+    Priorities without an ordering ("random") fall back to closest when asked
+    for the k best, which is how beam towers have always picked their targets.
+    """
+    __slots__ = ("name", "_select", "_key_factory")
+
+    def __init__(self, name=None):
+        self.name = name or DEFAULT_PRIORITY
+        select, key_factory = PRIORITIES.get(self.name, PRIORITIES[DEFAULT_PRIORITY])
+        self._select = select
+        self._key_factory = key_factory or _closest_key
+
+    def best(self, x, y, candidates):
+        """Return the single best target from `candidates` (or None) as seen from (x, y)."""
+        return self._select(x, y, candidates)
+
+    def best_k(self, x, y, candidates, k):
+        """Return up to `k` targets in priority order."""
+        if k <= 0 or not candidates:
+            return []
+        if k == 1 and self._key_factory is _closest_key:
+            best = _select_closest(x, y, candidates)
+            return [best] if best is not None else []
+        return heapq.nsmallest(k, candidates, key=self._key_factory(x, y))
+
+CLOSEST = TargetSelector("closest")
+
+def select_closest(x, y, candidates):
+    """Closest candidate to (x, y), or None. Shared by chain zaps, bounces and pierces."""
+    return _select_closest(x, y, candidates)
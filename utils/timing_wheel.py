@@ -0,0 +1,68 @@
+class TimingWheel:
+    """
+    Hashed timing wheel for events due at a game time (seconds).
+
+    Events go into the slot for their due tick; `advance` only visits the
+    slots between the last processed tick and now, so the per-frame cost
+    depends on how many events come due, not on how many are pending. Events
+    more than one revolution away stay in their slot until their time comes.
+    """
+    def __init__(self, slot_duration=1.0 / 60, num_slots=512):
+        """
+        :param slot_duration: Seconds covered by one slot (about one frame)
+        :param num_slots: Slots per revolution
+        """
+        self.slot_duration = slot_duration
+        self.num_slots = num_slots
+        self.slots = [[] for _ in range(num_slots)]
+        self.count = 0
+        self.current_tick = None # Last fully processed tick
+        self._seq = 0
+
+    def __len__(self):
+        return self.count
+
+    def _tick_of(self, time_value):
+        return int(time_value // self.slot_duration)
+
+    def schedule(self, due_time, item):
+        """Add `item`, to be returned by the first advance() at or after due_time."""
+        tick = self._tick_of(due_time)
+        if self.current_tick is not None and tick <= self.current_tick:
+            tick = self.current_tick + 1 # Already-passed slots are not revisited; fire next advance
+        self._seq += 1
+        self.slots[tick % self.num_slots].append((due_time, self._seq, tick, item))
+        self.count += 1
+
+    def advance(self, current_time):
+        """Return the items due at or before current_time, earliest first (ties in schedule order)."""
+        now_tick = self._tick_of(current_time)
+        if not self.count:
+            self.current_tick = now_tick - 1 if self.current_tick is None else max(self.current_tick, now_tick - 1)
+            return []
+        due = []
+        # First call, or more than a revolution behind (e.g. after a pause): every slot is visited once
+        first_tick = now_tick - self.num_slots + 1
+        if self.current_tick is not None:
+            first_tick = max(self.current_tick + 1, first_tick)
+        for tick in range(first_tick, now_tick + 1):
+            slot = self.slots[tick % self.num_slots]
+            if not slot:
+                continue
+            keep = []
+            for entry in slot:
+                if entry[0] <= current_time and entry[2] <= now_tick:
+                    due.append(entry)
+                else:
+                    keep.append(entry) # Later this tick, or a later revolution
+            self.slots[tick % self.num_slots] = keep
+        # The current tick may still hold events due later in it, so it is visited again next time
+        self.current_tick = now_tick - 1 if self.current_tick is None else max(self.current_tick, now_tick - 1)
+        self.count -= len(due)
+        due.sort(key=lambda entry: (entry[0], entry[1]))
+        return [entry[3] for entry in due]
+
+    def clear(self):
+        """Drop every pending event."""
+        self.slots = [[] for _ in range(self.num_slots)]
+        self.count = 0
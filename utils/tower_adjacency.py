@@ -0,0 +1,85 @@
+def tower_race_id(tower):
+    """Race prefix of a tower id ("solar_sun_king" -> "solar")."""
+    return tower.tower_id.split('_')[0]
+
+class TowerAdjacencyGraph:
+    """
+    Which towers touch which, kept up to date as towers are placed and removed.
+
+    Neighbours are found by walking the ring of cells around a footprint in
+    the occupancy grid's cell -> tower layer, so adding a tower only looks at
+    the cells next to it. Each edge records whether the two footprints share
+    an edge or only touch at a corner, and every tower keeps a count of its
+    neighbours per race so requires_solar_adjacency checks are a dict lookup.
+    """
+    def __init__(self, grid):
+        """
+        :param grid: OccupancyGrid whose tower layer already holds placed towers
+        """
+        self.grid = grid
+        self.neighbors = {} # tower -> {neighbour: shares_edge}
+        self.race_counts = {} # tower -> {race_id: number of touching towers}
+
+    def add_tower(self, tower):
+        """Link a newly placed tower to everything touching its footprint. Call after grid.fill_footprint."""
+        links = {}
+        start_x = tower.top_left_grid_x
+        start_y = tower.top_left_grid_y
+        end_x = start_x + tower.grid_width - 1
+        end_y = start_y + tower.grid_height - 1
+        tower_at = self.grid.tower_at
+        for y in range(start_y - 1, end_y + 2):
+            for x in range(start_x - 1, end_x + 2):
+                if start_x <= x <= end_x and start_y <= y <= end_y:
+                    continue # Inside the footprint
+                other = tower_at(x, y)
+                if other is None or other is tower:
+                    continue
+                # Corner cells only touch diagonally; any side cell means a shared edge
+                is_corner = (x < start_x or x > end_x) and (y < start_y or y > end_y)
+                links[other] = links.get(other, False) or not is_corner
+
+        self.neighbors[tower] = links
+        counts = {}
+        race_id = tower_race_id(tower)
+        for other, shares_edge in links.items():
+            self.neighbors[other][tower] = shares_edge
+            other_race = tower_race_id(other)
+            counts[other_race] = counts.get(other_race, 0) + 1
+            other_counts = self.race_counts[other]
+            other_counts[race_id] = other_counts.get(race_id, 0) + 1
+        self.race_counts[tower] = counts
+        tower.adjacency_graph = self
+
+    def remove_tower(self, tower):
+        """Unlink a sold or destroyed tower."""
+        links = self.neighbors.pop(tower, None)
+        self.race_counts.pop(tower, None)
+        if tower.adjacency_graph is self:
+            tower.adjacency_graph = None
+        if not links:
+            return
+        race_id = tower_race_id(tower)
+        for other in links:
+            self.neighbors[other].pop(tower, None)
+            other_counts = self.race_counts[other]
+            other_counts[race_id] -= 1
+            if not other_counts[race_id]:
+                del other_counts[race_id]
+
+    # --- Queries ---
+    def touching(self, tower):
+        """Towers sharing an edge or a corner with `tower`."""
+        return list(self.neighbors.get(tower, ()))
+
+    def edge_neighbors(self, tower):
+        """Towers sharing at least one edge with `tower`."""
+        return [other for other, shares_edge in self.neighbors.get(tower, {}).items() if shares_edge]
+
+    def shares_edge(self, tower, other):
+        """True if the two towers' footprints share an edge."""
+        return self.neighbors.get(tower, {}).get(other, False)
+
+    def count_race(self, tower, race_id):
+        """Number of `race_id` towers touching `tower` (edges and corners)."""
+        return self.race_counts.get(tower, {}).get(race_id, 0)
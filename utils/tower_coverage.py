@@ -0,0 +1,96 @@
+import math
+
+class TowerCoverageMap:
+    """
+    Cell -> towers whose range annulus reaches that cell.
+
+    Towers never move and their ranges are fixed, so this only changes when
+    towers are placed, sold or destroyed. Each tick the scene looks up the
+    cells that actually hold live enemies (the EnemySpatialHash buckets) and
+    gets the set of towers that could possibly have a target; every other
+    tower skips its target scan.
+
+    Cells are tested with the same `slack` margin as the spatial hash so an
+    enemy that moved a little since the hash was rebuilt is never missed.
+    Only cells on the map are stored; an enemy bucketed off the map wakes
+    every tower instead.
+    """
+    def __init__(self, cell_size, grid_width, grid_height, slack=None):
+        self.cell_size = max(1, int(cell_size))
+        self.grid_width = int(grid_width)
+        self.grid_height = int(grid_height)
+        self.slack = self.cell_size if slack is None else slack
+        self.cell_towers = {} # (cell_x, cell_y) -> list of towers
+        self.towers = []
+        self.key = None
+
+    def rebuild(self, towers, key=None):
+        """Recompute coverage for every tower. `key` identifies the layout it was built for."""
+        cell_towers = {}
+        for tower in towers:
+            for cell in self.covered_cells(tower.x, tower.y, tower.range_min_pixels, tower.range):
+                bucket = cell_towers.get(cell)
+                if bucket is None:
+                    cell_towers[cell] = [tower]
+                else:
+                    bucket.append(tower)
+        self.cell_towers = cell_towers
+        self.towers = list(towers)
+        self.key = key
+
+    def covered_cells(self, x, y, min_radius, max_radius):
+        """On-map cells whose square (padded by slack) overlaps the annulus around (x, y)."""
+        cell_size = self.cell_size
+        # slack is per axis in the hash, so allow for it diagonally
+        pad = self.slack * math.sqrt(2)
+        outer = max_radius + pad
+        inner = max(0.0, min_radius - pad)
+        outer_sq = outer * outer
+        inner_sq = inner * inner
+        cells = []
+        # Clamp to the map so long-range towers don't walk thousands of off-map cells
+        min_cx = max(0, int(math.floor((x - outer) / cell_size)))
+        max_cx = min(self.grid_width - 1, int(math.floor((x + outer) / cell_size)))
+        min_cy = max(0, int(math.floor((y - outer) / cell_size)))
+        max_cy = min(self.grid_height - 1, int(math.floor((y + outer) / cell_size)))
+        for cy in range(min_cy, max_cy + 1):
+            top = cy * cell_size
+            bottom = top + cell_size
+            # Nearest / farthest vertical offsets from the centre to this row of cells
+            near_dy = top - y if y < top else (y - bottom if y > bottom else 0.0)
+            far_dy = max(abs(y - top), abs(y - bottom))
+            for cx in range(min_cx, max_cx + 1):
+                left = cx * cell_size
+                right = left + cell_size
+                near_dx = left - x if x < left else (x - right if x > right else 0.0)
+                if near_dx * near_dx + near_dy * near_dy > outer_sq:
+                    continue # Cell lies completely outside the range
+                far_dx = max(abs(x - left), abs(x - right))
+                if inner_sq and far_dx * far_dx + far_dy * far_dy < inner_sq:
+                    continue # Cell lies completely inside the minimum range
+                cells.append((cx, cy))
+        return cells
+
+    def towers_with_enemies(self, enemy_buckets):
+        """
+        Return the set of towers covering at least one cell with a live enemy.
+
+        :param enemy_buckets: Mapping of cell -> enemies (EnemySpatialHash.buckets)
+        """
+        active = set()
+        cell_towers = self.cell_towers
+        grid_width = self.grid_width
+        grid_height = self.grid_height
+        for cell, enemies in enemy_buckets.items():
+            towers = cell_towers.get(cell)
+            if not towers:
+                cx, cy = cell
+                if 0 <= cx < grid_width and 0 <= cy < grid_height:
+                    continue
+                # Off-map cells aren't stored; let every tower scan for this enemy
+                towers = self.towers
+            for enemy in enemies:
+                if enemy.health > 0:
+                    active.update(towers)
+                    break
+        return active
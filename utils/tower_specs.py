@@ -0,0 +1,426 @@
+"""
+Compiled, read-only tower definitions.
+
+Every tower entry in data/tower_races.json (or tower_races_wild.json) is
+compiled once into a TowerSpec that all towers of that type share. A spec
+holds the values the game used to look up in the raw dict every frame:
+pixel radii are converted up front, target lists become a bitmask, and the
+`special` block becomes a SpecialSpec with a resolved SpecialEffect and a
+typed parameter record (defaults filled in) for the effects the frame loop
+reads. The raw dicts stay available as `raw` for rarely used keys.
+"""
+import json
+from collections import namedtuple
+from enum import Enum
+from types import MappingProxyType
+
+import config
+
+# 200 abstract range units = 1 tile = GRID_SIZE pixels
+def units_to_pixels(units):
+    return units * (config.GRID_SIZE / 200.0)
+
+# --- Targets ---
+TARGET_GROUND = 1
+TARGET_AIR = 2
+TARGET_ENEMIES = TARGET_GROUND | TARGET_AIR
+TARGET_TOWERS = 4
+TARGET_BITS = {
+    'ground': TARGET_GROUND,
+    'air': TARGET_AIR,
+    'enemies': TARGET_ENEMIES,
+    'towers': TARGET_TOWERS,
+}
+
+def target_bit(name):
+    """Bit for one target name (an enemy's `type`, or a targets entry); 0 if unknown."""
+    return TARGET_BITS.get(name, 0)
+
+def target_mask(targets):
+    """Bitmask for a targets value: a list of names or a single name string."""
+    if not targets:
+        return 0
+    if isinstance(targets, str):
+        return target_bit(targets)
+    mask = 0
+    for name in targets:
+        mask |= target_bit(name)
+    return mask
+
+# --- Special effects ---
+class SpecialEffect(str, Enum):
+    """Every `special.effect` the game knows. Compares equal to its JSON string."""
+    ADJACENCY_ATTACK_SPEED_BUFF = 'adjacency_attack_speed_buff'
+    ADJACENCY_DAMAGE_BUFF = 'adjacency_damage_buff'
+    AIR_DAMAGE_AURA = 'air_damage_aura'
+    ALIGHT = 'alight'
+    APPLY_MARK = 'apply_mark'
+    ARMOR_REDUCTION_ON_HIT = 'armor_reduction_on_hit'
+    ATTACK_SPEED_AURA = 'attack_speed_aura'
+    BASH_CHANCE = 'bash_chance'
+    BERSERK_TRIGGER = 'berserk_trigger'
+    BLAST_ZONE = 'blast_zone'
+    BLEED = 'bleed'
+    BONECHILL_PULSE_AURA = 'bonechill_pulse_aura'
+    BOUNTY_ON_KILL = 'bounty_on_kill'
+    BROADSIDE = 'broadside'
+    BURN = 'burn'
+    CHAIN_LIGHTNING = 'chain_lightning'
+    CHANCE_IGNORE_ARMOR_ON_HIT = 'chance_ignore_armor_on_hit'
+    CLUSTER_SHOT = 'cluster_shot'
+    CRIT_AURA = 'crit_aura'
+    CRIT_DAMAGE_PULSE_AURA = 'crit_damage_pulse_aura'
+    CRIT_SPLASH_INCREASE = 'crit_splash_increase'
+    DAMAGE_AURA = 'damage_aura'
+    DAMAGE_PULSE_AURA = 'damage_pulse_aura'
+    DISTANCE_DAMAGE_BONUS = 'distance_damage_bonus'
+    DOT_AMPLIFICATION_AURA = 'dot_amplification_aura'
+    DOT_PULSE_AURA = 'dot_pulse_aura'
+    DOUBLE_STRIKE = 'double_strike'
+    ENEMY_ARMOR_REDUCTION_AURA = 'enemy_armor_reduction_aura'
+    EVERY_NTH_STRIKE = 'every_nth_strike'
+    EXECUTE = 'execute'
+    FALLOUT = 'fallout'
+    FIXED_DISTANCE_PASS_THROUGH_EXPLODE = 'fixed_distance_pass_through_explode'
+    FLAMESLASH = 'flameslash'
+    GATTLING_SPIN_UP = 'gattling_spin_up'
+    GOLD_GENERATION = 'gold_generation'
+    GOLD_ON_KILL = 'gold_on_kill'
+    GRENADE_LAUNCHER = 'grenade_launcher'
+    GROUND_SPIKE_DOT = 'ground_spike_dot'
+    HARPOON = 'harpoon'
+    IGNORE_ARMOR_ON_HIT = 'ignore_armor_on_hit'
+    LASER_PAINTER = 'laser_painter'
+    MAX_HP_REDUCTION_ON_HIT = 'max_hp_reduction_on_hit'
+    MISS_CHANCE = 'miss_chance'
+    OFFSET_BOOMERANG_PATH = 'offset_boomerang_path'
+    ORBITING_DAMAGER = 'orbiting_damager'
+    POISON = 'poison'
+    QUILLSPRAY = 'quillspray'
+    RADIANCE_AURA = 'radiance_aura'
+    RAMPAGE_DAMAGE_STACK = 'rampage_damage_stack'
+    RANDOM_BOMBARDMENT = 'random_bombardment'
+    RANDOM_GOLD_GENERATION = 'random_gold_generation'
+    REAPER = 'reaper'
+    REQUIRES_SOLAR_ADJACENCY = 'requires_solar_adjacency'
+    REVEAL = 'reveal'
+    REWIND_WAYPOINTS = 'rewind_waypoints'
+    SALVO_ATTACK = 'salvo_attack'
+    SCORCH = 'scorch'
+    SEAR = 'sear'
+    SELF_DESTRUCT = 'self_destruct'
+    SHATTER = 'shatter'
+    SHOTGUN = 'shotgun'
+    SLOW = 'slow'
+    SLOW_AURA = 'slow_aura'
+    SLOW_PULSE_AURA = 'slow_pulse_aura'
+    SPLASH_RADIUS_BUFF_AURA = 'splash_radius_buff_aura'
+    STORM_AURA = 'storm_aura'
+    STRATEGIC_STRIKE = 'strategic_strike'
+    STUN = 'stun'
+    STUN_ON_HIT = 'stun_on_hit'
+    STUN_PULSE_AURA = 'stun_pulse_aura'
+    SWARM_POWER = 'swarm_power'
+    TOXIN = 'toxin'
+    VILE_CHEMICAL = 'vile_chemical'
+    VORTEX_DAMAGE_AURA = 'vortex_damage_aura'
+    WALKOVER_DAMAGE = 'walkover_damage'
+    WHIP_ATTACK = 'whip_attack'
+    OTHER = 'other' # An effect name the game has no handling for
+
+    @classmethod
+    def resolve(cls, name):
+        """The member for an effect name; None for no effect, OTHER for an unknown one."""
+        if not name:
+            return None
+        try:
+            return cls(name)
+        except ValueError:
+            return cls.OTHER
+
+    @property
+    def is_pulse_aura(self):
+        return self.value.endswith('_pulse_aura')
+
+# Stands in for "the tower's own damage_type" in the defaults below
+TOWER_DAMAGE_TYPE = object()
+
+# Parameters the frame loop reads for each effect, with the defaults it has always used
+_DOT_PARAMS = (('dot_damage', 0), ('dot_interval', 1.0), ('dot_duration', 1.0), ('dot_damage_type', TOWER_DAMAGE_TYPE))
+EFFECT_PARAMS = {
+    SpecialEffect.GOLD_GENERATION: (('amount', 0),),
+    SpecialEffect.RANDOM_GOLD_GENERATION: (('min_gold', 1), ('max_gold', 1)),
+    SpecialEffect.CRIT_DAMAGE_PULSE_AURA: (('duration', 1.0), ('crit_multiplier_bonus', 0.0)),
+    SpecialEffect.REQUIRES_SOLAR_ADJACENCY: (('required_count', 3), ('race_to_check', 'solar')),
+    SpecialEffect.LASER_PAINTER: (('charge_duration', 2.0), ('slow_percentage', 0)),
+    SpecialEffect.SLOW: (('slow_percentage', 0),),
+    SpecialEffect.SLOW_PULSE_AURA: (('slow_percentage', 0), ('duration', 1.0)),
+    SpecialEffect.DAMAGE_PULSE_AURA: (('pulse_damage', 0), ('pulse_damage_type', 'normal')),
+    SpecialEffect.STUN_PULSE_AURA: (('duration', 0.5),),
+    SpecialEffect.BONECHILL_PULSE_AURA: (('bonechill_duration', 3.0),),
+    SpecialEffect.DOT_PULSE_AURA: (('dot_effect_name', 'unnamed_dot'), ('dot_damage', 0), ('dot_interval', 1.0),
+                                   ('dot_duration', 1.0), ('dot_damage_type', 'normal'),
+                                   ('slow_percentage', 0), ('duration', 1.0)),
+    SpecialEffect.DAMAGE_AURA: (('dot_damage', 0), ('dot_interval', 1.0), ('dot_damage_type', 'normal')),
+    SpecialEffect.RADIANCE_AURA: (('dot_damage', 0), ('dot_interval', 1.0), ('dot_damage_type', 'fire')),
+    SpecialEffect.STORM_AURA: (('dot_damage', 0), ('dot_interval', 1.0), ('dot_damage_type', 'arcane'),
+                               ('slow_percentage', 0)),
+    SpecialEffect.SLOW_AURA: (('slow_percentage', 0),),
+    SpecialEffect.VORTEX_DAMAGE_AURA: (('tick_interval', 0.1), ('min_damage_at_edge', 0),
+                                       ('max_damage_at_center', 0), ('damage_type', 'arcane')),
+    SpecialEffect.ENEMY_ARMOR_REDUCTION_AURA: (('reduction_amount', 0),),
+    SpecialEffect.BURN: _DOT_PARAMS,
+    SpecialEffect.GROUND_SPIKE_DOT: _DOT_PARAMS,
+}
+
+# Parameters the per-tower effect hooks (entities/effects) read, with their own defaults.
+# A few effects also appear above: the hooks have always used different keys or
+# defaults from the scene's aura code, so they get a separate record.
+_ENEMY_TARGETS = ('ground', 'air')
+HOOK_PARAMS = {
+    # on_tick
+    SpecialEffect.SLOW_PULSE_AURA: (('interval', 2.5), ('duration', 1.0), ('slow_percentage', 80),
+                                    ('targets', _ENEMY_TARGETS)),
+    SpecialEffect.DOT_PULSE_AURA: (('pulse_interval', 0.5), ('pulse_duration', 5.0), ('slow_percentage', 0.3),
+                                   ('damage', 18.0), ('damage_type', 'arcane'), ('targets', _ENEMY_TARGETS)),
+    SpecialEffect.VORTEX_DAMAGE_AURA: (('tick_interval', 0.1), ('min_damage_at_edge', 1.0),
+                                       ('max_damage_at_center', 25.0), ('damage_type', 'arcane'),
+                                       ('targets', _ENEMY_TARGETS)),
+    SpecialEffect.BONECHILL_PULSE_AURA: (('interval', 0.5), ('bonechill_duration', 4.0), ('targets', _ENEMY_TARGETS)),
+    SpecialEffect.DAMAGE_PULSE_AURA: (('interval', 7.0), ('pulse_damage', 4000), ('pulse_damage_type', 'chaos'),
+                                      ('targets', _ENEMY_TARGETS)),
+    SpecialEffect.CRIT_DAMAGE_PULSE_AURA: (('interval', 5.0), ('duration', 5.0), ('crit_multiplier_bonus', 0.5)),
+    SpecialEffect.GATTLING_SPIN_UP: (('decay_time_sec', 2.0),),
+    SpecialEffect.ATTACK_SPEED_AURA: (('attack_speed_multiplier', 1.3), ('required_race', 'zork')),
+    SpecialEffect.REWIND_WAYPOINTS: (('waypoints_to_rewind', 3),),
+    SpecialEffect.SPLASH_RADIUS_BUFF_AURA: (('splash_radius_increase', 175),),
+    SpecialEffect.ADJACENCY_ATTACK_SPEED_BUFF: (('attack_speed_bonus_percentage', 20),),
+    SpecialEffect.ADJACENCY_DAMAGE_BUFF: (('damage_bonus_percentage', 15),),
+    SpecialEffect.AIR_DAMAGE_AURA: (('air_damage_multiplier', 1.1),),
+    SpecialEffect.DAMAGE_AURA: (('damage_bonus_percentage', 10),),
+    SpecialEffect.CRIT_AURA: (('crit_chance_bonus', 0.50), ('crit_multiplier_bonus', 0.5)),
+    SpecialEffect.DOT_AMPLIFICATION_AURA: (('dot_damage_multiplier', 2.5), ('targets', _ENEMY_TARGETS)),
+    SpecialEffect.RANDOM_BOMBARDMENT: (('bombardment_radius', 2750), ('strike_aoe_radius', 250),
+                                       ('strike_damage_min', 800), ('strike_damage_max', 900),
+                                       ('strike_damage_type', 'normal')),
+    SpecialEffect.SALVO_ATTACK: (('salvo_interval', 0.1),),
+    # on_attack
+    SpecialEffect.DOUBLE_STRIKE: (('chance_percent', 20),),
+    SpecialEffect.EVERY_NTH_STRIKE: (('n', 5), ('bonus_damage', 50)),
+    # on_hit / on_kill
+    SpecialEffect.SHATTER: (('chance_percent', 0), ('armor_reduction', 9999), ('duration', 1.0)),
+    SpecialEffect.MAX_HP_REDUCTION_ON_HIT: (('reduction_percentage', 0),),
+    SpecialEffect.SLOW: (('slow_percentage', 0), ('duration', 1.0)),
+    SpecialEffect.BASH_CHANCE: (('chance_percent', 0), ('stun_duration', 0.1)),
+    SpecialEffect.ARMOR_REDUCTION_ON_HIT: (('armor_reduction_amount', 1),),
+    SpecialEffect.GOLD_ON_KILL: (('chance_percent', 0), ('gold_amount', 0)),
+}
+
+def _camel(name):
+    return ''.join(part.capitalize() for part in name.split('_'))
+
+# One record type per effect, e.g. SlowPulseAuraParams(slow_percentage, duration)
+PARAM_RECORDS = {
+    effect: namedtuple(_camel(effect.value) + 'Params', [key for key, _ in fields])
+    for effect, fields in EFFECT_PARAMS.items()
+}
+
+# e.g. SlowPulseAuraHookParams(interval, duration, slow_percentage, targets)
+HOOK_PARAM_RECORDS = {
+    effect: namedtuple(_camel(effect.value) + 'HookParams', [key for key, _ in fields])
+    for effect, fields in HOOK_PARAMS.items()
+}
+
+def _fill(record, fields, special_data, tower_damage_type):
+    values = []
+    for key, default in fields:
+        if default is TOWER_DAMAGE_TYPE:
+            default = tower_damage_type
+        values.append(special_data.get(key, default))
+    return record(*values)
+
+def compile_params(effect, special_data, tower_damage_type='normal'):
+    """The effect's parameter record with defaults filled in, or None if the frame loop reads none."""
+    fields = EFFECT_PARAMS.get(effect)
+    if fields is None:
+        return None
+    return _fill(PARAM_RECORDS[effect], fields, special_data, tower_damage_type)
+
+def compile_hook_params(effect, special_data, tower_damage_type='normal'):
+    """The effect hooks' parameter record with defaults filled in, or None if they read none."""
+    fields = HOOK_PARAMS.get(effect)
+    if fields is None:
+        return None
+    return _fill(HOOK_PARAM_RECORDS[effect], fields, special_data, tower_damage_type)
+
+class _Frozen:
+    """Slotted record that can only be filled in by its own __init__."""
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def _set(self, **values):
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+class SpecialSpec(_Frozen):
+    """A tower's compiled `special` block."""
+    __slots__ = ('raw', 'effect', 'effect_name', 'params', 'hook_params', 'targets', 'target_mask',
+                 'targets_enemies', 'targets_towers', 'aura_radius', 'aura_radius_pixels',
+                 'aura_radius_sq', 'interval', 'pulse_interval', 'gold_check_interval',
+                 'is_pulse_aura')
+
+    def __init__(self, special_data, tower_damage_type='normal'):
+        effect_name = special_data.get('effect')
+        effect = SpecialEffect.resolve(effect_name)
+        targets = special_data.get('targets', [])
+        aura_radius = special_data.get('aura_radius', 0) or 0
+        aura_radius_pixels = units_to_pixels(aura_radius)
+        interval = special_data.get('interval')
+        self._set(
+            raw=MappingProxyType(special_data),
+            effect=effect,
+            effect_name=effect_name,
+            params=compile_params(effect, special_data, tower_damage_type),
+            hook_params=compile_hook_params(effect, special_data, tower_damage_type),
+            targets=targets,
+            target_mask=target_mask(targets),
+            # A bare string is one name, not a list of characters
+            targets_enemies=(targets == 'enemies') or (not isinstance(targets, str) and
+                                                        any(t in ('ground', 'air', 'enemies') for t in targets)),
+            targets_towers=(targets == 'towers') or (not isinstance(targets, str) and 'towers' in targets),
+            aura_radius=aura_radius,
+            aura_radius_pixels=aura_radius_pixels,
+            aura_radius_sq=aura_radius_pixels ** 2,
+            interval=interval, # None when the block has no interval
+            pulse_interval=interval if interval is not None else 1.0,
+            gold_check_interval=interval if interval is not None else 10.0,
+            is_pulse_aura=effect is not None and effect.is_pulse_aura,
+        )
+
+    def get(self, key, default=None):
+        """Raw lookup for keys that are not compiled."""
+        return self.raw.get(key, default)
+
+    def __repr__(self):
+        return f"SpecialSpec({self.effect_name!r})"
+
+class TowerSpec(_Frozen):
+    """One tower type from the race data, compiled once and shared by all its towers."""
+    __slots__ = ('tower_id', 'raw', 'name', 'cost', 'description', 'grid_width', 'grid_height',
+                 'attack_type', 'damage_type', 'damage_min', 'damage_max', 'attack_speed',
+                 'attack_interval', 'stats_ground', 'stats_air', 'range', 'range_pixels',
+                 'range_min_pixels', 'min_range_pixels', 'splash_radius', 'splash_radius_pixels',
+                 'bounce', 'bounce_range_pixels', 'bounce_damage_falloff', 'pierce_adjacent',
+                 'critical_chance', 'critical_multiplier', 'targets', 'target_mask',
+                 'target_armor_type', 'target_priority', 'projectile_speed', 'beam_color',
+                 'beam_max_targets', 'broadside_angle_offset', 'attack_sound', 'traversable',
+                 'trigger_on_walkover', 'special', 'effect', 'is_enemy_aura')
+
+    def __init__(self, tower_id, tower_data):
+        damage_type = tower_data.get('damage_type', 'normal')
+        special_data = tower_data.get('special', None)
+        special = SpecialSpec(special_data, damage_type) if special_data else None
+        attack_type = tower_data.get('attack_type', 'projectile')
+        attack_speed = tower_data.get('attack_speed', 1.0)
+        splash_radius = tower_data.get('splash_radius', 0)
+        if splash_radius is None: # Explicit null in the JSON
+            splash_radius = 0
+        json_range = tower_data.get('range', 200) # Default to 1 tile range (200 units)
+        min_range = tower_data.get('min_range')
+        targets = tower_data.get('targets', ["ground"])
+        self._set(
+            tower_id=tower_id,
+            raw=MappingProxyType(tower_data),
+            name=tower_data.get('name', 'Unknown'),
+            cost=tower_data.get('cost', 0),
+            description=tower_data.get('description', ''),
+            grid_width=tower_data.get('grid_width', 1),
+            grid_height=tower_data.get('grid_height', 1),
+            attack_type=attack_type,
+            damage_type=damage_type,
+            damage_min=tower_data.get('damage_min', 0),
+            damage_max=tower_data.get('damage_max', 0),
+            attack_speed=attack_speed,
+            attack_interval=tower_data.get('attack_interval', 1.0 / attack_speed),
+            stats_ground=tower_data.get('stats_ground', None),
+            stats_air=tower_data.get('stats_air', None),
+            range=json_range,
+            range_pixels=units_to_pixels(json_range),
+            range_min_pixels=units_to_pixels(tower_data.get('range_min', 0)),
+            # Legacy "min_range" key, used by calculate_derived_stats
+            min_range_pixels=units_to_pixels(min_range) if min_range is not None else 0,
+            splash_radius=splash_radius,
+            splash_radius_pixels=units_to_pixels(splash_radius),
+            bounce=tower_data.get('bounce', 0),
+            bounce_range_pixels=units_to_pixels(tower_data.get('bounce_range', 300)),
+            bounce_damage_falloff=tower_data.get('bounce_damage_falloff', 0.5),
+            pierce_adjacent=tower_data.get('pierce_adjacent', 0),
+            critical_chance=tower_data.get('critical_chance', 0.0),
+            critical_multiplier=tower_data.get('critical_multiplier', 1.0),
+            targets=targets,
+            target_mask=target_mask(targets),
+            target_armor_type=tower_data.get('target_armor_type', []),
+            target_priority=tower_data.get('target_priority', 'closest'),
+            projectile_speed=tower_data.get('projectile_speed', None),
+            beam_color=tower_data.get('beam_color', None),
+            beam_max_targets=tower_data.get('beam_max_targets', 1),
+            broadside_angle_offset=tower_data.get('broadside_angle_offset', 0),
+            attack_sound=tower_data.get('attack_sound', tower_id),
+            traversable=tower_data.get('traversable', False),
+            trigger_on_walkover=tower_data.get('trigger_on_walkover', False),
+            special=special,
+            effect=special.effect if special else None,
+            is_enemy_aura=_is_enemy_aura(special, attack_type),
+        )
+
+    def __repr__(self):
+        return f"TowerSpec({self.tower_id!r})"
+
+def _is_enemy_aura(special, attack_type):
+    """Whether the scene applies this tower's aura to enemies (continuous or pulsed)."""
+    if special is None or special.aura_radius <= 0:
+        return False
+    # dot_amplification_aura affects towers, not enemies
+    if special.effect == SpecialEffect.DOT_AMPLIFICATION_AURA:
+        return False
+    is_continuous_aura = attack_type in ('aura', 'hybrid')
+    if not (is_continuous_aura or special.is_pulse_aura or special.effect == SpecialEffect.RADIANCE_AURA):
+        return False
+    # Tower-targeting auras are handled by the tower buff auras
+    return special.targets_enemies and not special.targets_towers
+
+# --- Compilation ---
+_spec_cache = {} # (tower_id, id(tower_data)) -> (tower_data, TowerSpec); the data ref keeps the id valid
+
+def get_tower_spec(tower_id, tower_data):
+    """The shared spec for a tower entry, compiled on first use."""
+    key = (tower_id, id(tower_data))
+    cached = _spec_cache.get(key)
+    if cached is not None and cached[0] is tower_data:
+        return cached[1]
+    spec = TowerSpec(tower_id, tower_data)
+    _spec_cache[key] = (tower_data, spec)
+    return spec
+
+def compile_race_specs(game_data):
+    """
+    Compile every tower in loaded race data.
+
+    :param game_data: The loaded tower_races JSON (with a "races" section)
+    :return: Dict of tower_id -> TowerSpec
+    """
+    specs = {}
+    for race_data in game_data.get('races', {}).values():
+        for tower_id, tower_data in race_data.get('towers', {}).items():
+            specs[tower_id] = get_tower_spec(tower_id, tower_data)
+    return specs
+
+def load_tower_specs(file_path):
+    """Load a race data file (tower_races.json or tower_races_wild.json) and compile its towers."""
+    with open(file_path, 'r') as file:
+        return compile_race_specs(json.load(file))